@@ -85,6 +85,8 @@ from autogalaxy import convert
 from . import plot
 from . import aggregator as agg
 from .lens import subhalo
+from .lens.convolution import ConvolverFFT
+from .lens.over_sampling_magnification import OverSamplingMagnification
 from .lens.tracer import Tracer
 from .lens.sensitivity import SubhaloSensitivityResult
 from .lens.to_inversion import TracerToInversion
@@ -107,6 +109,7 @@ from .point.fit.positions.image.pair_repeat import FitPositionsImagePairRepeat
 from .point.fit.positions.source.separations import FitPositionsSource
 from .point.fit.positions.source.max_separation import FitPositionsSourceMaxSeparation
 from .point.model.analysis import AnalysisPoint
+from .point.model.analysis import AnalysisPointList
 from .point.solver import PointSolver
 from .quantity.fit_quantity import FitQuantity
 from .quantity.model.analysis import AnalysisQuantity
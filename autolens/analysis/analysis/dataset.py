@@ -1,6 +1,7 @@
+import copy
 import os
 import logging
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from autoconf import conf
 from autoconf.dictable import to_dict, output_to_json
@@ -13,8 +14,14 @@ from autogalaxy.analysis.analysis.dataset import AnalysisDataset as AgAnalysisDa
 
 from autolens.analysis.analysis.lens import AnalysisLens
 from autolens.analysis.result import ResultDataset
+from autolens.analysis.dependencies import ModelDependencies
+from autolens.analysis.dependencies import reusable_stage_list
 from autolens.analysis.maker import FitMaker
+from autolens.analysis.pool import AnalysisPool
+from autolens.analysis.pool import log_likelihood_from
+from autolens.analysis.image_mesh_cache import ImageMeshCache
 from autolens.analysis.preloads import Preloads
+from autolens.analysis.traced_grid_cache import TracedGridCache
 from autolens.analysis.positions import PositionsLHResample
 from autolens.analysis.positions import PositionsLHPenalty
 
@@ -37,6 +44,7 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
         settings_inversion: aa.SettingsInversion = None,
         raise_inversion_positions_likelihood_exception: bool = True,
         title_prefix: str = None,
+        reuse_previous_fit: bool = False,
     ):
         """
         Fits a lens model to a dataset via a non-linear search.
@@ -68,6 +76,11 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
             be inferred, in which case an Exception is raised before the model-fit begins to inform the user
             of this. This exception is not raised if this input is False, allowing the user to perform the model-fit
             anyway.
+        reuse_previous_fit
+            If `True`, every fit of the model-fit is kept in memory until the next fit, which reuses the stages of the
+            likelihood function (e.g. the blurred image or curvature matrix) whose free parameters are unchanged (see
+            `figure_of_merit_reusing_stages_from`). This holds a whole fit, including the matrices of its inversion,
+            in every process, so it is off by default.
         """
 
         super().__init__(
@@ -84,7 +97,15 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
             cosmology=cosmology,
         )
 
-        self.preloads = self.preloads_cls()
+        self.image_mesh_cache = ImageMeshCache()
+        self.preloads = self.preloads_cls(image_mesh_cache=self.image_mesh_cache)
+
+        self.dependencies = None
+        self.reuse_previous_fit = reuse_previous_fit
+        self.previous_fit = None
+        self.previous_key_dict = None
+        self.traced_grid_cache = TracedGridCache()
+        self.analysis_pool = None
 
         self.raise_inversion_positions_likelihood_exception = (
             raise_inversion_positions_likelihood_exception
@@ -105,6 +126,9 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
 
         - Checks the model and raises exceptions if certain critieria are not met.
 
+        - Loads the image-plane mesh grids output to the search's internal folder by a previous run of the model-fit
+          into the `image_mesh_cache`, which outputs the image-plane mesh grids it computes to the same file.
+
         Once inherited from it also visualizes objects which do not change throughout the model fit like the dataset.
 
         Parameters
@@ -121,6 +145,44 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
 
         self.raise_exceptions(model=model)
 
+        if not isinstance(paths, af.DatabasePaths) and (
+            paths.search_internal_path is not None
+        ):
+            self.image_mesh_cache.load_from(
+                file_path=paths.search_internal_path / "image_mesh_cache.npz"
+            )
+
+    def modify_after_fit(
+        self, paths: af.DirectoryPaths, model: af.Collection, result: ResultDataset
+    ):
+        """
+        This function is called immediately after the non-linear search ends and performs tasks which clean up the
+        analysis before the search's output folders are finalized.
+
+        This function outputs the image-plane mesh grids of the `image_mesh_cache` which have not yet been output to
+        the search's internal folder, and then stops the cache outputting to this folder, which may be removed once
+        the search is complete. The image-plane mesh grids stay cached in memory for fits performed by the result.
+
+        It also closes the `AnalysisPool` used by `log_likelihood_function_batch`, if one was created.
+
+        Parameters
+        ----------
+        paths
+            The PyAutoFit paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        model
+            The PyAutoFit model object, which includes model components representing the galaxies that are fitted to
+            the imaging data.
+        result
+            The result of the model-fit.
+        """
+        self.image_mesh_cache.flush()
+        self.image_mesh_cache.file_path = None
+
+        self.close_analysis_pool()
+
+        return super().modify_after_fit(paths=paths, model=model, result=result)
+
     def raise_exceptions(self, model):
         has_pix = model.has_model(cls=(aa.Pixelization,)) or model.has_instance(
             cls=(aa.Pixelization,)
@@ -147,6 +209,267 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
                     """
                 )
 
+    def set_preloads(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        It is common for the model to have components whose parameters are all fixed, and thus the way that component
+        fits the data does not change. For example, if all parameter associated with the light profiles of galaxies
+        in the model are fixed, the image generated from these galaxies will not change irrespective of the model
+        parameters chosen by the non-linear search.
+
+        Preloading exploits this to speed up the log likelihood function, by storing in memory quantities that do not
+        change. The model is inspected to determine which free parameters every stage of the likelihood function
+        depends on (see `ModelDependencies`), and every stage which depends on no free parameters is preloaded from
+        a single fit.
+
+        The dependencies are also stored, so that `figure_of_merit_reusing_stages_from` can reuse the stages of the
+        previous fit whose free parameters are unchanged in the next fit.
+
+        Parameters
+        ----------
+        paths
+            The PyAutoFit paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        model
+            The PyAutoFit model object, which includes model components representing the galaxies that are fitted to
+            the imaging data.
+        """
+
+        logger.info(
+            "PRELOADS - Setting up preloads, may take a few minutes for fits using an inversion."
+        )
+
+        self.preloads = self.preloads_cls(image_mesh_cache=self.image_mesh_cache)
+
+        self.dependencies = None
+        self.previous_fit = None
+        self.previous_key_dict = None
+        self.traced_grid_cache = TracedGridCache(
+            max_bytes=self.traced_grid_cache.max_bytes
+        )
+
+        settings_inversion_original = copy.copy(self.settings_inversion)
+
+        self.settings_inversion.image_mesh_min_mesh_pixels_per_pixel = None
+        self.settings_inversion.image_mesh_adapt_background_percent_threshold = None
+
+        fit_maker = self.fit_maker_cls(model=model, fit_from=self.fit_from)
+
+        fit = fit_maker.fit_via_model_from(unit_value=0.45)
+
+        if fit is None:
+            self.preloads = self.preloads_cls(failed=True)
+
+        else:
+            dependencies = ModelDependencies(model=model)
+
+            self.preloads = self.preloads_cls.setup_all_via_dependencies(
+                fit=fit, dependencies=dependencies
+            )
+
+            if conf.instance["general"]["test"]["check_preloads"]:
+                self.preloads.check_via_fit(fit=fit)
+
+            self.dependencies = dependencies
+
+        self.preloads.image_mesh_cache = self.image_mesh_cache
+
+        self.settings_inversion = settings_inversion_original
+
+        if isinstance(paths, af.DatabasePaths):
+            return
+
+        os.makedirs(paths.profile_path, exist_ok=True)
+        self.preloads.output_info_to_summary(file_path=paths.profile_path)
+
+    def preloads_via_key_dict_from(self, key_dict: Optional[dict]) -> Preloads:
+        """
+        Returns the preloads used to fit a model instance, which are the preloads of the analysis with the stages of
+        the previous fit whose free parameters are unchanged added, if the previous fit is kept (see
+        `reuse_previous_fit`).
+
+        If the traced grids of the inversion are not preloaded for the whole model-fit, the traced grids of a
+        recent fit with the same mass parameters are also added from the `traced_grid_cache`.
+
+        The mappers of the previous fit are also added, so that mappers whose mask, mesh, grids and adapt image are
+        unchanged (e.g. because only regularization parameters changed) are reused (see `ReusableMapper`).
+
+        Parameters
+        ----------
+        key_dict
+            The keys of every stage of the likelihood function of the model instance, computed via
+            `ModelDependencies.key_dict_from`.
+        """
+        if key_dict is None:
+            return self.preloads
+
+        stage_list = []
+        traced_grid_list = None
+        reusable_mapper_list = None
+
+        if self.previous_fit is not None:
+            stage_list = [
+                stage
+                for stage in reusable_stage_list
+                if key_dict.get(stage) is not None
+                and key_dict[stage] == self.previous_key_dict.get(stage)
+            ]
+
+            if self.previous_fit.tracer_to_inversion.has_mapper:
+                reusable_mapper_list = (
+                    self.previous_fit.tracer_to_inversion.reusable_mapper_list
+                )
+
+        if len(self.traced_grid_cache) > 0:
+            traced_grid_list = self.traced_grid_cache.traced_grid_list_from(
+                key=key_dict.get("traced_grids_of_planes_for_inversion")
+            )
+
+        if (
+            len(stage_list) == 0
+            and traced_grid_list is None
+            and not reusable_mapper_list
+        ):
+            return self.preloads
+
+        preloads = copy.copy(self.preloads)
+        preloads.set_stages_via_fit(fit=self.previous_fit, stage_list=stage_list)
+
+        if traced_grid_list is not None:
+            preloads.traced_grids_of_planes_for_inversion = traced_grid_list
+
+        preloads.reusable_mapper_list = reusable_mapper_list
+
+        return preloads
+
+    def figure_of_merit_reusing_stages_from(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the figure of merit of the fit of a model instance, reusing every stage of the likelihood function
+        (e.g. the blurred image or curvature matrix) of the previous fit whose free parameters are unchanged.
+
+        Non-linear searches often propose a model instance which only changes a subset of the parameters of the
+        previous one (for example a slice sampler moving along one parameter). The keys of each stage, which are the
+        values of the free parameters they depend on, are compared to those of the previous fit and the stages whose
+        keys are equal are preloaded from it.
+
+        The previous fit is only kept if `reuse_previous_fit` is `True`, because it holds every array of the fit
+        (including the matrices of an inversion) in memory. Otherwise, only the traced grids of the inversion are
+        reused, via the `traced_grid_cache`.
+
+        The fit is only stored for reuse once its figure of merit is computed, so that a fit which raises an
+        exception is never reused. If the preloads have not been set up via `set_preloads` the fit is performed
+        without reusing any stages.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        if self.dependencies is None:
+            return self.fit_from(instance=instance).figure_of_merit
+
+        key_dict = self.dependencies.key_dict_from(instance=instance)
+
+        fit = self.fit_from(
+            instance=instance,
+            preload_overwrite=self.preloads_via_key_dict_from(key_dict=key_dict),
+        )
+
+        figure_of_merit = fit.figure_of_merit
+
+        if self.reuse_previous_fit:
+            self.previous_fit = fit
+            self.previous_key_dict = key_dict
+
+        if (
+            fit.inversion is not None
+            and fit.tracer_to_inversion.has_mapper
+            and fit.preloads.traced_grids_of_planes_for_inversion is None
+        ):
+            self.traced_grid_cache.add(
+                key=key_dict.get("traced_grids_of_planes_for_inversion"),
+                traced_grid_list=fit.tracer_to_inversion.traced_grid_2d_list_of_inversion,
+            )
+
+        return figure_of_merit
+
+    def log_likelihood_function_batch(
+        self, instances: List[af.ModelInstance], number_of_cores: int = 1
+    ) -> List[float]:
+        """
+        Returns the log likelihood of every model instance in a batch, in the order of the input instances.
+
+        If `number_of_cores` is above 1 the instances are fitted by an `AnalysisPool`, whose worker processes use the
+        arrays of this analysis (e.g. the dataset and w-tilde preloads) via shared memory instead of each unpickling
+        their own copy. The pool is created the first time it is used and reused by every later batch, so its workers
+        are started and the analysis is copied to shared memory once. The first instance of that batch is fitted
+        before the pool is created, so that the quantities the analysis caches on its first fit (e.g. the dataset's
+        over sampled grids and convolver) are computed once and shared with the workers.
+
+        The workers use the analysis as it was when the pool was created, so the pool must be closed via
+        `close_analysis_pool` if the analysis is changed (e.g. its preloads are set up again). The pool is closed by
+        `modify_after_fit` at the end of a model-fit, and is recreated if a batch uses a different `number_of_cores`.
+
+        Instances whose fit raises a `FitException` have a log likelihood of `-np.inf`.
+
+        Parameters
+        ----------
+        instances
+            The instances of the model that are fitted to the data by this analysis.
+        number_of_cores
+            The number of worker processes which fit the instances.
+        """
+        if number_of_cores == 1 or len(instances) <= 1:
+            return [
+                log_likelihood_from(analysis=self, instance=instance)
+                for instance in instances
+            ]
+
+        if (
+            self.analysis_pool is not None
+            and self.analysis_pool.number_of_cores == number_of_cores
+        ):
+            return self.analysis_pool.log_likelihood_list_from(instance_list=instances)
+
+        self.close_analysis_pool()
+
+        log_likelihood_list = [
+            log_likelihood_from(analysis=self, instance=instances[0])
+        ]
+
+        self.analysis_pool = AnalysisPool(
+            analysis=self, number_of_cores=number_of_cores
+        )
+
+        return log_likelihood_list + self.analysis_pool.log_likelihood_list_from(
+            instance_list=instances[1:]
+        )
+
+    def close_analysis_pool(self):
+        """
+        Stop the worker processes of the `AnalysisPool` used by `log_likelihood_function_batch` and free the shared
+        memory of the analysis, if a pool was created.
+        """
+        if self.analysis_pool is not None:
+            self.analysis_pool.close()
+            self.analysis_pool = None
+
+    def __getstate__(self):
+        """
+        The state of the analysis which is pickled, for example when it is shared with the workers of an
+        `AnalysisPool`.
+
+        The `AnalysisPool` of the analysis cannot be pickled and the previous fit (and its keys) only speed up the
+        next fit in the same process, so they are omitted, which keeps the analysis shared with workers small.
+        """
+        state = self.__dict__.copy()
+
+        state["analysis_pool"] = None
+        state["previous_fit"] = None
+        state["previous_key_dict"] = None
+
+        return state
+
     @property
     def preloads_cls(self):
         return Preloads
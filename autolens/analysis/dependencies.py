@@ -0,0 +1,223 @@
+from typing import Dict, List, Optional, Tuple
+
+import autofit as af
+import autoarray as aa
+import autogalaxy as ag
+
+# The groups of model components whose free parameters each stage of the likelihood function depends on. Free
+# parameters of model components in no group (e.g. a galaxy's redshift or the `DatasetModel`) are in the `other`
+# group, which every stage depends on except `w_tilde`, because w-tilde only depends on the noise-map and PSF of the
+# dataset, which no model component changes.
+stage_dependencies_dict = {
+    "w_tilde": (),
+    "blurred_image": ("mass", "light", "other"),
+    "traced_grids_of_planes_for_inversion": ("mass", "other"),
+    "image_plane_mesh_grid_pg_list": ("pixelization", "other"),
+    "relocated_grid": ("mass", "other"),
+    "mapper_list": ("mass", "pixelization", "other"),
+    "operated_mapping_matrix": ("mass", "linear_light", "pixelization", "other"),
+    "linear_func_operated_mapping_matrix_dict": ("mass", "linear_light", "other"),
+    "curvature_matrix": ("mass", "linear_light", "pixelization", "other"),
+    "curvature_matrix_mapper_diag": ("mass", "light", "pixelization", "other"),
+    "regularization_matrix": ("mass", "pixelization", "regularization", "other"),
+}
+
+# The stages which are reused between consecutive fits, because their values are taken directly from quantities the
+# previous fit has already computed.
+reusable_stage_list = [
+    "blurred_image",
+    "relocated_grid",
+    "operated_mapping_matrix",
+    "linear_func_operated_mapping_matrix_dict",
+    "curvature_matrix",
+    "curvature_matrix_mapper_diag",
+    "regularization_matrix",
+]
+
+
+def group_list_from(cls: type) -> List[str]:
+    """
+    Returns the groups a model component belongs to, based on its class.
+
+    A component can belong to more than one group, for example a light and mass profile (`lmp`) belongs to both
+    the `light` and `mass` groups.
+
+    Parameters
+    ----------
+    cls
+        The class of the model component.
+    """
+    group_list = []
+
+    if issubclass(cls, ag.mp.MassProfile):
+        group_list.append("mass")
+
+    if issubclass(cls, ag.lp_linear.LightProfileLinear):
+        group_list.append("linear_light")
+    elif issubclass(cls, ag.LightProfile):
+        group_list.append("light")
+
+    if issubclass(cls, (aa.Pixelization, aa.AbstractMesh, aa.AbstractImageMesh)):
+        group_list.append("pixelization")
+
+    if issubclass(cls, aa.AbstractRegularization):
+        group_list.append("regularization")
+
+    return group_list or ["other"]
+
+
+def value_via_path_from(instance, path: Tuple[str, ...]):
+    """
+    Returns the value of a free parameter of a model instance, given the path of the parameter's prior in the model.
+
+    The elements of tuple parameters (e.g. a `centre`) have paths ending with the name of the tuple and the index
+    of the element (e.g. `("centre", "centre_0")`).
+
+    Parameters
+    ----------
+    instance
+        An instance of the model.
+    path
+        The path of the parameter's prior in the model.
+    """
+    value = instance
+
+    for name in path:
+        if isinstance(value, (list, tuple)):
+            value = value[int(name.split("_")[-1])]
+        else:
+            value = getattr(value, name)
+
+    return value
+
+
+class ModelDependencies:
+    def __init__(self, model: af.AbstractPriorModel):
+        """
+        Determines which stages of the likelihood function depend on which free parameters of a model.
+
+        The model is inspected once, before the model-fit, to find which free parameters feed mass profiles,
+        light profiles, linear light profiles, pixelizations and regularizations. A stage of the likelihood function
+        (e.g. the PSF blurred image of all light profiles) only changes when the parameters of the groups it
+        depends on (see `stage_dependencies_dict`) change.
+
+        This is used to decide which stages can be preloaded for the whole model-fit, because they depend on no
+        free parameters, and which stages of a fit can be reused by the next fit, because the parameters they
+        depend on are the same for both fits (e.g. when a non-linear search proposes a new regularization
+        coefficient but keeps every other parameter fixed).
+
+        Parameters
+        ----------
+        model
+            The model which is fitted, whose free parameters are inspected.
+        """
+        self.path_list = []
+        self.group_list_of_paths = []
+
+        for path_tuple in model.all_paths:
+            group_list = []
+
+            for path in path_tuple:
+                for group in self.group_list_via_path_from(model=model, path=path):
+                    if group not in group_list:
+                        group_list.append(group)
+
+            self.path_list.append(path_tuple[0])
+            self.group_list_of_paths.append(group_list)
+
+        self.path_index_dict = {
+            stage: self.path_index_list_from(stage=stage)
+            for stage in stage_dependencies_dict
+        }
+
+    @staticmethod
+    def group_list_via_path_from(model: af.AbstractPriorModel, path) -> List[str]:
+        """
+        Returns the groups of the model component a free parameter belongs to, which is the closest model component
+        along the parameter's path whose class is known.
+
+        Parameters
+        ----------
+        model
+            The model which is fitted.
+        path
+            The path of the parameter's prior in the model.
+        """
+        for index in reversed(range(len(path))):
+            cls = getattr(model.object_for_path(path[:index]), "cls", None)
+
+            if isinstance(cls, type):
+                return group_list_from(cls=cls)
+
+        return ["other"]
+
+    def path_index_list_from(self, stage: str) -> List[int]:
+        """
+        Returns the indexes (in `path_list`) of the free parameters a stage of the likelihood function depends on.
+
+        Parameters
+        ----------
+        stage
+            The name of the stage, which is a key of `stage_dependencies_dict`.
+        """
+        dependencies = stage_dependencies_dict[stage]
+
+        return [
+            index
+            for index, group_list in enumerate(self.group_list_of_paths)
+            if any(group in dependencies for group in group_list)
+        ]
+
+    def is_constant(self, stage: str) -> bool:
+        """
+        Returns whether a stage of the likelihood function depends on no free parameters of the model, such that
+        it is the same for every fit of the model-fit.
+
+        Parameters
+        ----------
+        stage
+            The name of the stage, which is a key of `stage_dependencies_dict`.
+        """
+        return len(self.path_index_dict[stage]) == 0
+
+    @property
+    def constant_stage_list(self) -> List[str]:
+        """
+        The stages of the likelihood function which depend on no free parameters of the model.
+        """
+        return [stage for stage in stage_dependencies_dict if self.is_constant(stage)]
+
+    def key_dict_from(self, instance) -> Dict[str, Optional[Tuple]]:
+        """
+        Returns a dictionary mapping every stage of the likelihood function which is not constant to a key, which
+        is the tuple of values of the free parameters of the instance the stage depends on.
+
+        Two fits whose keys for a stage are equal therefore compute the same values for that stage. If a value
+        cannot be found in the instance the key is `None`, meaning the stage is never reused.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model.
+        """
+        try:
+            value_list = [
+                value_via_path_from(instance=instance, path=path)
+                for path in self.path_list
+            ]
+        except (AttributeError, IndexError, ValueError):
+            value_list = None
+
+        key_dict = {}
+
+        for stage, index_list in self.path_index_dict.items():
+            if len(index_list) == 0:
+                continue
+
+            key_dict[stage] = (
+                None
+                if value_list is None
+                else tuple(value_list[index] for index in index_list)
+            )
+
+        return key_dict
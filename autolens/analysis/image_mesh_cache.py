@@ -0,0 +1,342 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+import autoarray as aa
+
+from autoarray.inversion.pixelization.image_mesh.abstract import AbstractImageMesh
+
+logger = logging.getLogger(__name__)
+
+
+class CachedImageMesh:
+    def __init__(
+        self, image_mesh: AbstractImageMesh, image_mesh_cache: "ImageMeshCache"
+    ):
+        """
+        Wraps an image mesh so that its image-plane mesh grid is taken from an `ImageMeshCache`, which only computes
+        it via the image mesh if it has not been computed before from the same inputs.
+
+        Every other attribute (e.g. `uses_adapt_images`) is that of the wrapped image mesh.
+
+        Parameters
+        ----------
+        image_mesh
+            The image mesh which computes the image-plane mesh grid.
+        image_mesh_cache
+            The cache the image-plane mesh grid is taken from.
+        """
+        self.image_mesh = image_mesh
+        self.image_mesh_cache = image_mesh_cache
+
+    def __getattr__(self, item):
+        return getattr(self.__dict__["image_mesh"], item)
+
+    def image_plane_mesh_grid_from(
+        self,
+        mask: aa.Mask2D,
+        adapt_data: Optional[np.ndarray] = None,
+        settings: Optional[aa.SettingsInversion] = None,
+    ) -> aa.Grid2DIrregular:
+        return self.image_mesh_cache.image_plane_mesh_grid_from(
+            image_mesh=self.image_mesh,
+            mask=mask,
+            adapt_data=adapt_data,
+            settings=settings,
+        )
+
+
+class ImageMeshCache:
+    def __init__(self, max_entries: int = 64, output_interval: int = 10):
+        """
+        A least-recently-used cache of the image-plane mesh grids of pixelizations with an image mesh (e.g. `KMeans`,
+        `Hilbert`, `Overlay`), keyed on a hash of the inputs the image-plane mesh grid is computed from.
+
+        An image-plane mesh grid only depends on the image mesh's parameters (e.g. the `pixels` and `weight_floor`
+        of a `KMeans`), the mask of the dataset, the adapt image and the image mesh settings of the inversion. A model
+        which varies the image mesh's parameters cannot preload its image-plane mesh grid for the whole model-fit,
+        when the non-linear search proposes image mesh parameters it has proposed before (e.g. because only other
+        parameters of the model changed) the image-plane mesh grid is taken from the cache instead of running the
+        image mesh algorithm again.
+
+        If a `file_path` is set via `load_from`, the cache is output to this file every time `output_interval`
+        image-plane mesh grids have been added to it (and when `flush` is called), so that a resumed model-fit loads
+        the image-plane mesh grids computed before it was stopped. Outputting in batches means a model-fit whose image
+        mesh parameters vary continuously, so that almost every likelihood evaluation adds a grid, does not rewrite
+        every stored grid every evaluation. If the file cannot be written (e.g. because the search's internal folder
+        was removed after the search finished), a warning is logged and the cache stops outputting to file.
+
+        When adding an image-plane mesh grid makes the number stored exceed `max_entries`, the least recently used
+        image-plane mesh grids are removed.
+
+        Parameters
+        ----------
+        max_entries
+            The maximum number of image-plane mesh grids stored in the cache.
+        output_interval
+            The number of image-plane mesh grids added to the cache between every output of the cache to its file.
+        """
+        self.max_entries = max_entries
+        self.output_interval = output_interval
+
+        self.image_plane_mesh_grid_dict = OrderedDict()
+
+        self.file_path = None
+        self.total_unsaved = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.image_plane_mesh_grid_dict)
+
+    @staticmethod
+    def key_from(
+        image_mesh: AbstractImageMesh,
+        mask: aa.Mask2D,
+        adapt_data: Optional[np.ndarray],
+        settings: Optional[aa.SettingsInversion],
+    ) -> Optional[str]:
+        """
+        Returns the key of the image-plane mesh grid computed from an image mesh, mask, adapt image and inversion
+        settings, which is a hash of their values, or `None` if the image mesh has parameters which cannot be hashed.
+
+        Only the settings of the inversion which are used by image meshes (e.g. `image_mesh_min_mesh_number`) are
+        included in the key.
+
+        Parameters
+        ----------
+        image_mesh
+            The image mesh which computes the image-plane mesh grid.
+        mask
+            The mask of the dataset the image-plane mesh grid is computed for.
+        adapt_data
+            The adapt image the image mesh adapts to, which is `None` for image meshes which do not use one.
+        settings
+            The settings of the inversion, which are used by certain image meshes to check the image-plane mesh grid.
+        """
+        value_list = [("image_mesh", type(image_mesh).__qualname__)]
+
+        value_list += sorted(vars(image_mesh).items())
+
+        value_list += [
+            ("mask", mask),
+            ("pixel_scales", mask.pixel_scales),
+            ("origin", mask.origin),
+            ("adapt_data", adapt_data),
+        ]
+
+        if settings is not None:
+            value_list += sorted(
+                (name, value)
+                for name, value in vars(settings).items()
+                if name.startswith("image_mesh")
+            )
+
+        sha1 = hashlib.sha1()
+
+        for name, value in value_list:
+            sha1.update(name.encode())
+
+            if value is None:
+                sha1.update(b"None")
+                continue
+
+            if isinstance(value, str):
+                sha1.update(value.encode())
+                continue
+
+            value = np.asarray(value)
+
+            if value.dtype.kind not in "biuf":
+                return None
+
+            sha1.update(str((value.dtype.str, value.shape)).encode())
+            sha1.update(np.ascontiguousarray(value).tobytes())
+
+        return sha1.hexdigest()
+
+    def image_plane_mesh_grid_from(
+        self,
+        image_mesh: AbstractImageMesh,
+        mask: aa.Mask2D,
+        adapt_data: Optional[np.ndarray],
+        settings: Optional[aa.SettingsInversion],
+    ) -> aa.Grid2DIrregular:
+        """
+        Returns the image-plane mesh grid computed from an image mesh, mask, adapt image and inversion settings, which
+        is taken from the cache if it has been computed before and otherwise is computed and added to the cache.
+
+        Image-plane mesh grids whose computation raises an exception (e.g. because the image mesh has too few pixels
+        in the brightest regions of the adapt image) are not added to the cache, so the exception is raised every
+        time they are requested.
+
+        Parameters
+        ----------
+        image_mesh
+            The image mesh which computes the image-plane mesh grid.
+        mask
+            The mask of the dataset the image-plane mesh grid is computed for.
+        adapt_data
+            The adapt image the image mesh adapts to, which is `None` for image meshes which do not use one.
+        settings
+            The settings of the inversion, which are used by certain image meshes to check the image-plane mesh grid.
+        """
+        key = self.key_from(
+            image_mesh=image_mesh, mask=mask, adapt_data=adapt_data, settings=settings
+        )
+
+        if key is not None:
+            try:
+                image_plane_mesh_grid = self.image_plane_mesh_grid_dict[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.image_plane_mesh_grid_dict.move_to_end(key)
+                self.hits += 1
+                return image_plane_mesh_grid
+
+        image_plane_mesh_grid = image_mesh.image_plane_mesh_grid_from(
+            mask=mask, adapt_data=adapt_data, settings=settings
+        )
+
+        if key is not None:
+            self.add(key=key, image_plane_mesh_grid=image_plane_mesh_grid)
+
+        return image_plane_mesh_grid
+
+    @contextmanager
+    def image_meshes_cached_in(self, galaxies):
+        """
+        Within this context, the image mesh of every pixelization of the galaxies is wrapped by a `CachedImageMesh`,
+        so that the image-plane mesh grids computed by autogalaxy (e.g. via `GalaxiesToInversion`) are taken from the
+        cache. The image meshes are restored when the context exits.
+
+        Parameters
+        ----------
+        galaxies
+            The galaxies whose pixelizations' image meshes use the cache.
+        """
+        pixelization_list = [
+            galaxy.cls_list_from(cls=aa.Pixelization)[0]
+            for galaxy in galaxies.galaxies_with_cls_list_from(cls=aa.Pixelization)
+        ]
+
+        pixelization_list = [
+            pixelization
+            for pixelization in pixelization_list
+            if pixelization.image_mesh is not None
+        ]
+
+        for pixelization in pixelization_list:
+            pixelization.image_mesh = CachedImageMesh(
+                image_mesh=pixelization.image_mesh, image_mesh_cache=self
+            )
+
+        try:
+            yield
+        finally:
+            for pixelization in pixelization_list:
+                pixelization.image_mesh = pixelization.image_mesh.image_mesh
+
+    def add(self, key: str, image_plane_mesh_grid: aa.Grid2DIrregular):
+        """
+        Add an image-plane mesh grid to the cache, removing the least recently used image-plane mesh grids if the
+        number stored then exceeds `max_entries`, and output the cache to its `file_path` if one is set and
+        `output_interval` image-plane mesh grids have been added since it was last output.
+
+        Parameters
+        ----------
+        key
+            The hash of the inputs the image-plane mesh grid is computed from (see `key_from`).
+        image_plane_mesh_grid
+            The image-plane mesh grid which is added.
+        """
+        self.image_plane_mesh_grid_dict[key] = image_plane_mesh_grid
+
+        while len(self.image_plane_mesh_grid_dict) > self.max_entries:
+            self.image_plane_mesh_grid_dict.popitem(last=False)
+
+        self.total_unsaved += 1
+
+        if self.total_unsaved >= self.output_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Output the cache to its `file_path`, if one is set and image-plane mesh grids have been added since the cache
+        was last output.
+
+        If the file cannot be written, a warning is logged and the `file_path` is cleared, so that the image-plane mesh
+        grids remain cached in memory but the cache is no longer output.
+        """
+        if self.file_path is None or self.total_unsaved == 0:
+            return
+
+        try:
+            self.output_to_file(file_path=self.file_path)
+        except OSError as e:
+            logger.warning(
+                f"Could not output the image mesh cache to {self.file_path} ({e}), it will no longer be output."
+            )
+            self.file_path = None
+
+        self.total_unsaved = 0
+
+    def output_to_file(self, file_path: Union[str, Path]):
+        """
+        Output the image-plane mesh grids of the cache and their keys to a `.npz` file.
+
+        The file is written to a temporary file which then replaces it, so that a model-fit which is stopped while
+        the cache is output, or whose processes output their caches at the same time, does not leave an incomplete
+        file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the `.npz` file the cache is output to.
+        """
+        file_path = Path(file_path)
+        temporary_file_path = file_path.with_name(
+            f"{file_path.name}.{os.getpid()}.tmp"
+        )
+
+        array_dict = {
+            key: np.asarray(image_plane_mesh_grid)
+            for key, image_plane_mesh_grid in self.image_plane_mesh_grid_dict.items()
+        }
+
+        with open(temporary_file_path, "wb") as f:
+            np.savez(f, **array_dict)
+
+        os.replace(temporary_file_path, file_path)
+
+    def load_from(self, file_path: Union[str, Path]):
+        """
+        Set the file the cache is output to as image-plane mesh grids are added, and add the image-plane mesh
+        grids previously output to this file (e.g. by a model-fit which is being resumed) to the cache.
+
+        Parameters
+        ----------
+        file_path
+            The path of the `.npz` file the cache is loaded from and output to.
+        """
+        self.file_path = Path(file_path)
+
+        if not self.file_path.exists():
+            return
+
+        with np.load(self.file_path) as image_plane_mesh_grid_npz:
+            for key in image_plane_mesh_grid_npz.files:
+                self.image_plane_mesh_grid_dict[key] = aa.Grid2DIrregular(
+                    values=image_plane_mesh_grid_npz[key]
+                )
+
+        while len(self.image_plane_mesh_grid_dict) > self.max_entries:
+            self.image_plane_mesh_grid_dict.popitem(last=False)
@@ -0,0 +1,218 @@
+import multiprocessing
+import pickle
+import weakref
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import autofit as af
+
+from autolens import exc
+
+# The analysis and shared memory a worker of an `AnalysisPool` attaches to, which are set by its initializer.
+_worker_analysis = None
+_worker_shared_memory = None
+
+
+class SharedObject:
+    def __init__(self, obj, alignment: int = 64):
+        """
+        Pickles an object such that all of its contiguous numpy arrays are stored in a single block of shared memory,
+        instead of in the pickled bytes.
+
+        Pickle protocol 5 passes the buffers of numpy arrays out-of-band. These buffers are copied once into shared
+        memory, and every process which unpickles the object via `object_from` uses arrays which are views of the same
+        shared memory, instead of each process having its own copy of the arrays. These arrays are read-only, so that
+        one process cannot change the arrays of every other process by writing to them in-place.
+
+        For an analysis this shares every array of the dataset (data, noise-map, PSF, mask, grids), the convolver and
+        the preloads (e.g. the w-tilde matrices) between all worker processes.
+
+        The shared memory is freed by calling `close`, which must only be done once no process uses the object.
+
+        Parameters
+        ----------
+        obj
+            The object which is shared.
+        alignment
+            Every array is stored at an offset in the shared memory which is a multiple of this number of bytes.
+        """
+        buffer_list = []
+
+        self.data = pickle.dumps(obj, protocol=5, buffer_callback=buffer_list.append)
+
+        raw_list = [buffer.raw() for buffer in buffer_list]
+
+        self.offset_list = []
+        self.nbytes_list = []
+
+        offset = 0
+
+        for raw in raw_list:
+            self.offset_list.append(offset)
+            self.nbytes_list.append(raw.nbytes)
+
+            offset += -(-raw.nbytes // alignment) * alignment
+
+        self.shared_memory = shared_memory.SharedMemory(
+            create=True, size=max(offset, 1)
+        )
+
+        for raw, offset, nbytes in zip(raw_list, self.offset_list, self.nbytes_list):
+            self.shared_memory.buf[offset : offset + nbytes] = raw
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes of array data stored in shared memory.
+        """
+        return sum(self.nbytes_list)
+
+    @property
+    def handle(self) -> Tuple[bytes, str, List[int], List[int]]:
+        """
+        The small picklable description of the shared object, which a process uses to attach to it via `object_from`.
+        """
+        return self.data, self.shared_memory.name, self.offset_list, self.nbytes_list
+
+    def close(self):
+        """
+        Free the shared memory of the object.
+        """
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+
+def object_from(handle: Tuple[bytes, str, List[int], List[int]]):
+    """
+    Returns the object described by the handle of a `SharedObject`, whose numpy arrays are read-only views of the
+    shared memory.
+
+    The returned shared memory must be kept alive for as long as the object is used.
+
+    Parameters
+    ----------
+    handle
+        The `handle` of a `SharedObject`.
+    """
+    data, name, offset_list, nbytes_list = handle
+
+    memory = shared_memory.SharedMemory(name=name)
+
+    obj = pickle.loads(
+        data,
+        buffers=[
+            memory.buf[offset : offset + nbytes].toreadonly()
+            for offset, nbytes in zip(offset_list, nbytes_list)
+        ],
+    )
+
+    return obj, memory
+
+
+def log_likelihood_from(analysis: af.Analysis, instance) -> float:
+    """
+    Returns the log likelihood of a model instance, where instances whose fit raises a `FitException` have a log
+    likelihood of `-np.inf`, which is the value a non-linear search uses to resample them.
+
+    Parameters
+    ----------
+    analysis
+        The analysis whose `log_likelihood_function` fits the instance.
+    instance
+        An instance of the model.
+    """
+    try:
+        return analysis.log_likelihood_function(instance=instance)
+    except exc.FitException:
+        return -np.inf
+
+
+def _initializer(handle):
+    global _worker_analysis
+    global _worker_shared_memory
+
+    _worker_analysis, _worker_shared_memory = object_from(handle=handle)
+
+
+def _log_likelihood_from(instance) -> float:
+    return log_likelihood_from(analysis=_worker_analysis, instance=instance)
+
+
+def _close(pool, shared_analysis: SharedObject):
+    pool.terminate()
+    pool.join()
+    shared_analysis.close()
+
+
+class AnalysisPool:
+    def __init__(self, analysis: af.Analysis, number_of_cores: int):
+        """
+        A pool of worker processes which evaluate the log likelihood function of an analysis for many model instances
+        in parallel.
+
+        The analysis is shared with the workers via a `SharedObject`, so every worker uses the same copy of the
+        analysis's arrays (e.g. the dataset and the w-tilde preloads) in shared memory, instead of unpickling its own
+        copy. Only the model instances and log likelihoods are sent between processes.
+
+        Quantities an analysis caches on its first fit (e.g. the over sampled grids and convolver of the dataset) are
+        only shared if they have been computed before the pool is created, so the analysis should fit an instance
+        first. Otherwise every worker computes and stores its own copy.
+
+        The workers are stopped and the shared memory is freed by `close`, or when the pool is garbage collected or
+        the interpreter exits if `close` is never called (e.g. because the non-linear search raised an exception).
+
+        Starting the workers has an overhead, so a pool should be reused for many batches of instances, for example:
+
+        with AnalysisPool(analysis=analysis, number_of_cores=4) as pool:
+            log_likelihood_list = pool.log_likelihood_list_from(instance_list=instance_list)
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function is evaluated, which should have its preloads set up before
+            the pool is created.
+        number_of_cores
+            The number of worker processes.
+        """
+        self.number_of_cores = number_of_cores
+
+        self.shared_analysis = SharedObject(obj=analysis)
+
+        self.pool = multiprocessing.get_context().Pool(
+            processes=number_of_cores,
+            initializer=_initializer,
+            initargs=(self.shared_analysis.handle,),
+        )
+
+        self._finalizer = weakref.finalize(
+            self, _close, self.pool, self.shared_analysis
+        )
+
+    def log_likelihood_list_from(
+        self, instance_list: List, chunksize: Optional[int] = None
+    ) -> List[float]:
+        """
+        Returns the log likelihood of every model instance, in the order of the input instances.
+
+        Parameters
+        ----------
+        instance_list
+            The instances of the model which are fitted.
+        chunksize
+            The number of instances sent to a worker at once, which if `None` is chosen by `multiprocessing`.
+        """
+        return self.pool.map(_log_likelihood_from, instance_list, chunksize=chunksize)
+
+    def close(self):
+        """
+        Stop the workers and free the shared memory of the analysis.
+        """
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
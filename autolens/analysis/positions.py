@@ -12,6 +12,7 @@ import autogalaxy as ag
 
 from autogalaxy.analysis.analysis.dataset import AnalysisDataset
 
+from autolens.interferometer import chunked_fit_util
 from autolens.lens.tracer import Tracer
 from autolens.point.fit.positions.source.max_separation import (
     FitPositionsSourceMaxSeparation,
@@ -193,7 +194,9 @@ class PositionsLHPenalty(AbstractPositionsLH):
         self.log_likelihood_penalty_factor = log_likelihood_penalty_factor
 
     def log_likelihood_penalty_base_from(
-        self, dataset: Union[aa.Imaging, aa.Interferometer]
+        self,
+        dataset: Union[aa.Imaging, aa.Interferometer],
+        chunk_size: Optional[int] = None,
     ) -> float:
         """
         The fast log likelihood penalty scheme returns an alternative penalty log likelihood for any model where the
@@ -213,7 +216,26 @@ class PositionsLHPenalty(AbstractPositionsLH):
         ----------
         dataset
             The imaging or interferometer dataset from which the penalty base is computed.
+        chunk_size
+            If input and the dataset is an interferometer dataset, the chi-squared and noise normalization are computed
+            one chunk of this many visibilities at a time, so that the complex residual-map and chi-squared-map of
+            all visibilities are not stored in memory.
         """
+        if chunk_size is not None and not isinstance(dataset, aa.Imaging):
+            chi_squared = chunked_fit_util.chi_squared_complex_chunked_from(
+                data=dataset.data,
+                noise_map=dataset.noise_map,
+                model_data_list=[],
+                chunk_size=chunk_size,
+            )
+
+            noise_normalization = (
+                chunked_fit_util.noise_normalization_complex_chunked_from(
+                    noise_map=dataset.noise_map, chunk_size=chunk_size
+                )
+            )
+
+            return -0.5 * (chi_squared + noise_normalization)
 
         residual_map = aa.util.fit.residual_map_from(
             data=dataset.data, model_data=np.zeros(dataset.data.shape)
@@ -301,7 +323,8 @@ class PositionsLHPenalty(AbstractPositionsLH):
             return None
 
         log_likelihood_penalty_base = self.log_likelihood_penalty_base_from(
-            dataset=analysis.dataset
+            dataset=analysis.dataset,
+            chunk_size=getattr(analysis, "visibilities_chunk_size", None),
         )
 
         return log_likelihood_penalty_base - log_likelihood_positions_penalty
@@ -29,6 +29,8 @@ class Preloads(ag.Preloads):
         log_det_regularization_matrix_term: Optional[float] = None,
         traced_mesh_grids_list_of_planes=None,
         image_plane_mesh_grid_list=None,
+        reusable_mapper_list=None,
+        image_mesh_cache=None,
         failed=False,
     ):
         """
@@ -69,6 +71,12 @@ class Preloads(ag.Preloads):
         operated_mapping_matrix
             A matrix containing the mappings between PSF blurred image pixels and source pixels used in the linear
             algebra of an inversion. This can be preloaded when no mass profiles and pixelizations in the model vary.
+        reusable_mapper_list
+            The mappers of the previous fit of a model-fit, stored with the inputs they were created from, which are
+            reused by a fit whose mappers have the same inputs (see `ReusableMapper`).
+        image_mesh_cache
+            A cache of the image-plane mesh grids computed by the image meshes of a model-fit, which are reused by a
+            fit whose image mesh has the same inputs (see `ImageMeshCache`).
 
         Returns
         -------
@@ -94,6 +102,8 @@ class Preloads(ag.Preloads):
         )
 
         self.traced_grids_of_planes_for_inversion = traced_grids_of_planes_for_inversion
+        self.reusable_mapper_list = reusable_mapper_list
+        self.image_mesh_cache = image_mesh_cache
         self.failed = failed
 
     @classmethod
@@ -136,6 +146,130 @@ class Preloads(ag.Preloads):
 
         return preloads
 
+    @classmethod
+    def setup_all_via_dependencies(cls, fit, dependencies) -> "Preloads":
+        """
+        Setup the Preloads from a single fit and the dependencies of the likelihood function on the model's free
+        parameters.
+
+        Unlike `setup_all_via_fits`, which compares two fits to infer which quantities do not change, every quantity
+        whose stage of the likelihood function depends on no free parameter of the model is preloaded from the
+        input fit. This requires one fit instead of two and does not preload quantities which are equal for two
+        fits by coincidence.
+
+        Parameters
+        ----------
+        fit
+            A fit corresponding to a model with a specific set of unit-values.
+        dependencies
+            The `ModelDependencies` of the model, which determine which stages of the likelihood function are
+            constant.
+
+        Returns
+        -------
+        Preloads
+            Preloads which are set up based on the fit's passed in specific to a lens model.
+        """
+        preloads = cls()
+
+        constant_stage_list = dependencies.constant_stage_list
+
+        if isinstance(fit, aa.FitImaging) and "w_tilde" not in constant_stage_list:
+            preloads.use_w_tilde = False
+
+        preloads.set_stages_via_fit(fit=fit, stage_list=constant_stage_list)
+
+        return preloads
+
+    def set_stages_via_fit(self, fit, stage_list: List[str]):
+        """
+        Preload the quantities of the input stages of the likelihood function from a fit.
+
+        Every stage is preloaded by passing the fit to the setter used by `setup_all_via_fits` as both of the fits it
+        compares, meaning the quantities of the fit are preloaded wherever the setter can preload them. This is used
+        to preload the stages which are constant for the whole model-fit and to reuse the stages of the previous fit
+        whose free parameters are unchanged in the next fit.
+
+        Parameters
+        ----------
+        fit
+            The fit whose quantities are preloaded.
+        stage_list
+            The names of the stages which are preloaded, which are keys of the `stage_dependencies_dict` of the
+            `dependencies` module.
+        """
+        if isinstance(fit, aa.FitImaging):
+            if "w_tilde" in stage_list:
+                self.set_w_tilde_imaging(fit_0=fit, fit_1=fit)
+            if "blurred_image" in stage_list:
+                self.set_blurred_image(fit_0=fit, fit_1=fit)
+
+        if "traced_grids_of_planes_for_inversion" in stage_list:
+            self.set_traced_grids_of_planes_for_inversion(fit_0=fit, fit_1=fit)
+        if "image_plane_mesh_grid_pg_list" in stage_list:
+            self.set_image_plane_mesh_grid_pg_list(fit_0=fit, fit_1=fit)
+        if "relocated_grid" in stage_list:
+            self.set_relocated_grid(fit_0=fit, fit_1=fit)
+        if "mapper_list" in stage_list:
+            self.set_mapper_list(fit_0=fit, fit_1=fit)
+
+            if self.mapper_list is not None:
+                self.mapper_galaxy_dict = fit.tracer_to_inversion.mapper_galaxy_dict
+
+        if "operated_mapping_matrix" in stage_list:
+            self.set_operated_mapping_matrix_with_preloads(fit_0=fit, fit_1=fit)
+        if "linear_func_operated_mapping_matrix_dict" in stage_list:
+            self.set_linear_func_inversion_dicts(fit_0=fit, fit_1=fit)
+        if "curvature_matrix" in stage_list:
+            self.set_curvature_matrix(fit_0=fit, fit_1=fit)
+        elif "curvature_matrix_mapper_diag" in stage_list:
+            self.set_curvature_matrix_mapper_diag(fit=fit)
+        if "regularization_matrix" in stage_list:
+            self.set_regularization_matrix_and_term(fit_0=fit, fit_1=fit)
+
+    def set_curvature_matrix_mapper_diag(self, fit):
+        """
+        If the `MassProfile`'s, `LightProfile`'s and `Mesh`'s in a model are fixed but linear light profiles vary,
+        the regions of the curvature matrix associated with the mappers and the mapper's data vector do not change
+        during the model-fit and can therefore be preloaded.
+
+        This is the preload `set_curvature_matrix` performs when the curvature matrices of two fits differ but their
+        mapper diagonals are the same, which is performed for a single fit when the model's dependencies show that
+        only the linear light profiles change the curvature matrix.
+
+        Parameters
+        ----------
+        fit
+            The fit corresponding to a model with a specific set of unit-values.
+        """
+        self.curvature_matrix = None
+        self.data_vector_mapper = None
+        self.curvature_matrix_mapper_diag = None
+        self.mapper_operated_mapping_matrix_dict = None
+
+        inversion = fit.inversion
+
+        if inversion is None:
+            return
+
+        try:
+            curvature_matrix_mapper_diag = inversion._curvature_matrix_mapper_diag
+        except NotImplementedError:
+            return
+
+        if curvature_matrix_mapper_diag is None:
+            return
+
+        self.mapper_operated_mapping_matrix_dict = (
+            inversion.mapper_operated_mapping_matrix_dict
+        )
+        self.data_vector_mapper = inversion._data_vector_mapper
+        self.curvature_matrix_mapper_diag = curvature_matrix_mapper_diag
+
+        logger.info(
+            "PRELOADS - Inversion Curvature Matrix Mapper Diag preloaded for this model-fit."
+        )
+
     def set_traced_grids_of_planes_for_inversion(self, fit_0, fit_1):
         """
         If the `MassProfiles`'s in a model are fixed their deflection angles and therefore corresponding traced grids
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+import numpy as np
+
+import autoarray as aa
+
+
+class TracedGridCache:
+    def __init__(self, max_bytes: int = 100_000_000):
+        """
+        A least-recently-used cache of the traced grids of an inversion, keyed on the values of the free parameters
+        the traced grids depend on (e.g. the mass profile parameters of the model).
+
+        Non-linear searches often propose model instances whose mass parameters are identical to a recent proposal,
+        for example a slice sampler moving along a light profile parameter or an adapt search where only the
+        pixelization parameters vary. The traced grids of these instances are taken from the cache instead of
+        ray-tracing the over sampled grid again.
+
+        When adding traced grids makes the memory used by the cache exceed `max_bytes`, the least recently used
+        traced grids are removed.
+
+        Parameters
+        ----------
+        max_bytes
+            The maximum memory in bytes used by the traced grids stored in the cache.
+        """
+        self.max_bytes = max_bytes
+
+        self.traced_grid_list_dict = OrderedDict()
+        self.bytes_dict = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def bytes(self) -> int:
+        """
+        The memory in bytes used by the traced grids stored in the cache.
+        """
+        return sum(self.bytes_dict.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of all requests of the cache which returned traced grids.
+        """
+        total = self.hits + self.misses
+
+        return self.hits / total if total > 0 else 0.0
+
+    def __len__(self):
+        return len(self.traced_grid_list_dict)
+
+    def traced_grid_list_from(
+        self, key: Optional[Hashable]
+    ) -> Optional[List[aa.type.Grid2DLike]]:
+        """
+        Returns the traced grids stored in the cache for a key, or `None` if the cache has no traced grids for the
+        key.
+
+        A key of `None`, which means the traced grids cannot be keyed, is neither a hit nor a miss.
+
+        Parameters
+        ----------
+        key
+            The values of the free parameters the traced grids depend on.
+        """
+        if key is None:
+            return None
+
+        try:
+            traced_grid_list = self.traced_grid_list_dict[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.traced_grid_list_dict.move_to_end(key)
+        self.hits += 1
+
+        return traced_grid_list
+
+    def add(self, key: Optional[Hashable], traced_grid_list: List[aa.type.Grid2DLike]):
+        """
+        Add traced grids to the cache, removing the least recently used traced grids if the memory used by the cache
+        then exceeds `max_bytes`.
+
+        Parameters
+        ----------
+        key
+            The values of the free parameters the traced grids depend on.
+        traced_grid_list
+            The traced grids of every plane, where planes which are not traced are `None`.
+        """
+        if key is None or key in self.traced_grid_list_dict:
+            return
+
+        grid_bytes = sum(
+            np.asarray(traced_grid).nbytes
+            for traced_grid in traced_grid_list
+            if traced_grid is not None
+        )
+
+        if grid_bytes > self.max_bytes:
+            return
+
+        self.traced_grid_list_dict[key] = traced_grid_list
+        self.bytes_dict[key] = grid_bytes
+
+        while self.bytes > self.max_bytes:
+            key, _ = self.traced_grid_list_dict.popitem(last=False)
+            del self.bytes_dict[key]
@@ -1,6 +1,6 @@
 import copy
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from autoconf import cached_property
 
@@ -10,6 +10,7 @@ import autogalaxy as ag
 from autogalaxy.abstract_fit import AbstractFitInversion
 
 from autolens.analysis.preloads import Preloads
+from autolens.lens import convolution
 from autolens.lens.tracer import Tracer
 from autolens.lens.to_inversion import TracerToInversion
 
@@ -26,6 +27,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         settings_inversion: aa.SettingsInversion = aa.SettingsInversion(),
         preloads: Preloads = Preloads(),
         run_time_dict: Optional[Dict] = None,
+        use_fft_convolution: bool = False,
     ):
         """
         Fits an imaging dataset using a `Tracer` object.
@@ -70,8 +72,15 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         run_time_dict
             A dictionary which if passed to the fit records how long function calls which have the `profile_func`
             decorator take to run.
+        use_fft_convolution
+            Whether the images of light profiles are convolved with the PSF via an FFT, which is faster for large
+            PSFs (see `convolution.convolver_from`). This is a setting of the fit (and of the `AnalysisImaging` which
+            creates it) rather than of the `Imaging` dataset, whose `ConvolverFFT` is cached in the dataset's
+            `__dict__` and shared by all fits which use FFT convolution.
         """
 
+        tracer = tracer.copy_with_traced_grid_memo()
+
         super().__init__(dataset=dataset, dataset_model=dataset_model, run_time_dict=run_time_dict)
         AbstractFitInversion.__init__(
             self=self, model_obj=tracer, settings_inversion=settings_inversion
@@ -84,6 +93,20 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         self.preloads = preloads
 
+        self.use_fft_convolution = use_fft_convolution
+
+    @property
+    def convolver(self) -> Union[aa.Convolver, convolution.ConvolverFFT]:
+        """
+        The convolver used to convolve the images of light profiles with the PSF, which is the dataset's real-space
+        `Convolver` or its `ConvolverFFT` depending on `use_fft_convolution`.
+
+        Inversions always use the dataset's `Convolver`, because it also convolves their mapping matrices.
+        """
+        return convolution.convolver_from(
+            dataset=self.dataset, use_fft=self.use_fft_convolution
+        )
+
     @cached_property
     def grids(self) -> aa.GridsInterface:
 
@@ -107,20 +130,26 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             border_relocator=grids.border_relocator
         )
 
-    @property
+    @cached_property
     def blurred_image(self) -> aa.Array2D:
         """
         Returns the image of all light profiles in the fit's tracer convolved with the imaging dataset's PSF.
 
         For certain lens models the blurred image does not change (for example when all light profiles in the tracer
         are fixed in the lens model). For faster run-times the blurred image can be preloaded.
+
+        If the blurred image of every galaxy has already been computed (e.g. for visualization) the blurred image is
+        their sum, otherwise the image of all light profiles is computed and convolved once.
         """
 
         if self.preloads.blurred_image is None:
 
+            if "galaxy_blurred_image_dict" in self.__dict__:
+                return sum(self.galaxy_blurred_image_dict.values())
+
             return self.tracer.blurred_image_2d_from(
                 grid=self.grids.uniform,
-                convolver=self.dataset.convolver,
+                convolver=self.convolver,
                 blurring_grid=self.grids.blurring,
             )
 
@@ -134,7 +163,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return self.data - self.blurred_image
 
-    @property
+    @cached_property
     def tracer_to_inversion(self) -> TracerToInversion:
 
         dataset = aa.DatasetInterface(
@@ -185,7 +214,23 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return self.blurred_image
 
-    @property
+    @cached_property
+    def galaxy_blurred_image_dict(self) -> Dict[ag.Galaxy, aa.Array2D]:
+        """
+        A dictionary which associates every galaxy in the tracer with the image of its ordinary light profiles
+        convolved with the imaging data's PSF.
+
+        The images are computed once per fit and used by the galaxy and plane model images and subtracted images,
+        so that visualizing a fit does not ray-trace the grids and convolve the images every time one of these
+        quantities is computed.
+        """
+        return self.tracer.galaxy_blurred_image_2d_dict_from(
+            grid=self.grids.uniform,
+            convolver=self.convolver,
+            blurring_grid=self.grids.blurring,
+        )
+
+    @cached_property
     def galaxy_model_image_dict(self) -> Dict[ag.Galaxy, np.ndarray]:
         """
         A dictionary which associates every galaxy in the tracer with its `model_image`.
@@ -200,19 +245,13 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         certain pixelizations to the data being fitted.
         """
 
-        galaxy_blurred_image_2d_dict = self.tracer.galaxy_blurred_image_2d_dict_from(
-            grid=self.grids.uniform,
-            convolver=self.dataset.convolver,
-            blurring_grid=self.grids.blurring,
-        )
-
         galaxy_linear_obj_image_dict = self.galaxy_linear_obj_data_dict_from(
             use_image=True
         )
 
-        return {**galaxy_blurred_image_2d_dict, **galaxy_linear_obj_image_dict}
+        return {**self.galaxy_blurred_image_dict, **galaxy_linear_obj_image_dict}
 
-    @property
+    @cached_property
     def subtracted_images_of_galaxies_dict(self) -> Dict[ag.Galaxy, np.ndarray]:
         """
         A dictionary which associates every galaxy in the tracer with its `subtracted image`.
@@ -254,7 +293,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return subtracted_signal_to_noise_maps_of_galaxies_dict
 
-    @property
+    @cached_property
     def model_images_of_planes_list(self) -> List[aa.Array2D]:
         """
         A list of every model image of every plane in the tracer.
@@ -285,7 +324,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return model_images_of_planes_list
 
-    @property
+    @cached_property
     def subtracted_images_of_planes_list(self) -> List[aa.Array2D]:
         """
         A list of the subtracted image of every plane.
@@ -316,7 +355,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         return subtracted_images_of_planes_list
 
-    @property
+    @cached_property
     def unmasked_blurred_image(self) -> aa.Array2D:
         """
         The blurred image of the overall fit that would be evaluated without a mask being used.
@@ -331,7 +370,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             grid=self.grids.uniform, psf=self.dataset.psf
         )
 
-    @property
+    @cached_property
     def unmasked_blurred_image_of_planes_list(self) -> List[aa.Array2D]:
         """
         The blurred image of every galaxy in the tracer used in this fit, that would be evaluated without a mask being
@@ -397,4 +436,5 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             settings_inversion=settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            use_fft_convolution=self.use_fft_convolution,
         )
\ No newline at end of file
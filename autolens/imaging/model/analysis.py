@@ -27,6 +27,24 @@ class AnalysisImaging(AnalysisDataset):
     Result = ResultImaging
     Visualizer = VisualizerImaging
 
+    def __init__(self, *args, use_fft_convolution: bool = False, **kwargs):
+        """
+        Fits a lens model to an imaging dataset via a non-linear search.
+
+        The inputs are those of `AnalysisDataset` (the dataset, positions likelihood, cosmology, settings and so on),
+        plus the setting below.
+
+        Parameters
+        ----------
+        use_fft_convolution
+            Whether the images of light profiles are convolved with the dataset's PSF via an FFT, which is faster for
+            large PSFs (see `convolution.convolver_from`). It is off unless input, in which case inversions still use
+            the real-space `Convolver`.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.use_fft_convolution = use_fft_convolution
+
     def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
         """
         This function is called immediately before the non-linear search begins and performs final tasks and checks 
@@ -110,7 +128,7 @@ class AnalysisImaging(AnalysisDataset):
             return log_likelihood_positions_overwrite
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.figure_of_merit_reusing_stages_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -173,6 +191,7 @@ class AnalysisImaging(AnalysisDataset):
             settings_inversion=self.settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            use_fft_convolution=self.use_fft_convolution,
         )
 
     def save_attributes(self, paths: af.DirectoryPaths):
@@ -0,0 +1,109 @@
+import numpy as np
+from typing import List
+
+
+def chunk_slice_list_from(*, total_visibilities: int, chunk_size: int) -> List[slice]:
+    """
+    Returns the slices which split an array of visibilities into consecutive chunks of `chunk_size` visibilities,
+    where the final chunk contains the remaining visibilities.
+
+    Parameters
+    ----------
+    total_visibilities
+        The number of visibilities which are split into chunks.
+    chunk_size
+        The number of visibilities in every chunk.
+    """
+    return [
+        slice(start, min(start + chunk_size, total_visibilities))
+        for start in range(0, total_visibilities, chunk_size)
+    ]
+
+
+def chi_squared_complex_chunked_from(
+    *,
+    data: np.ndarray,
+    noise_map: np.ndarray,
+    model_data_list: List[np.ndarray],
+    chunk_size: int,
+) -> float:
+    """
+    Returns the chi-squared of the fit of complex model-data to a dataset, summing the real and imaginary terms:
+
+    Chi_Squared = ((Residuals) / (Noise)) ** 2.0 = ((Data - Model)**2.0)/(Variances)
+
+    The model-data is the sum of every array in `model_data_list` (e.g. the visibilities of the light profiles and
+    the reconstructed visibilities of an inversion), or all zeros if the list is empty.
+
+    The residual-map and chi-squared-map are computed and summed one chunk of `chunk_size` visibilities at a time, so
+    the memory used by the calculation is bounded by the chunk size rather than the number of visibilities, and the
+    summed model-data is never stored for all visibilities.
+
+    This gives the same chi-squared as `aa.util.fit.chi_squared_complex_from`, up to the numerical precision of
+    summing the chunks separately.
+
+    Parameters
+    ----------
+    data
+        The visibilities of the dataset.
+    noise_map
+        The noise-map of the dataset.
+    model_data_list
+        The arrays of model visibilities whose sum is fitted to the data.
+    chunk_size
+        The number of visibilities in every chunk.
+    """
+    data = np.asarray(data)
+    noise_map = np.asarray(noise_map)
+    model_data_list = [np.asarray(model_data) for model_data in model_data_list]
+
+    chi_squared = 0.0
+
+    for chunk in chunk_slice_list_from(
+        total_visibilities=data.shape[0], chunk_size=chunk_size
+    ):
+        residual_map = data[chunk].copy()
+
+        for model_data in model_data_list:
+            residual_map -= model_data[chunk]
+
+        noise_map_chunk = noise_map[chunk]
+
+        chi_squared += np.sum((residual_map.real / noise_map_chunk.real) ** 2.0)
+        chi_squared += np.sum((residual_map.imag / noise_map_chunk.imag) ** 2.0)
+
+    return float(chi_squared)
+
+
+def noise_normalization_complex_chunked_from(
+    *, noise_map: np.ndarray, chunk_size: int
+) -> float:
+    """
+    Returns the noise-map normalization terms of a complex noise-map, summing the noise_map value in every
+    visibility as:
+
+    [Noise_Term] = sum(log(2*pi*[Noise.real]**2.0)) + sum(log(2*pi*[Noise.imag]**2.0))
+
+    The terms are computed and summed one chunk of `chunk_size` visibilities at a time, so the memory used by the
+    calculation is bounded by the chunk size rather than the number of visibilities.
+
+    Parameters
+    ----------
+    noise_map
+        The noise-map of the dataset.
+    chunk_size
+        The number of visibilities in every chunk.
+    """
+    noise_map = np.asarray(noise_map)
+
+    noise_normalization = 0.0
+
+    for chunk in chunk_slice_list_from(
+        total_visibilities=noise_map.shape[0], chunk_size=chunk_size
+    ):
+        noise_map_chunk = noise_map[chunk]
+
+        noise_normalization += np.sum(np.log(2 * np.pi * noise_map_chunk.real**2.0))
+        noise_normalization += np.sum(np.log(2 * np.pi * noise_map_chunk.imag**2.0))
+
+    return float(noise_normalization)
@@ -9,6 +9,8 @@ import autogalaxy as ag
 from autogalaxy.abstract_fit import AbstractFitInversion
 
 from autolens.analysis.preloads import Preloads
+from autolens.interferometer import chunked_fit_util
+from autolens.interferometer.galaxy_visibilities_cache import GalaxyVisibilitiesCache
 from autolens.lens.tracer import Tracer
 from autolens.lens.to_inversion import TracerToInversion
 
@@ -23,6 +25,8 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         settings_inversion: aa.SettingsInversion = aa.SettingsInversion(),
         preloads: Preloads = Preloads(),
         run_time_dict: Optional[Dict] = None,
+        galaxy_visibilities_cache: Optional[GalaxyVisibilitiesCache] = None,
+        chunk_size: Optional[int] = None,
     ):
         """
         Fits an interferometer dataset using a `Tracer` object.
@@ -68,6 +72,14 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         run_time_dict
             A dictionary which if passed to the fit records how long function calls which have the `profile_func`
             decorator take to run.
+        galaxy_visibilities_cache
+            A cache of the visibilities of individual galaxies, shared by the fits of a model-fit, so that only the
+            galaxies whose parameters differ from those of a previous fit are Fourier transformed.
+        chunk_size
+            If input, the chi-squared and noise normalization of the fit are computed one chunk of this many
+            visibilities at a time, so that the residual-map and chi-squared-map of all visibilities are never stored
+            in memory at once. This gives the same `figure_of_merit`, up to numerical precision, and bounds the memory
+            used by these calculations for datasets with tens of millions of visibilities.
         """
 
         try:
@@ -75,6 +87,8 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         except ImportError:
             settings_inversion.use_w_tilde = False
 
+        tracer = tracer.copy_with_traced_grid_memo()
+
         self.tracer = tracer
 
         self.adapt_images = adapt_images
@@ -85,6 +99,10 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
 
         self.run_time_dict = run_time_dict
 
+        self.galaxy_visibilities_cache = galaxy_visibilities_cache
+
+        self.chunk_size = chunk_size
+
         super().__init__(
             dataset=dataset, dataset_model=dataset_model, run_time_dict=run_time_dict
         )
@@ -92,12 +110,23 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             self=self, model_obj=tracer, settings_inversion=settings_inversion
         )
 
-    @property
+    @cached_property
     def profile_visibilities(self) -> aa.Visibilities:
         """
         Returns the visibilities of every light profile in the tracer, which are computed by performing a Fourier
         transform to the sum of light profile images.
+
+        If the fit has a `galaxy_visibilities_cache`, the visibilities are instead the sum of the visibilities of every
+        galaxy, where only the galaxies whose visibilities are not in the cache are Fourier transformed (see
+        `GalaxyVisibilitiesCache`).
         """
+        if self.galaxy_visibilities_cache is not None:
+            return self.galaxy_visibilities_cache.visibilities_from(
+                tracer=self.tracer,
+                grid=self.grids.uniform,
+                transformer=self.dataset.transformer,
+            )
+
         return self.tracer.visibilities_from(
             grid=self.grids.uniform, transformer=self.dataset.transformer
         )
@@ -110,7 +139,7 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         """
         return self.data - self.profile_visibilities
 
-    @property
+    @cached_property
     def tracer_to_inversion(self) -> TracerToInversion:
         dataset = aa.DatasetInterface(
             data=self.profile_subtracted_visibilities,
@@ -157,6 +186,44 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
 
         return self.profile_visibilities
 
+    @property
+    def chi_squared(self) -> float:
+        """
+        Returns the chi-squared terms of the model data's fit to the dataset, by summing the chi-squared-map.
+
+        If the fit has a `chunk_size`, the chi-squared is computed one chunk of visibilities at a time from the
+        `profile_visibilities` and the inversion's reconstructed visibilities, so that the model data, residual-map
+        and chi-squared-map of all visibilities are not stored in memory.
+        """
+        if self.chunk_size is None:
+            return super().chi_squared
+
+        model_data_list = [self.profile_visibilities]
+
+        if self.perform_inversion:
+            model_data_list.append(self.inversion.mapped_reconstructed_data)
+
+        return chunked_fit_util.chi_squared_complex_chunked_from(
+            data=self.data,
+            noise_map=self.noise_map,
+            model_data_list=model_data_list,
+            chunk_size=self.chunk_size,
+        )
+
+    @property
+    def noise_normalization(self) -> float:
+        """
+        Returns the noise-map normalization term of the noise-map, summing the noise_map value in every visibility.
+
+        If the fit has a `chunk_size`, the noise normalization is computed one chunk of visibilities at a time.
+        """
+        if self.chunk_size is None:
+            return super().noise_normalization
+
+        return chunked_fit_util.noise_normalization_complex_chunked_from(
+            noise_map=self.noise_map, chunk_size=self.chunk_size
+        )
+
     @property
     def galaxy_model_image_dict(self) -> Dict[ag.Galaxy, np.ndarray]:
         """
@@ -282,4 +349,6 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             settings_inversion=settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            galaxy_visibilities_cache=self.galaxy_visibilities_cache,
+            chunk_size=self.chunk_size,
         )
@@ -0,0 +1,281 @@
+import hashlib
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import numpy as np
+
+import autoarray as aa
+import autogalaxy as ag
+
+from autolens.lens.over_sampling_magnification import OverSamplingMagnification
+
+excluded_name_list = ["id", "_label", "run_time_dict"]
+
+
+def parameters_from(obj) -> Hashable:
+    """
+    Returns the parameters of an object (e.g. a light or mass profile) as a hashable tuple of its class and the
+    values of its attributes, where attributes which are objects (e.g. the profiles of a `Basis`) are converted to
+    their parameters recursively.
+
+    Attributes which identify the object rather than describe it (e.g. the `id` of profiles created from a model) are
+    excluded, so that two objects with the same parameters have the same key.
+
+    Parameters
+    ----------
+    obj
+        The object whose parameters are returned.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+
+    if isinstance(obj, (list, tuple)):
+        return tuple(parameters_from(obj=value) for value in obj)
+
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return np.shape(obj), tuple(np.ravel(obj).tolist())
+
+    return type(obj), tuple(
+        (name, parameters_from(obj=value))
+        for name, value in sorted(vars(obj).items())
+        if name not in excluded_name_list
+    )
+
+
+class GalaxyVisibilitiesCache:
+    def __init__(self, max_bytes: int = 500_000_000, max_seen_keys: int = 10_000):
+        """
+        A least-recently-used cache of the visibilities of the light profiles of individual galaxies, keyed on the
+        parameters which the galaxy's image depends on.
+
+        The Fourier transform from an image to visibilities is linear, so the visibilities of a tracer's light
+        profiles are the sum of the visibilities of every galaxy. A non-linear search which fits interferometer data
+        often varies the parameters of some galaxies (e.g. the source) whilst the parameters of others are fixed or
+        unchanged (e.g. the lens light), in which case the visibilities of the unchanged galaxies are taken from the
+        cache and only the galaxies whose parameters changed are ray-traced, evaluated and Fourier transformed. For
+        datasets with millions of visibilities the Fourier transform dominates the run time of a fit, and a fit whose
+        galaxies' light is unchanged (e.g. because only the mass of the lens galaxy, whose light is in the lens plane,
+        or a pixelization changed) performs no Fourier transform of light profiles at all.
+
+        Fourier transforming the galaxies separately costs one transform per galaxy, whereas the sum of their images
+        needs only one. The visibilities of a galaxy are therefore only computed separately and cached when its key
+        has been seen in a previous fit, which means its parameters recur. The images of all other galaxies whose
+        visibilities are not cached are summed and Fourier transformed together, so a model-fit which changes the
+        light of every galaxy every fit performs one Fourier transform per fit, as it would without the cache.
+
+        The image of a galaxy depends on its light profiles, the mass profiles of all galaxies in lower redshift
+        planes (which deflect its light), the plane redshifts and cosmology, the grid the image is evaluated on (which
+        a `DatasetModel` with a `grid_offset` moves every fit) and whether the grid uses non-uniform over sampling.
+        The key of a galaxy's visibilities contains all of these, where the grid is included via a hash of its
+        coordinates. Grids whose over sampling depends on the magnification of the tracer (`OverSamplingMagnification`)
+        are not cached.
+
+        A cache is only valid for one dataset, and is therefore created by the analysis fitting that dataset.
+
+        When adding visibilities makes the memory used by the cache exceed `max_bytes`, the least recently used
+        visibilities are removed.
+
+        Parameters
+        ----------
+        max_bytes
+            The maximum memory in bytes used by the visibilities stored in the cache.
+        max_seen_keys
+            The maximum number of keys of galaxies whose visibilities are not cached which are remembered, to decide
+            whether their visibilities are cached the next time their key is seen.
+        """
+        self.max_bytes = max_bytes
+        self.max_seen_keys = max_seen_keys
+
+        self.visibilities_dict = OrderedDict()
+        self.seen_key_hash_dict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.visibilities_dict)
+
+    @property
+    def bytes(self) -> int:
+        """
+        The memory in bytes used by the visibilities stored in the cache.
+        """
+        return sum(
+            visibilities.nbytes
+            for visibilities in self.visibilities_dict.values()
+            if visibilities is not None
+        )
+
+    @staticmethod
+    def key_dict_from(tracer, grid: aa.Grid2D) -> Optional[dict]:
+        """
+        Returns a dictionary mapping every galaxy of a tracer with light profiles to the key of its visibilities, or
+        `None` if the visibilities of the tracer's galaxies cannot be cached.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose galaxies the keys are computed for.
+        grid
+            The grid the images of the galaxies are evaluated on.
+        """
+        over_sampling_list = [
+            getattr(grid, "over_sampling", None),
+            getattr(grid, "over_sampling_non_uniform", None),
+        ]
+
+        if any(
+            isinstance(over_sampling, OverSamplingMagnification)
+            for over_sampling in over_sampling_list
+        ):
+            return None
+
+        tracer_key = (
+            hashlib.sha1(np.ascontiguousarray(grid).tobytes()).hexdigest(),
+            tracer.upper_plane_index_with_light_profile > 0,
+            repr(tracer.cosmology),
+        )
+
+        key_dict = {}
+
+        mass_key_list = []
+
+        for plane_index, galaxies in enumerate(tracer.planes):
+            plane_key = (
+                tracer_key,
+                tuple(tracer.plane_redshifts[: plane_index + 1]),
+                tuple(mass_key_list),
+            )
+
+            for galaxy in galaxies:
+                light_list = galaxy.cls_list_from(cls=ag.LightProfile)
+
+                if len(light_list) > 0:
+                    key_dict[galaxy] = (
+                        plane_key,
+                        galaxy.redshift,
+                        parameters_from(obj=light_list),
+                    )
+
+            for galaxy in galaxies:
+                mass_key_list.append(
+                    parameters_from(obj=galaxy.cls_list_from(cls=ag.mp.MassProfile))
+                )
+
+        return key_dict
+
+    def visibilities_from(
+        self, tracer, grid: aa.Grid2D, transformer: aa.type.Transformer
+    ) -> aa.Visibilities:
+        """
+        Returns the visibilities of the light profiles of every galaxy in a tracer summed, where the visibilities of
+        galaxies whose key is in the cache are taken from it and those of the other galaxies are computed.
+
+        Only the galaxies whose visibilities are not in the cache are ray-traced and evaluated (see the `galaxy_list`
+        input of `Tracer.galaxy_image_2d_dict_from`). Galaxies whose image is all zeros are cached without a Fourier
+        transform. Galaxies whose key has been seen before are Fourier transformed separately and cached, and the
+        images of the remaining galaxies are summed and Fourier transformed once, with their keys remembered.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose galaxies' visibilities are summed.
+        grid
+            The grid the images of the galaxies are evaluated on.
+        transformer
+            The transformer which Fourier transforms the images of the galaxies to visibilities.
+        """
+        key_dict = self.key_dict_from(tracer=tracer, grid=grid)
+
+        if key_dict is None:
+            return tracer.visibilities_from(grid=grid, transformer=transformer)
+
+        visibilities = np.zeros(
+            shape=(transformer.uv_wavelengths.shape[0],), dtype="complex128"
+        )
+
+        galaxy_list = []
+
+        for galaxy, key in key_dict.items():
+            try:
+                galaxy_visibilities = self.visibilities_dict[key]
+            except KeyError:
+                self.misses += 1
+                galaxy_list.append(galaxy)
+                continue
+
+            self.visibilities_dict.move_to_end(key)
+            self.hits += 1
+
+            if galaxy_visibilities is not None:
+                visibilities += galaxy_visibilities
+
+        if len(galaxy_list) == 0:
+            return aa.Visibilities(visibilities=visibilities)
+
+        galaxy_image_2d_dict = tracer.galaxy_image_2d_dict_from(
+            grid=grid, galaxy_list=galaxy_list
+        )
+
+        image_2d_unseen = None
+
+        for galaxy in galaxy_list:
+            key = key_dict[galaxy]
+            image_2d = galaxy_image_2d_dict[galaxy]
+
+            if not np.any(image_2d):
+                self.add(key=key, visibilities=None)
+                continue
+
+            key_hash = hash(key)
+
+            if key_hash not in self.seen_key_hash_dict:
+                self.seen_key_hash_dict[key_hash] = None
+
+                while len(self.seen_key_hash_dict) > self.max_seen_keys:
+                    self.seen_key_hash_dict.popitem(last=False)
+
+                if image_2d_unseen is None:
+                    image_2d_unseen = image_2d
+                else:
+                    image_2d_unseen = image_2d_unseen + image_2d
+
+                continue
+
+            galaxy_visibilities = np.asarray(
+                transformer.visibilities_from(image=image_2d)
+            )
+
+            self.add(key=key, visibilities=galaxy_visibilities)
+
+            visibilities += galaxy_visibilities
+
+        if image_2d_unseen is not None:
+            visibilities += np.asarray(
+                transformer.visibilities_from(image=image_2d_unseen)
+            )
+
+        return aa.Visibilities(visibilities=visibilities)
+
+    def add(self, key: Hashable, visibilities: Optional[np.ndarray]):
+        """
+        Add the visibilities of a galaxy to the cache, removing the least recently used visibilities if the memory
+        used by the cache then exceeds `max_bytes`.
+
+        The visibilities of a galaxy whose image is all zeros (e.g. because its only light profiles are linear light
+        profiles, whose images are computed by the inversion) are stored as `None`, so they use no memory.
+
+        Parameters
+        ----------
+        key
+            The parameters the galaxy's image depends on (see `key_dict_from`).
+        visibilities
+            The visibilities of the galaxy's light profiles, or `None` if they are all zeros.
+        """
+        if visibilities is not None and visibilities.nbytes > self.max_bytes:
+            return
+
+        self.visibilities_dict[key] = visibilities
+
+        while self.bytes > self.max_bytes:
+            self.visibilities_dict.popitem(last=False)
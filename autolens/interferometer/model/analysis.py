@@ -17,6 +17,7 @@ from autolens.analysis.positions import PositionsLHPenalty
 from autolens.interferometer.model.result import ResultInterferometer
 from autolens.interferometer.model.visualizer import VisualizerInterferometer
 from autolens.interferometer.fit_interferometer import FitInterferometer
+from autolens.interferometer.galaxy_visibilities_cache import GalaxyVisibilitiesCache
 
 from autolens import exc
 
@@ -40,6 +41,9 @@ class AnalysisInterferometer(AnalysisDataset):
         settings_inversion: aa.SettingsInversion = None,
         raise_inversion_positions_likelihood_exception: bool = True,
         title_prefix: str = None,
+        reuse_previous_fit: bool = False,
+        use_galaxy_visibilities_cache: bool = False,
+        visibilities_chunk_size: Optional[int] = None,
     ):
         """
         Analysis classes are used by PyAutoFit to fit a model to a dataset via a non-linear search.
@@ -80,7 +84,27 @@ class AnalysisInterferometer(AnalysisDataset):
         title_prefix
             A string that is added before the title of all figures output by visualization, for example to
             put the name of the dataset and galaxy in the title.
+        reuse_previous_fit
+            If `True`, every fit is kept in memory until the next fit, which reuses the stages of the likelihood
+            function whose free parameters are unchanged. This holds a whole fit in every process, so it is off by
+            default.
+        use_galaxy_visibilities_cache
+            Whether the visibilities of individual galaxies are cached between fits, so that only the galaxies whose
+            parameters changed are Fourier transformed (see `GalaxyVisibilitiesCache`). This is only faster for
+            models where the light of some galaxies is unchanged between fits (and is slower when the source light
+            varies every fit), so it is off by default.
+        visibilities_chunk_size
+            If input, the chi-squared and noise normalization of every fit (and the likelihood penalty base of a
+            `PositionsLHPenalty`) are computed one chunk of this many visibilities at a time, bounding the memory they
+            use for datasets with tens of millions of visibilities. The log likelihood is the same, up to numerical
+            precision, as computing them over all visibilities at once.
         """
+        if visibilities_chunk_size is not None and visibilities_chunk_size < 1:
+            raise exc.AnalysisException(
+                f"The visibilities_chunk_size of an AnalysisInterferometer must be a positive integer, not "
+                f"{visibilities_chunk_size}."
+            )
+
         super().__init__(
             dataset=dataset,
             positions_likelihood=positions_likelihood,
@@ -89,8 +113,15 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_inversion=settings_inversion,
             raise_inversion_positions_likelihood_exception=raise_inversion_positions_likelihood_exception,
             title_prefix=title_prefix,
+            reuse_previous_fit=reuse_previous_fit,
         )
 
+        self.galaxy_visibilities_cache = (
+            GalaxyVisibilitiesCache() if use_galaxy_visibilities_cache else None
+        )
+
+        self.visibilities_chunk_size = visibilities_chunk_size
+
     @property
     def interferometer(self):
         return self.dataset
@@ -173,7 +204,7 @@ class AnalysisInterferometer(AnalysisDataset):
             raise e
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.figure_of_merit_reusing_stages_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -233,6 +264,8 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_inversion=self.settings_inversion,
             preloads=preloads,
             run_time_dict=run_time_dict,
+            galaxy_visibilities_cache=self.galaxy_visibilities_cache,
+            chunk_size=self.visibilities_chunk_size,
         )
 
     def save_attributes(self, paths: af.DirectoryPaths):
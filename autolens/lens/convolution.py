@@ -0,0 +1,252 @@
+import numpy as np
+from scipy import fft
+from scipy import signal
+from typing import Optional, Tuple, Union
+
+import autoarray as aa
+
+
+def support_slices_from(array: np.ndarray) -> Optional[Tuple[slice, slice]]:
+    """
+    Returns the slices of the smallest rectangular region of a 2D array which contains all of its non-zero values,
+    or `None` if every value of the array is zero.
+
+    Parameters
+    ----------
+    array
+        The 2D array whose region of non-zero values is computed.
+    """
+    non_zero = array != 0.0
+
+    rows = np.flatnonzero(np.any(non_zero, axis=1))
+
+    if rows.size == 0:
+        return None
+
+    columns = np.flatnonzero(np.any(non_zero, axis=0))
+
+    return slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1)
+
+
+def convolution_method_from(shape: Tuple[int, int], kernel: np.ndarray) -> str:
+    """
+    Returns whether the convolution of a 2D region of an image with a kernel is fastest performed directly in real
+    space (`direct`) or via the Fast Fourier Transform (`fft`).
+
+    Direct convolution scales with the number of pixels in the region multiplied by the number of pixels in the
+    kernel, whereas FFT convolution scales with the number of pixels in the region padded by the kernel, times its
+    logarithm. Small kernels and regions are therefore convolved directly and large kernels via an FFT, with the
+    crossover given by the cost model of `scipy.signal.choose_conv_method`.
+
+    Parameters
+    ----------
+    shape
+        The 2D shape of the region of the image which is convolved.
+    kernel
+        The 2D kernel the region is convolved with.
+    """
+    return signal.choose_conv_method(
+        np.empty(shape=shape), kernel, mode="full", measure=False
+    )
+
+
+def convolved_image_via_support_from(
+    image: aa.Array2D,
+    blurring_image: aa.Array2D,
+    convolver: aa.Convolver,
+    method: Optional[str] = None,
+) -> aa.Array2D:
+    """
+    Convolve an image and its blurring image with the kernel of a `Convolver`, performing the convolution only over
+    the region of the image which contains non-zero flux.
+
+    The `Convolver` loops over every image and blurring pixel in the mask, even when their values are zero. When
+    most of the mask has no flux, for example a compact lensed source whose lens light has been subtracted, or a
+    galaxy with no light profiles, this does unnecessary work. Here, the smallest rectangular region containing all
+    non-zero values of the image and blurring image is computed, and only this region is convolved, directly or via
+    an FFT depending on the size of the region and kernel (see `convolution_method_from`). If there is no flux, an
+    image of zeros is returned without any convolution being performed.
+
+    If direct convolution is chosen for a region with at least as many pixels as the image and blurring image, the
+    `Convolver` does no unnecessary work and is used to perform the convolution.
+
+    The returned image is the same as that returned by `Convolver.convolve_image`, to numerical precision.
+
+    Parameters
+    ----------
+    image
+        The image of pixels in the mask which is convolved.
+    blurring_image
+        The image of pixels outside the mask whose light is blurred into the mask by the kernel.
+    convolver
+        The convolver which defines the mask and kernel of the convolution.
+    method
+        The method used to convolve the region, `direct` or `fft`, which if not input is chosen via
+        `convolution_method_from` (or the `Convolver` is used, see above).
+    """
+    mask = np.asarray(convolver.mask)
+
+    array = np.zeros(shape=mask.shape)
+    array[~mask] = image
+    array[~np.asarray(convolver.blurring_mask)] += blurring_image
+
+    support_slices = support_slices_from(array=array)
+
+    if support_slices is None:
+        return aa.Array2D(
+            values=np.zeros(convolver.pixels_in_mask), mask=convolver.mask
+        )
+
+    kernel = np.asarray(convolver.kernel.native)
+
+    support = array[support_slices]
+
+    if method is None:
+        method = convolution_method_from(shape=support.shape, kernel=kernel)
+
+        if (
+            method == "direct"
+            and support.size
+            >= convolver.pixels_in_mask + convolver.pixels_in_blurring_mask
+        ):
+            return convolver.convolve_image(
+                image=image, blurring_image=blurring_image
+            )
+
+    convolved_support = signal.convolve(support, kernel, mode="full", method=method)
+
+    y0 = support_slices[0].start - kernel.shape[0] // 2
+    x0 = support_slices[1].start - kernel.shape[1] // 2
+
+    y_min = max(y0, 0)
+    x_min = max(x0, 0)
+    y_max = min(y0 + convolved_support.shape[0], array.shape[0])
+    x_max = min(x0 + convolved_support.shape[1], array.shape[1])
+
+    blurred_array = np.zeros(shape=array.shape)
+    blurred_array[y_min:y_max, x_min:x_max] = convolved_support[
+        y_min - y0 : y_max - y0, x_min - x0 : x_max - x0
+    ]
+
+    return aa.Array2D(values=blurred_array[~mask], mask=convolver.mask)
+
+
+class ConvolverFFT:
+    def __init__(self, convolver: aa.Convolver):
+        """
+        Convolves images with a PSF via the Fast Fourier Transform (FFT), using the mask and kernel of a `Convolver`.
+
+        The run time of the real-space `Convolver` scales with the number of image and blurring pixels in the mask
+        multiplied by the number of pixels in the kernel, such that for large PSFs (e.g. the 51x51 kernels of JWST
+        or ground-based imaging) convolution dominates the run time of every likelihood evaluation. The run time of
+        FFT convolution does not depend on the size of the kernel.
+
+        The convolution is performed over the smallest rectangular region containing every image and blurring pixel,
+        padded by the kernel so the FFT gives a linear (not circular) convolution. The FFT of the kernel for this
+        padded region is computed once when the `ConvolverFFT` is created, so every convolution performs only the
+        forward and inverse FFT of the image.
+
+        Images are only convolved into their masked pixels, for which the result is the same as that of the
+        `Convolver`, to numerical precision.
+
+        Parameters
+        ----------
+        convolver
+            The convolver whose mask, blurring mask and kernel define the convolution.
+        """
+        self.convolver = convolver
+
+        mask = np.asarray(convolver.mask)
+        blurring_mask = np.asarray(convolver.blurring_mask)
+
+        self.region_slices = support_slices_from(
+            array=(~mask | ~blurring_mask).astype("float")
+        )
+
+        self.mask_region = mask[self.region_slices]
+        self.blurring_mask_region = blurring_mask[self.region_slices]
+
+        kernel = np.asarray(convolver.kernel.native)
+
+        self.kernel_shape = kernel.shape
+
+        self.fft_shape = tuple(
+            fft.next_fast_len(region_size + kernel_size - 1, real=True)
+            for region_size, kernel_size in zip(self.mask_region.shape, kernel.shape)
+        )
+
+        self.kernel_fft = fft.rfft2(kernel, s=self.fft_shape)
+
+    @property
+    def mask(self) -> aa.Mask2D:
+        return self.convolver.mask
+
+    def convolve_image(
+        self, image: aa.Array2D, blurring_image: aa.Array2D
+    ) -> aa.Array2D:
+        """
+        Convolve an image and its blurring image with the kernel via an FFT, returning the convolved image in the
+        mask.
+
+        If there is no flux in the image and blurring image, an image of zeros is returned without an FFT being
+        performed.
+
+        Parameters
+        ----------
+        image
+            The image of pixels in the mask which is convolved.
+        blurring_image
+            The image of pixels outside the mask whose light is blurred into the mask by the kernel.
+        """
+        region = np.zeros(shape=self.mask_region.shape)
+        region[~self.mask_region] = image
+        region[~self.blurring_mask_region] += blurring_image
+
+        if not np.any(region):
+            return aa.Array2D(
+                values=np.zeros(self.convolver.pixels_in_mask), mask=self.mask
+            )
+
+        convolved_region = fft.irfft2(
+            fft.rfft2(region, s=self.fft_shape) * self.kernel_fft, s=self.fft_shape
+        )
+
+        y0 = self.kernel_shape[0] // 2
+        x0 = self.kernel_shape[1] // 2
+
+        blurred_region = convolved_region[
+            y0 : y0 + region.shape[0], x0 : x0 + region.shape[1]
+        ]
+
+        return aa.Array2D(values=blurred_region[~self.mask_region], mask=self.mask)
+
+
+def convolver_from(
+    dataset: aa.Imaging, use_fft: bool = False
+) -> Union[aa.Convolver, ConvolverFFT]:
+    """
+    Returns the convolver used to convolve the images of light profiles with the PSF of an imaging dataset, which is
+    either the dataset's real-space `Convolver` or a `ConvolverFFT`.
+
+    The `ConvolverFFT` of a dataset is created once and cached in the dataset's `__dict__`, so that the FFT of its
+    PSF is computed once and reused by every fit. Whether it is used is chosen per fit (via the `use_fft_convolution`
+    input of `FitImaging` and `AnalysisImaging`), not stored on the `Imaging` dataset.
+
+    FFT convolution is only used if it is explicitly requested, because inversions always use the real-space
+    `Convolver` (which also convolves their mapping matrices), so a fit with an inversion which uses FFT convolution
+    convolves its light profile images and mapping matrices via different methods.
+
+    Parameters
+    ----------
+    dataset
+        The imaging dataset whose mask and PSF define the convolution.
+    use_fft
+        Whether to convolve via an FFT, which is faster for large PSFs.
+    """
+    if not use_fft:
+        return dataset.convolver
+
+    if "convolver_fft" not in dataset.__dict__:
+        dataset.__dict__["convolver_fft"] = ConvolverFFT(convolver=dataset.convolver)
+
+    return dataset.__dict__["convolver_fft"]
@@ -0,0 +1,173 @@
+import copy
+import numpy as np
+from typing import Optional
+
+import autoarray as aa
+
+
+def grid_equal_from(grid_0, grid_1) -> bool:
+    """
+    Returns whether two grids (or masks, or `None` values) have the same values.
+
+    Grids which are the same object are equal without their values being compared.
+
+    Parameters
+    ----------
+    grid_0
+        The first grid, which may be `None`.
+    grid_1
+        The second grid, which may be `None`.
+    """
+    if grid_0 is grid_1:
+        return True
+
+    if grid_0 is None or grid_1 is None:
+        return False
+
+    grid_0 = np.asarray(grid_0)
+    grid_1 = np.asarray(grid_1)
+
+    return grid_0.shape == grid_1.shape and np.array_equal(grid_0, grid_1)
+
+
+def mesh_equal_from(mesh_0: aa.AbstractMesh, mesh_1: aa.AbstractMesh) -> bool:
+    """
+    Returns whether two meshes are the same class and have the same parameters (e.g. the `shape` of a
+    `Rectangular` mesh), ignoring their `run_time_dict`.
+
+    Parameters
+    ----------
+    mesh_0
+        The first mesh.
+    mesh_1
+        The second mesh.
+    """
+    if type(mesh_0) is not type(mesh_1):
+        return False
+
+    vars_0 = {
+        key: value for key, value in vars(mesh_0).items() if key != "run_time_dict"
+    }
+    vars_1 = {
+        key: value for key, value in vars(mesh_1).items() if key != "run_time_dict"
+    }
+
+    if vars_0.keys() != vars_1.keys():
+        return False
+
+    return all(
+        np.array_equal(np.asarray(vars_0[key]), np.asarray(vars_1[key]))
+        for key in vars_0
+    )
+
+
+class ReusableMapper:
+    def __init__(
+        self,
+        mapper: aa.AbstractMapper,
+        mask: aa.Mask2D,
+        mesh: aa.AbstractMesh,
+        source_plane_data_grid: aa.type.Grid2DLike,
+        source_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        image_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        adapt_galaxy_image: Optional[aa.Array2D],
+    ):
+        """
+        A mapper created by a fit, stored with the inputs it was created from so that a later fit whose inputs are
+        the same can reuse it instead of creating a new mapper.
+
+        A mapper's mappings between data and mesh pixels, and the mapping matrix computed from them, only depend on
+        the mask, mesh, source-plane data grid, mesh grids and adapt image. A non-linear search which only changes the
+        regularization parameters (or the light profiles of the lens) therefore creates mappers which are identical
+        to those of the previous fit, except for their regularization.
+
+        Parameters
+        ----------
+        mapper
+            The mapper which is reused.
+        mask
+            The mask of the dataset the mapper was created for.
+        mesh
+            The mesh the mapper was created from.
+        source_plane_data_grid
+            The source-plane data grid input into the mapper, before border relocation.
+        source_plane_mesh_grid
+            The source-plane mesh grid input into the mapper, before border relocation.
+        image_plane_mesh_grid
+            The image-plane mesh grid input into the mapper.
+        adapt_galaxy_image
+            The adapt image the mapper was created from, which is compared by identity.
+        """
+        self.mapper = mapper
+        self.mask = mask
+        self.mesh = mesh
+        self.source_plane_data_grid = source_plane_data_grid
+        self.source_plane_mesh_grid = source_plane_mesh_grid
+        self.image_plane_mesh_grid = image_plane_mesh_grid
+        self.adapt_galaxy_image = adapt_galaxy_image
+
+    def matches(
+        self,
+        mask: aa.Mask2D,
+        mesh: aa.AbstractMesh,
+        source_plane_data_grid: aa.type.Grid2DLike,
+        source_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        image_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        adapt_galaxy_image: Optional[aa.Array2D],
+    ) -> bool:
+        """
+        Returns whether a mapper created from the input mask, mesh, grids and adapt image is identical to the stored
+        mapper, apart from its regularization.
+
+        The adapt images are compared by identity, because they are fixed for a model-fit and comparing their values
+        every fit is unnecessary. The cheapest comparisons are performed first, so a mapper which does not match is
+        rejected quickly.
+
+        Parameters
+        ----------
+        mask
+            The mask of the dataset the mapper is created for.
+        mesh
+            The mesh the mapper is created from.
+        source_plane_data_grid
+            The source-plane data grid input into the mapper, before border relocation.
+        source_plane_mesh_grid
+            The source-plane mesh grid input into the mapper, before border relocation.
+        image_plane_mesh_grid
+            The image-plane mesh grid input into the mapper.
+        adapt_galaxy_image
+            The adapt image the mapper is created from.
+        """
+        return (
+            adapt_galaxy_image is self.adapt_galaxy_image
+            and mesh_equal_from(mesh_0=mesh, mesh_1=self.mesh)
+            and grid_equal_from(grid_0=mask, grid_1=self.mask)
+            and grid_equal_from(
+                grid_0=image_plane_mesh_grid, grid_1=self.image_plane_mesh_grid
+            )
+            and grid_equal_from(
+                grid_0=source_plane_mesh_grid, grid_1=self.source_plane_mesh_grid
+            )
+            and grid_equal_from(
+                grid_0=source_plane_data_grid, grid_1=self.source_plane_data_grid
+            )
+        )
+
+    def mapper_from(
+        self, regularization: Optional[aa.AbstractRegularization]
+    ) -> aa.AbstractMapper:
+        """
+        Returns a copy of the stored mapper with a new regularization.
+
+        The copy is shallow, so it shares the mappings and mapping matrix the stored mapper has already computed.
+        The regularization matrix is not stored by the mapper, so it is computed from the new regularization.
+
+        Parameters
+        ----------
+        regularization
+            The regularization of the returned mapper.
+        """
+        mapper = copy.copy(self.mapper)
+        mapper.regularization = regularization
+
+        return mapper
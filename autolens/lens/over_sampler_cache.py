@@ -0,0 +1,50 @@
+import autoarray as aa
+
+from autoarray.operators.over_sampling.abstract import AbstractOverSampler
+from autoarray.operators.over_sampling.abstract import AbstractOverSampling
+
+
+def over_sampler_from(
+    over_sampling: AbstractOverSampling, mask: aa.Mask2D
+) -> AbstractOverSampler:
+    """
+    Returns the over sampler of over sampling settings and a mask, reusing the over sampler created by the previous
+    call if it was created from the same mask and sub-size.
+
+    The over sampler of a grid's uniform over sampling is already cached by autoarray (see `Grid2D.over_sampler`),
+    but the over sampler of its non-uniform over sampling is created from the settings on every call, which computes
+    its over sampled grid. A fit and its visualization over sample the same grid many times, as does every likelihood
+    evaluation of a model-fit.
+
+    The over sampler is therefore stored in the `__dict__` of the over sampling settings, which belong to the
+    dataset, so it is freed with the dataset and only one over sampler is stored for each setting. It is reused if the
+    mask and sub-size are the same objects as those it was created from. Over sampling whose sub-size is updated
+    (e.g. `OverSamplingMagnification`) assigns a new sub-size when it changes, so the over sampler is then recreated.
+
+    Parameters
+    ----------
+    over_sampling
+        The over sampling settings the over sampler is created from.
+    mask
+        The mask the over sampler is created from.
+    """
+    try:
+        mask_cached, sub_size_cached, over_sampler = over_sampling.__dict__[
+            "over_sampler_cached"
+        ]
+    except KeyError:
+        pass
+    else:
+        if mask_cached is mask and sub_size_cached is over_sampling.sub_size:
+            return over_sampler
+
+    over_sampler = over_sampling.over_sampler_from(mask=mask)
+    over_sampler.over_sampled_grid.over_sampling = None
+
+    over_sampling.__dict__["over_sampler_cached"] = (
+        mask,
+        over_sampling.sub_size,
+        over_sampler,
+    )
+
+    return over_sampler
@@ -0,0 +1,211 @@
+import numpy as np
+from typing import Tuple
+
+import autoarray as aa
+import autogalaxy as ag
+
+from autolens import exc
+
+
+def mass_parameters_from(tracer) -> Tuple[Tuple, np.ndarray]:
+    """
+    Returns the parameters of every mass profile of a tracer, as a key describing the redshift and class of every
+    mass profile and the names of its parameters, and an array of the parameter values.
+
+    Two tracers with the same key and parameter values have the same deflection angles and therefore the same
+    magnification.
+
+    Parameters
+    ----------
+    tracer
+        The tracer whose mass profile parameters are returned.
+    """
+    key_list = []
+    value_list = []
+
+    for galaxy in tracer.galaxies_ascending_redshift:
+        for mass in galaxy.cls_list_from(cls=ag.mp.MassProfile):
+            name_list = []
+
+            for name, value in sorted(vars(mass).items()):
+                value = np.asarray(value)
+
+                if value.dtype.kind not in "iuf":
+                    continue
+
+                name_list.append(name)
+                value_list.extend(value.ravel().tolist())
+
+            key_list.append((galaxy.redshift, type(mass), tuple(name_list)))
+
+    return tuple(key_list), np.array(value_list, dtype="float")
+
+
+def coarse_grid_from(mask: aa.Mask2D) -> Tuple[aa.Grid2D, Tuple[slice, slice]]:
+    """
+    Returns a grid of (y,x) coordinates at the centre of every pixel in the smallest rectangle containing the
+    unmasked pixels of a mask, padded by one pixel on every side, and the slices of the (unpadded) rectangle in the
+    mask.
+
+    The grid is not masked, so that finite difference derivatives evaluated on it (e.g. the Jacobian) are correct for
+    every unmasked pixel, including those at the edge of the mask.
+
+    Parameters
+    ----------
+    mask
+        The mask whose unmasked pixels the grid contains.
+    """
+    unmasked = ~np.asarray(mask)
+
+    rows = np.flatnonzero(np.any(unmasked, axis=1))
+    columns = np.flatnonzero(np.any(unmasked, axis=0))
+
+    y_min, y_max = rows[0] - 1, rows[-1] + 2
+    x_min, x_max = columns[0] - 1, columns[-1] + 2
+
+    pixel_scales = mask.pixel_scales
+
+    origin = (
+        mask.origin[0]
+        + ((mask.shape_native[0] - y_min - y_max) / 2.0) * pixel_scales[0],
+        mask.origin[1]
+        + ((x_min + x_max - mask.shape_native[1]) / 2.0) * pixel_scales[1],
+    )
+
+    grid = aa.Grid2D.uniform(
+        shape_native=(y_max - y_min, x_max - x_min),
+        pixel_scales=pixel_scales,
+        origin=origin,
+        over_sampling=aa.OverSamplingUniform(sub_size=1),
+    )
+
+    return grid, (slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1))
+
+
+class OverSamplingMagnification(aa.OverSamplingUniform):
+    def __init__(
+        self,
+        sub_size_list: Tuple[int, ...] = (1, 2, 4, 8),
+        magnification_list: Tuple[float, ...] = (1.5, 3.0, 10.0),
+        mass_rtol: float = 0.0,
+    ):
+        """
+        Over samples the images of lensed sources using a uniform sub-grid whose sub-size in every image pixel is
+        set by the lens model's magnification in that pixel.
+
+        The image of a lensed source only varies rapidly within an image pixel where the magnification is high, near
+        the critical curves, so only these pixels need a high sub-size. Using a high sub-size everywhere multiplies
+        the cost of every image calculation by the sub-size squared.
+
+        Every pixel is given the sub-size of `sub_size_list` whose index is the number of values of
+        `magnification_list` the absolute magnification of the pixel is equal to or above. For example, for the
+        default inputs a pixel with magnification 2.0 has sub-size 2 and a pixel with magnification 50.0 has sub-size
+        8.
+
+        The magnification is computed by a `Tracer` from the Jacobian of its deflection angles, evaluated via finite
+        differences on a coarse grid with one coordinate per image pixel (see `coarse_grid_from`). This calculation
+        is performed by the `over_sample` decorator of the `Tracer`, which calls `update_from` before over sampling
+        a grid. By default, the sub-sizes are recomputed whenever any mass profile parameter changes, so a model-fit
+        which changes only the light profiles does not compute the magnification every likelihood evaluation, and the
+        sub-sizes (and therefore the likelihood) only depend on the mass model being fitted.
+
+        If `mass_rtol` is above zero, the sub-sizes are also kept when every mass profile parameter has changed by at
+        most this fraction of its value when they were last computed. This saves more magnification calculations,
+        but the sub-sizes then depend on the mass models previously fitted, which are different in every process of
+        a parallel model-fit, so the same model can have slightly different likelihoods in different processes.
+
+        Before the sub-sizes are first computed, every pixel uses the first sub-size in `sub_size_list`.
+
+        Parameters
+        ----------
+        sub_size_list
+            The sub-sizes of the pixels, which increase with the magnification.
+        magnification_list
+            The absolute magnifications at and above which a pixel uses the next sub-size in `sub_size_list`.
+        mass_rtol
+            The largest change of any mass profile parameter, relative to its value when the sub-sizes were last
+            computed, for which the sub-sizes are not recomputed. Zero means they are recomputed whenever a parameter
+            changes.
+        """
+        if len(sub_size_list) != len(magnification_list) + 1:
+            raise exc.GridException(
+                "The sub_size_list of an OverSamplingMagnification must have one more entry than its "
+                "magnification_list."
+            )
+
+        super().__init__(sub_size=sub_size_list[0])
+
+        self.sub_size_list = list(sub_size_list)
+        self.magnification_list = list(magnification_list)
+        self.mass_rtol = mass_rtol
+
+        self.mask = None
+        self.mass_key = None
+        self.mass_values = None
+
+        self.total_updates = 0
+
+    def sub_size_from(self, tracer, mask: aa.Mask2D) -> aa.Array2D:
+        """
+        Returns the sub-size of every unmasked pixel of a mask, computed from the magnification of a tracer.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose magnification sets the sub-sizes.
+        mask
+            The mask whose unmasked pixels the sub-sizes are computed for.
+        """
+        grid, slices = coarse_grid_from(mask=mask)
+
+        magnification = np.asarray(tracer.magnification_2d_from(grid=grid).native)
+
+        magnification = magnification[1:-1, 1:-1][~np.asarray(mask)[slices]]
+
+        sub_size_index = np.searchsorted(
+            self.magnification_list, np.abs(magnification), side="right"
+        )
+
+        return aa.Array2D(
+            values=np.array(self.sub_size_list)[sub_size_index], mask=mask
+        )
+
+    def update_from(self, tracer, mask: aa.Mask2D):
+        """
+        Recompute the sub-sizes from the magnification of a tracer, unless they were computed for the same mask and
+        mass profiles whose parameters are equal to those of the tracer, or differ by at most `mass_rtol` times their
+        value.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose magnification sets the sub-sizes.
+        mask
+            The mask whose unmasked pixels the sub-sizes are computed for.
+        """
+        mass_key, mass_values = mass_parameters_from(tracer=tracer)
+
+        if (
+            self.mask is not None
+            and mass_key == self.mass_key
+            and np.all(
+                np.abs(mass_values - self.mass_values)
+                <= self.mass_rtol * np.abs(self.mass_values)
+            )
+            and (
+                self.mask is mask
+                or (
+                    self.mask.shape == mask.shape
+                    and np.array_equal(self.mask, mask)
+                )
+            )
+        ):
+            return
+
+        self.sub_size = self.sub_size_from(tracer=tracer, mask=mask)
+
+        self.mask = mask
+        self.mass_key = mass_key
+        self.mass_values = mass_values
+
+        self.total_updates += 1
@@ -10,6 +10,7 @@ import autogalaxy as ag
 from autoarray.inversion.inversion.factory import inversion_from
 
 from autolens.analysis.preloads import Preloads
+from autolens.lens.mapper_reuse import ReusableMapper
 
 
 class TracerToInversion(ag.AbstractToInversion):
@@ -62,6 +63,8 @@ class TracerToInversion(ag.AbstractToInversion):
         """
         self.tracer = tracer
 
+        self.reusable_mapper_list = []
+
         super().__init__(
             dataset=dataset,
             adapt_images=adapt_images,
@@ -151,6 +154,11 @@ class TracerToInversion(ag.AbstractToInversion):
         The `LightProfileLinearObjFuncList` object contains the attributes (e.g. the data `grid` after ray tracing,
         `light_profiles`) and functionality (e.g. a `mapping_matrix` method) that are required to perform the inversion.
 
+        Grids are only ray-traced to the highest redshift plane with a linear light profile. For example, for a lens
+        galaxy whose light is a linear multi Gaussian expansion and a source galaxy with a pixelization, only the
+        image-plane grids are required, which the tracer has already memoised when computing the image of the lens
+        galaxy's other light profiles, so no deflection angles are computed.
+
         This function first creates a dictionary of linear light profiles associated with each galaxy for each plane,
         and then does the same for all `Basis` objects. The two dictionaries are then combined and returned.
 
@@ -161,6 +169,13 @@ class TracerToInversion(ag.AbstractToInversion):
         if not self.tracer.perform_inversion:
             return {}
 
+        plane_indexes = self.tracer.plane_indexes_with_linear_light_profiles
+
+        if len(plane_indexes) == 0:
+            return {}
+
+        plane_index_limit = max(plane_indexes)
+
         lp_linear_galaxy_dict_list = {}
 
         perform_over_sampling = aa.perform_over_sampling_from(
@@ -172,7 +187,7 @@ class TracerToInversion(ag.AbstractToInversion):
             grid_input.over_sampling = None
 
             traced_grids_of_planes_list = self.tracer.traced_grid_2d_list_from(
-                grid=grid_input
+                grid=grid_input, plane_index_limit=plane_index_limit
             )
 
             traced_grids_of_planes_list = [
@@ -186,19 +201,19 @@ class TracerToInversion(ag.AbstractToInversion):
 
         else:
             traced_grids_of_planes_list = self.tracer.traced_grid_2d_list_from(
-                grid=self.dataset.grids.uniform
+                grid=self.dataset.grids.uniform, plane_index_limit=plane_index_limit
             )
 
         if self.dataset.grids.blurring is not None:
             traced_blurring_grids_of_planes_list = self.tracer.traced_grid_2d_list_from(
-                grid=self.dataset.grids.blurring
+                grid=self.dataset.grids.blurring, plane_index_limit=plane_index_limit
             )
         else:
             traced_blurring_grids_of_planes_list = [None] * len(
                 traced_grids_of_planes_list
             )
 
-        for plane_index, galaxies in enumerate(self.planes):
+        for plane_index in plane_indexes:
             grids = aa.GridsInterface(
                 uniform=traced_grids_of_planes_list[plane_index],
                 blurring=traced_blurring_grids_of_planes_list[plane_index],
@@ -215,7 +230,7 @@ class TracerToInversion(ag.AbstractToInversion):
 
             galaxies_to_inversion = ag.GalaxiesToInversion(
                 dataset=dataset,
-                galaxies=galaxies,
+                galaxies=self.planes[plane_index],
                 settings_inversion=self.settings_inversion,
                 adapt_images=self.adapt_images,
                 run_time_dict=self.run_time_dict,
@@ -330,6 +345,10 @@ class TracerToInversion(ag.AbstractToInversion):
         The notation `_pg_` stands for `plane galaxy`, and indicates that the objects are grouped by plane
         after being extracted from galaxies in the tracer.
 
+        If the preloads have an `image_mesh_cache`, image-plane mesh grids which have been computed before from the
+        same image mesh parameters, mask, adapt image and settings are taken from it instead of being computed again
+        (see `ImageMeshCache`).
+
         Returns
         -------
             The list of lists of image-plane mesh grids grouped by plane.
@@ -337,6 +356,8 @@ class TracerToInversion(ag.AbstractToInversion):
 
         image_plane_mesh_grid_list_of_planes = []
 
+        image_mesh_cache = self.preloads.image_mesh_cache
+
         for galaxies in self.planes:
             to_inversion = ag.GalaxiesToInversion(
                 dataset=self.dataset,
@@ -346,7 +367,14 @@ class TracerToInversion(ag.AbstractToInversion):
                 run_time_dict=self.run_time_dict,
             )
 
-            image_plane_mesh_grid_list = to_inversion.image_plane_mesh_grid_list
+            if image_mesh_cache is None:
+                image_plane_mesh_grid_list = to_inversion.image_plane_mesh_grid_list
+            else:
+                with image_mesh_cache.image_meshes_cached_in(galaxies=galaxies):
+                    image_plane_mesh_grid_list = (
+                        to_inversion.image_plane_mesh_grid_list
+                    )
+
             image_plane_mesh_grid_list_of_planes.append(image_plane_mesh_grid_list)
 
         return image_plane_mesh_grid_list_of_planes
@@ -423,6 +451,10 @@ class TracerToInversion(ag.AbstractToInversion):
         set up the `Mapper` objects (e.g. compute the `image_plane_mesh_grid`), and then associates each `Mapper`
         with the galaxy it belongs to.
 
+        The pixelizations of every plane are extracted once, and the mappers of every plane with a pixelization are
+        created in one pass over these planes. Mappers of a previous fit with the same inputs are reused (see
+        `mapper_from`).
+
         Returns
         -------
         A dictionary associating each `Mapper` object with the galaxy it belongs to.
@@ -448,53 +480,121 @@ class TracerToInversion(ag.AbstractToInversion):
             )
             image_plane_mesh_grid_list = self.preloads.image_plane_mesh_grid_list
 
-        for plane_index, galaxies in enumerate(self.planes):
-            if galaxies.has(cls=aa.Pixelization):
-                to_inversion = ag.GalaxiesToInversion(
-                    dataset=self.dataset,
-                    galaxies=galaxies,
-                    preloads=self.preloads,
-                    adapt_images=self.adapt_images,
-                    settings_inversion=self.settings_inversion,
-                    run_time_dict=self.run_time_dict,
-                )
+        pixelization_pg_list = self.cls_pg_list_from(cls=aa.Pixelization)
 
-                galaxies_with_pixelization_list = galaxies.galaxies_with_cls_list_from(
-                    cls=aa.Pixelization
+        to_inversion = ag.GalaxiesToInversion(
+            dataset=self.dataset,
+            galaxies=self.tracer.galaxies,
+            preloads=self.preloads,
+            adapt_images=self.adapt_images,
+            settings_inversion=self.settings_inversion,
+            run_time_dict=self.run_time_dict,
+        )
+
+        for plane_index in self.tracer.plane_indexes_with_pixelizations:
+            galaxies_with_pixelization_list = self.planes[
+                plane_index
+            ].galaxies_with_cls_list_from(cls=aa.Pixelization)
+
+            for mapper_index, pixelization in enumerate(
+                pixelization_pg_list[plane_index]
+            ):
+                try:
+                    adapt_galaxy_image = self.adapt_galaxy_image_pg_list[plane_index][
+                        mapper_index
+                    ]
+                except AttributeError:
+                    adapt_galaxy_image = None
+
+                mapper = self.mapper_from(
+                    to_inversion=to_inversion,
+                    mesh=pixelization.mesh,
+                    regularization=pixelization.regularization,
+                    source_plane_data_grid=traced_grids_of_planes_list[plane_index],
+                    source_plane_mesh_grid=traced_mesh_grids_list_of_planes[
+                        plane_index
+                    ][mapper_index],
+                    image_plane_mesh_grid=image_plane_mesh_grid_list[plane_index][
+                        mapper_index
+                    ],
+                    adapt_galaxy_image=adapt_galaxy_image,
                 )
 
-                for mapper_index in range(
-                    len(traced_mesh_grids_list_of_planes[plane_index])
-                ):
-                    pixelization_list = self.cls_pg_list_from(cls=aa.Pixelization)
+                mapper_galaxy_dict[mapper] = galaxies_with_pixelization_list[
+                    mapper_index
+                ]
 
-                    try:
-                        adapt_galaxy_image = self.adapt_galaxy_image_pg_list[
-                            plane_index
-                        ][mapper_index]
-                    except AttributeError:
-                        adapt_galaxy_image = None
-
-                    mapper = to_inversion.mapper_from(
-                        mesh=pixelization_list[plane_index][mapper_index].mesh,
-                        regularization=pixelization_list[plane_index][
-                            mapper_index
-                        ].regularization,
-                        source_plane_data_grid=traced_grids_of_planes_list[plane_index],
-                        source_plane_mesh_grid=traced_mesh_grids_list_of_planes[
-                            plane_index
-                        ][mapper_index],
-                        image_plane_mesh_grid=image_plane_mesh_grid_list[plane_index][
-                            mapper_index
-                        ],
-                        adapt_galaxy_image=adapt_galaxy_image,
-                    )
+        return mapper_galaxy_dict
 
-                    galaxy = galaxies_with_pixelization_list[mapper_index]
+    def mapper_from(
+        self,
+        to_inversion: ag.GalaxiesToInversion,
+        mesh: aa.AbstractMesh,
+        regularization: aa.AbstractRegularization,
+        source_plane_data_grid: aa.type.Grid2DLike,
+        source_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        image_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        adapt_galaxy_image: Optional[aa.Array2D],
+    ) -> aa.AbstractMapper:
+        """
+        Returns a `Mapper` object from the attributes required to create one, which is created via the `mapper_from`
+        method of `GalaxiesToInversion` in PyAutoGalaxy unless a mapper of a previous fit can be reused.
 
-                    mapper_galaxy_dict[mapper] = galaxy
+        The preloads may contain the mappers of the previous fit of a model-fit (see `ReusableMapper`). If one of
+        these mappers was created from the same mask, mesh, source-plane data grid, mesh grids and adapt image, it
+        is reused with the input regularization, so that its mappings and mapping matrix are not computed again. This
+        is the case when a non-linear search changes only the regularization or light profile parameters of a model.
 
-        return mapper_galaxy_dict
+        Every mapper is stored in the `reusable_mapper_list` of this object, so that the next fit can reuse it.
+
+        Parameters
+        ----------
+        to_inversion
+            The object which creates the mapper if no mapper of a previous fit is reused.
+        mesh
+            The mesh of the pixelization, which defines the pixels used to reconstruct the data (e.g. `Voronoi`).
+        regularization
+            The regularization scheme used to regularize the mesh pixel's reconstructed fluxes.
+        source_plane_data_grid
+            The ray-traced coordinates of the image-plane pixels which align with the image data.
+        source_plane_mesh_grid
+            The mesh-grid of the source-plane which reconstructs the data (e.g. the centre of the `Voronoi` cells
+            after lensing).
+        image_plane_mesh_grid
+            The mesh-grid of the image-plane, which is only used if the pixelization has an `image_mesh`.
+        adapt_galaxy_image
+            The image which certain pixelizations use to adapt their properties to the dataset.
+
+        Returns
+        -------
+        A `Mapper` object which maps the dataset's data to the pixelization's mesh.
+        """
+        input_dict = {
+            "mask": self.dataset.mask,
+            "mesh": mesh,
+            "source_plane_data_grid": source_plane_data_grid,
+            "source_plane_mesh_grid": source_plane_mesh_grid,
+            "image_plane_mesh_grid": image_plane_mesh_grid,
+            "adapt_galaxy_image": adapt_galaxy_image,
+        }
+
+        for reusable_mapper in self.preloads.reusable_mapper_list or []:
+            if reusable_mapper.matches(**input_dict):
+                mapper = reusable_mapper.mapper_from(regularization=regularization)
+                break
+        else:
+            mapper = to_inversion.mapper_from(
+                mesh=mesh,
+                regularization=regularization,
+                source_plane_data_grid=source_plane_data_grid,
+                source_plane_mesh_grid=source_plane_mesh_grid,
+                image_plane_mesh_grid=image_plane_mesh_grid,
+                adapt_galaxy_image=adapt_galaxy_image,
+            )
+
+        self.reusable_mapper_list.append(ReusableMapper(mapper=mapper, **input_dict))
+
+        return mapper
 
     @cached_property
     def inversion(self):
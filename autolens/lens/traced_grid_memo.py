@@ -0,0 +1,129 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+import autoarray as aa
+
+
+class TracedGridMemo:
+    def __init__(self, max_entries: int = 8, run_time_dict: Optional[Dict] = None):
+        """
+        Memoises the ray-traced grids a `Tracer` computes during one fit, so that every set of coordinates is
+        ray-traced once per likelihood evaluation.
+
+        A fit ray-traces the same coordinates more than once. For example, a `FitImaging` traces the over sampled
+        grid and the blurring grid to compute the image of its light profiles, traces them again to compute the
+        mapping matrices of its linear light profiles, and traces the over sampled grid of the pixelization to
+        set up its mappers, which for uniform over sampling has the same coordinates as the over sampled grid.
+
+        Traced grids are looked up by the identity of the grid which is ray-traced, or if it is a different object by
+        its (y,x) coordinates being equal to those of a grid which has already been traced, which is much cheaper
+        than ray-tracing them. Traced grids computed up to a `plane_index_limit` are reused by requests which trace
+        to the same or a lower plane.
+
+        At most `max_entries` traced grids are stored, with the oldest removed first, so that a tracer which is
+        used for many different grids (e.g. by a point solver) does not store all of them.
+
+        If a `run_time_dict` is input, the time spent ray-tracing grids which are added to the memo is added to its
+        `traced_grid_memo_ray_tracing` entry, and the time each memoised grid took to ray-trace is added to its
+        `traced_grid_memo_saved` entry every time the grid is reused, so that profiling a likelihood function shows
+        the ray-tracing the memo saves.
+
+        Parameters
+        ----------
+        max_entries
+            The maximum number of traced grids which are stored.
+        run_time_dict
+            A dictionary which if input records the time spent ray-tracing grids and the time saved by reusing them.
+        """
+        self.max_entries = max_entries
+        self.run_time_dict = run_time_dict
+
+        if run_time_dict is not None:
+            run_time_dict.setdefault("traced_grid_memo_ray_tracing", 0.0)
+            run_time_dict.setdefault("traced_grid_memo_saved", 0.0)
+
+        self.entry_list = []
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entry_list)
+
+    def traced_grid_list_from(
+        self, grid: aa.type.Grid2DLike, plane_index_limit: Optional[int] = None
+    ) -> Optional[List[aa.type.Grid2DLike]]:
+        """
+        Returns the traced grids of a grid which has already been ray-traced, or `None` if it has not.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates which are ray-traced.
+        plane_index_limit
+            The integer index of the last plane which is ray-traced, where `None` means all planes are ray-traced.
+        """
+        grid_array = np.asarray(grid)
+
+        for (
+            entry_grid,
+            entry_plane_index_limit,
+            traced_grid_list,
+            run_time,
+        ) in self.entry_list:
+            if entry_plane_index_limit is not None and (
+                plane_index_limit is None
+                or plane_index_limit > entry_plane_index_limit
+            ):
+                continue
+
+            if entry_grid is not grid_array and (
+                entry_grid.shape != grid_array.shape
+                or not np.array_equal(entry_grid, grid_array)
+            ):
+                continue
+
+            self.hits += 1
+
+            if self.run_time_dict is not None:
+                self.run_time_dict["traced_grid_memo_saved"] += run_time
+
+            if plane_index_limit is None:
+                return traced_grid_list
+
+            return traced_grid_list[: plane_index_limit + 1]
+
+        self.misses += 1
+
+        return None
+
+    def add(
+        self,
+        grid: aa.type.Grid2DLike,
+        plane_index_limit: Optional[int],
+        traced_grid_list: List[aa.type.Grid2DLike],
+        run_time: float = 0.0,
+    ):
+        """
+        Store the traced grids of a grid, removing the oldest traced grids if more than `max_entries` are stored.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates which were ray-traced.
+        plane_index_limit
+            The integer index of the last plane which was ray-traced, where `None` means all planes were ray-traced.
+        traced_grid_list
+            The traced grids of every plane up to the `plane_index_limit`.
+        run_time
+            The time in seconds it took to ray-trace the grid.
+        """
+        self.entry_list.append(
+            (np.asarray(grid), plane_index_limit, traced_grid_list, run_time)
+        )
+
+        if self.run_time_dict is not None:
+            self.run_time_dict["traced_grid_memo_ray_tracing"] += run_time
+
+        if len(self.entry_list) > self.max_entries:
+            self.entry_list.pop(0)
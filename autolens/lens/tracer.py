@@ -1,8 +1,12 @@
 from abc import ABC
+import copy
 import numpy as np
 from functools import wraps
+import time
 from scipy.interpolate import griddata
-from typing import Dict, List, Optional, Type, Union
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+
+from autoconf import cached_property
 
 import autofit as af
 import autoarray as aa
@@ -11,7 +15,11 @@ import autogalaxy as ag
 from autogalaxy.profiles.geometry_profiles import GeometryProfile
 from autogalaxy.profiles.light.snr import LightProfileSNR
 
+from autolens.lens import convolution
 from autolens.lens import tracer_util
+from autolens.lens import over_sampler_cache
+from autolens.lens.over_sampling_magnification import OverSamplingMagnification
+from autolens.lens.traced_grid_memo import TracedGridMemo
 
 
 def over_sample(func):
@@ -19,6 +27,13 @@ def over_sample(func):
     Homogenize the inputs and outputs of functions that take 1D or 2D grids of coordinates and return a 1D ndarray
     which is converted to an `Array2D`, `ArrayIrregular` or `Array1D` object.
 
+    Uniform over sampling uses the over sampler cached by the grid (`Grid2D.over_sampler`). Non-uniform over sampling,
+    which autoarray does not cache, reuses the over sampler stored on its settings by
+    `over_sampler_cache.over_sampler_from`, so it is created once for every mask and sub-size.
+
+    If the over sampling is an `OverSamplingMagnification`, its sub-sizes are updated from the magnification of the
+    tracer before the grid is over sampled.
+
     Parameters
     ----------
     func
@@ -59,19 +74,30 @@ def over_sample(func):
                 grid.over_sampling_non_uniform is not None
                 and obj.upper_plane_index_with_light_profile > 0
             ):
-                over_sampler = grid.over_sampling_non_uniform.over_sampler_from(
-                    mask=grid.mask
-                )
-                grid_input = over_sampler.over_sampled_grid
-                grid_input.over_sampling = None
+                over_sampling = grid.over_sampling_non_uniform
+                over_sampler_used = True
+
+            elif isinstance(grid.over_sampling, OverSamplingMagnification):
+                over_sampling = grid.over_sampling
                 over_sampler_used = True
 
             elif isinstance(grid.over_sampling, aa.OverSamplingUniform):
+                over_sampling = None
                 over_sampler = grid.over_sampler
-                grid_input = over_sampler.over_sampled_grid
-                grid_input.over_sampling = None
                 over_sampler_used = True
 
+        if over_sampler_used:
+            if over_sampling is not None:
+                if isinstance(over_sampling, OverSamplingMagnification):
+                    over_sampling.update_from(tracer=obj, mask=grid.mask)
+
+                over_sampler = over_sampler_cache.over_sampler_from(
+                    over_sampling=over_sampling, mask=grid.mask
+                )
+
+            grid_input = over_sampler.over_sampled_grid
+            grid_input.over_sampling = None
+
         result = func(obj, grid_input, *args, **kwargs)
 
         if over_sampler_used:
@@ -133,13 +159,76 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             different calculations.
         """
 
+        self.traced_grid_memo = None
+
         self.galaxies = galaxies
 
         self.cosmology = cosmology
 
         self.run_time_dict = run_time_dict
 
+    def copy_with_traced_grid_memo(self) -> "Tracer":
+        """
+        Returns a shallow copy of the tracer which memoises the grids it ray-traces, so that a grid (or a grid with the
+        same coordinates) which is ray-traced again is taken from the memo instead of being ray-traced again (see
+        `TracedGridMemo`).
+
+        Fits call this for the tracer they fit, because they ray-trace the same coordinates for their light
+        profiles, linear light profiles and pixelizations. The copy shares the galaxies of this tracer but has its own
+        memo, which therefore lives only as long as the fit. This tracer is not changed, so a later fit of it (e.g.
+        after the mass profiles of its galaxies are changed in-place) ray-traces its grids again.
+
+        If the tracer has a `run_time_dict`, the time spent ray-tracing and the time saved by the memo are recorded in
+        it.
+        """
+        tracer = copy.copy(self)
+        tracer.traced_grid_memo = TracedGridMemo(run_time_dict=self.run_time_dict)
+
+        return tracer
+
     @property
+    def galaxies(self) -> Union[List[ag.Galaxy], af.ModelInstance]:
+        """
+        The galaxies which make up the gravitational lensing ray-tracing system, in their input order.
+
+        Setting the galaxies resets the cached plane layout of the tracer (see `invalidate_planes`).
+        """
+        return self._galaxies
+
+    @galaxies.setter
+    def galaxies(self, galaxies: Union[List[ag.Galaxy], af.ModelInstance]):
+        self._galaxies = galaxies
+        self.invalidate_planes()
+
+    def invalidate_planes(self):
+        """
+        Reset the cached plane layout of the tracer, so that it is recomputed the next time it is accessed.
+
+        The galaxies in ascending redshift order, the plane redshifts, the planes and the index of the highest redshift
+        plane with a light profile are computed once per tracer and cached, because they are accessed many times
+        (often inside loops over planes) in every likelihood evaluation.
+
+        The cache is not aware of changes made to the galaxies after the tracer is created. If the `redshift` of a
+        galaxy in the tracer is changed (or light profiles are added to or removed from a galaxy), this function must
+        be called so that the planes are regrouped.
+
+        The traced grids memoised by the tracer (see `copy_with_traced_grid_memo`) are also removed.
+        """
+        if getattr(self, "traced_grid_memo", None) is not None:
+            self.traced_grid_memo = TracedGridMemo(
+                max_entries=self.traced_grid_memo.max_entries,
+                run_time_dict=self.traced_grid_memo.run_time_dict,
+            )
+
+        for attr in (
+            "galaxies_ascending_redshift",
+            "plane_redshifts",
+            "planes",
+            "upper_plane_index_with_light_profile",
+        ):
+            self.__dict__.pop(attr, None)
+
+    @cached_property
     def galaxies_ascending_redshift(self) -> List[ag.Galaxy]:
         """
         Returns the galaxies in the tracer in ascending redshift order.
@@ -154,7 +243,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         """
         return sorted(self.galaxies, key=lambda galaxy: galaxy.redshift)
 
-    @property
+    @cached_property
     def plane_redshifts(self) -> List[float]:
         """
         Returns a list of plane redshifts from a list of galaxies, using the redshifts of the galaxies to determine the
@@ -180,7 +269,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             galaxies=self.galaxies_ascending_redshift
         )
 
-    @property
+    @cached_property
     def planes(self) -> List[List[ag.Galaxy]]:
         """
         Returns a list of list of galaxies grouped into their planes, where planes contained all galaxies at the same
@@ -204,6 +293,10 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             The redshifts of the planes, which are used to group the galaxies into their respective planes. If not input,
             the redshifts of the galaxies are used to determine the unique redshifts of the planes.
 
+        The planes are computed once and cached, because they are accessed many times in every likelihood
+        evaluation. If the redshifts of the galaxies are changed after the tracer is created, `invalidate_planes`
+        must be called to regroup them.
+
         Returns
         -------
         The list of list of galaxies grouped into their planes.
@@ -326,6 +419,9 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
         see `autolens.lens.tracer.tracer_util.traced_grid_2d_list_from()` for the full calculation.
 
+        If the tracer memoises its traced grids (see `copy_with_traced_grid_memo`) and the grid has already been
+        traced, the memoised traced grids are returned.
+
         Parameters
         ----------
         grid
@@ -340,14 +436,40 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             A list of 2D (y,x) grids each of which are the input grid ray-traced to a redshift of the input list of
             planes.
         """
+        if not isinstance(plane_index_limit, int):
+            plane_index_limit = None
 
-        return tracer_util.traced_grid_2d_list_from(
+        use_memo = (
+            grid is not None and getattr(self, "traced_grid_memo", None) is not None
+        )
+
+        if use_memo:
+            traced_grid_list = self.traced_grid_memo.traced_grid_list_from(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+
+            if traced_grid_list is not None:
+                return traced_grid_list
+
+        start = time.perf_counter()
+
+        traced_grid_list = tracer_util.traced_grid_2d_list_from(
             planes=self.planes,
             grid=grid,
             cosmology=self.cosmology,
             plane_index_limit=plane_index_limit,
         )
 
+        if use_memo:
+            self.traced_grid_memo.add(
+                grid=grid,
+                plane_index_limit=plane_index_limit,
+                traced_grid_list=traced_grid_list,
+                run_time=time.perf_counter() - start,
+            )
+
+        return traced_grid_list
+
     def grid_2d_at_redshift_from(
         self, grid: aa.type.Grid2DLike, redshift: float
     ) -> aa.type.Grid2DLike:
@@ -398,7 +520,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             cosmology=self.cosmology,
         )
 
-    @property
+    @cached_property
     def upper_plane_index_with_light_profile(self) -> int:
         """
         Returns the index of the highest redshift plane in the tracer which has a light profile.
@@ -781,12 +903,22 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
     @over_sample
     def galaxy_image_2d_dict_from(
-        self, grid: aa.type.Grid2DLike, operated_only: Optional[bool] = None
+        self,
+        grid: aa.type.Grid2DLike,
+        operated_only: Optional[bool] = None,
+        galaxy_list: Optional[List[ag.Galaxy]] = None,
     ) -> Dict[ag.Galaxy, np.ndarray]:
         """
         Returns a dictionary associating every `Galaxy` object in the `Tracer` with its corresponding 2D image, using
         the instance of each galaxy as the dictionary keys.
 
+        The grid is only ray-traced up to the highest redshift plane with a light profile, because the galaxies in
+        planes above it have no light profiles and their images are zeros, which are computed on the input grid.
+
+        If a `galaxy_list` is input, only the images of these galaxies are computed and returned, and the grid is
+        only ray-traced up to the highest redshift plane containing one of them. This is used to compute the images
+        of only the galaxies whose images are not cached (e.g. by a `GalaxyVisibilitiesCache`).
+
         This object is used for adaptive-features, which use the image of each galaxy in a model-fit in order to
         adapt quantities like a pixelization or regularization scheme to the surface brightness of the galaxies being
         fitted.
@@ -799,6 +931,11 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         ----------
         grid
             The 2D (y,x) coordinates of the (masked) grid, in its original geometric reference frame.
+        operated_only
+            Whether to only include light profiles which are or are not already operated on (e.g. convolved with a
+            PSF), which is passed to the `image_2d_from` function of every galaxy.
+        galaxy_list
+            The galaxies whose images are computed, where all galaxies are included if this is `None`.
 
         Returns
         -------
@@ -807,13 +944,36 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
         galaxy_image_2d_dict = dict()
 
-        traced_grid_list = self.traced_grid_2d_list_from(grid=grid)
+        planes = self.planes
+
+        if galaxy_list is not None:
+            galaxy_id_set = {id(galaxy) for galaxy in galaxy_list}
+
+            planes = [
+                [galaxy for galaxy in galaxies if id(galaxy) in galaxy_id_set]
+                for galaxies in planes
+            ]
+
+        plane_index_limit = max(
+            [0]
+            + [plane_index for plane_index, galaxies in enumerate(planes) if galaxies]
+        )
+
+        traced_grid_list = self.traced_grid_2d_list_from(
+            grid=grid,
+            plane_index_limit=min(
+                plane_index_limit, self.upper_plane_index_with_light_profile
+            ),
+        )
+
+        for plane_index, galaxies in enumerate(planes):
+            if plane_index < len(traced_grid_list):
+                traced_grid = traced_grid_list[plane_index]
+            else:
+                traced_grid = grid
 
-        for plane_index, galaxies in enumerate(self.planes):
             image_2d_list = [
-                galaxy.image_2d_from(
-                    grid=traced_grid_list[plane_index], operated_only=operated_only
-                )
+                galaxy.image_2d_from(grid=traced_grid, operated_only=operated_only)
                 for galaxy in galaxies
             ]
 
@@ -822,6 +982,94 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
         return galaxy_image_2d_dict
 
+    def _blurred_image_2d_from(
+        self,
+        image_2d: aa.Array2D,
+        blurring_image_2d: aa.Array2D,
+        psf: Optional[aa.Kernel2D],
+        convolver: Union[aa.Convolver, convolution.ConvolverFFT],
+    ) -> aa.Array2D:
+        """
+        Convolve an image and its blurring image with a PSF, `Convolver` or `ConvolverFFT`.
+
+        If a convolver is used, the convolution is performed via the `convolve_via_convolver` method, which for a
+        `Convolver` only convolves the region of the image containing non-zero flux and for a `ConvolverFFT`
+        convolves via an FFT.
+
+        Parameters
+        ----------
+        image_2d
+            The image of pixels in the mask which is convolved.
+        blurring_image_2d
+            The image of pixels outside the mask whose light is blurred into the mask.
+        psf
+            The PSF the image is convolved with.
+        convolver
+            The convolver the image is convolved with if a PSF is not input.
+        """
+        if psf is None and convolver is not None:
+            return self.convolve_via_convolver(
+                image=image_2d, blurring_image=blurring_image_2d, convolver=convolver
+            )
+
+        return super()._blurred_image_2d_from(
+            image_2d=image_2d,
+            blurring_image_2d=blurring_image_2d,
+            psf=psf,
+            convolver=convolver,
+        )
+
+    def galaxy_blurred_image_2d_dict_from(
+        self,
+        grid: aa.Grid2D,
+        convolver: Union[aa.Convolver, convolution.ConvolverFFT],
+        blurring_grid: aa.Grid2D,
+    ) -> Dict[ag.Galaxy, aa.Array2D]:
+        """
+        Returns a dictionary associating every `Galaxy` object in the `Tracer` with its corresponding 2D image
+        convolved with a PSF, using the instance of each galaxy as the dictionary keys.
+
+        Every image is convolved via the `convolve_via_convolver` method, which for a `Convolver` only convolves the
+        region of the image containing non-zero flux, such that galaxies without light profiles (e.g. the lens
+        galaxy's mass) or whose light is confined to a small region of the mask (e.g. a compact lensed source) are
+        convolved quickly, and for a `ConvolverFFT` convolves via an FFT.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y,x) coordinates of the (masked) grid, in its original geometric reference frame.
+        convolver
+            The convolver every galaxy image is convolved with.
+        blurring_grid
+            The 2D (y,x) coordinates neighboring the (masked) grid whose light is blurred into the image.
+        """
+        galaxy_image_2d_not_operated_dict = self.galaxy_image_2d_dict_from(
+            grid=grid, operated_only=False
+        )
+
+        galaxy_blurring_image_2d_not_operated_dict = self.galaxy_image_2d_dict_from(
+            grid=blurring_grid, operated_only=False
+        )
+
+        galaxy_image_2d_operated_dict = self.galaxy_image_2d_dict_from(
+            grid=grid, operated_only=True
+        )
+
+        galaxy_blurred_image_2d_dict = {}
+
+        for galaxy_key in galaxy_image_2d_not_operated_dict.keys():
+            blurred_image_2d = self.convolve_via_convolver(
+                image=galaxy_image_2d_not_operated_dict[galaxy_key],
+                blurring_image=galaxy_blurring_image_2d_not_operated_dict[galaxy_key],
+                convolver=convolver,
+            )
+
+            galaxy_blurred_image_2d_dict[galaxy_key] = (
+                galaxy_image_2d_operated_dict[galaxy_key] + blurred_image_2d
+            )
+
+        return galaxy_blurred_image_2d_dict
+
     @aa.grid_dec.to_vector_yx
     def deflections_yx_2d_from(
         self, grid: aa.type.Grid2DLike
@@ -916,6 +1164,63 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
         return traced_grids_list[plane_i] - traced_grids_list[plane_j]
 
+    def hessian_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        buffer: float = 0.01,
+        deflections_func: Optional[Callable] = None,
+    ) -> Tuple:
+        """
+        Returns the Hessian of the tracer, where the Hessian is the second partial derivatives of the potential,
+        computed by evaluating the deflection angles around every (y,x) coordinate in four directions (positive y,
+        negative y, negative x, positive x).
+
+        This overrides the autogalaxy calculation, which computes the deflection angles of the four shifted grids
+        in four separate calls. The four shifted grids are instead stacked into one grid, so the deflection angles
+        are computed in one call. For multi-plane ray-tracing this performs the ray-tracing between all planes once
+        rather than four times.
+
+        This calculation is used by every magnification, convergence and shear computed via the Hessian, for example
+        by `FitFluxes` and by the `PointSolver` when it removes low magnification images.
+
+        Parameters
+        ----------
+        grid
+            The 2D grid of (y,x) arc-second coordinates the deflection angles and Hessian are computed on.
+        buffer
+            The spacing in the y and x directions around each grid coordinate where deflection angles are computed and
+            used to estimate the derivative.
+        deflections_func
+            The function which computes the deflection angles, which defaults to the deflection angles of the tracer.
+        """
+        if deflections_func is None:
+            deflections_func = self.deflections_yx_2d_from
+
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        shifts = np.array(
+            [[buffer, 0.0], [-buffer, 0.0], [0.0, -buffer], [0.0, buffer]]
+        )
+
+        grid_shifted = (grid[np.newaxis, :, :] + shifts[:, np.newaxis, :]).reshape(
+            -1, 2
+        )
+
+        deflections = np.asarray(
+            deflections_func(grid=aa.Grid2DIrregular(values=grid_shifted))
+        ).reshape(4, -1, 2)
+
+        deflections_up, deflections_down, deflections_left, deflections_right = (
+            deflections
+        )
+
+        hessian_yy = 0.5 * (deflections_up[:, 0] - deflections_down[:, 0]) / buffer
+        hessian_xy = 0.5 * (deflections_up[:, 1] - deflections_down[:, 1]) / buffer
+        hessian_yx = 0.5 * (deflections_right[:, 0] - deflections_left[:, 0]) / buffer
+        hessian_xx = 0.5 * (deflections_right[:, 1] - deflections_left[:, 1]) / buffer
+
+        return hessian_yy, hessian_xy, hessian_yx, hessian_xx
+
     @aa.grid_dec.to_array
     def convergence_2d_from(self, grid: aa.type.Grid2DLike) -> aa.Array2D:
         """
@@ -1019,6 +1324,18 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             if plane_index is not None
         ]
 
+    @property
+    def plane_indexes_with_linear_light_profiles(self) -> List[int]:
+        """
+        Returns the indexes of the planes which have a galaxy with a linear light profile or `Basis`, whose images are
+        solved for via an inversion.
+        """
+        return [
+            plane_index
+            for (plane_index, plane) in enumerate(self.planes)
+            if plane.has(cls=(ag.lp_linear.LightProfileLinear, ag.lp_basis.Basis))
+        ]
+
     @property
     def perform_inversion(self) -> bool:
         """
@@ -1313,4 +1630,29 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
     @aa.profile_func
     def convolve_via_convolver(self, image, blurring_image, convolver):
-        return convolver.convolve_image(image=image, blurring_image=blurring_image)
+        """
+        Convolve an image and its blurring image with the kernel of a `Convolver` or `ConvolverFFT`.
+
+        For a `ConvolverFFT` the convolution uses the FFT of its kernel, which is computed once, and is therefore
+        fast for large kernels.
+
+        For a `Convolver`, only the smallest rectangular region of the image and blurring image containing non-zero
+        flux is convolved, directly or via an FFT depending on the size of the region and kernel, and an image of
+        zeros is returned without convolution if there is no flux (see
+        `convolution.convolved_image_via_support_from`).
+
+        Parameters
+        ----------
+        image
+            The image of pixels in the mask which is convolved.
+        blurring_image
+            The image of pixels outside the mask whose light is blurred into the mask.
+        convolver
+            The convolver which defines the mask and kernel of the convolution.
+        """
+        if isinstance(convolver, convolution.ConvolverFFT):
+            return convolver.convolve_image(image=image, blurring_image=blurring_image)
+
+        return convolution.convolved_image_via_support_from(
+            image=image, blurring_image=blurring_image, convolver=convolver
+        )
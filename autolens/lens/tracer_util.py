@@ -1,5 +1,6 @@
 import numpy as np
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import autoarray as aa
 import autogalaxy as ag
@@ -71,8 +72,10 @@ def planes_from(
 
     planes = [[] for i in range(len(plane_redshifts))]
 
+    plane_redshifts = np.asarray(plane_redshifts)
+
     for galaxy in galaxies_ascending_redshift:
-        index = (np.abs(np.asarray(plane_redshifts) - galaxy.redshift)).argmin()
+        index = (np.abs(plane_redshifts - galaxy.redshift)).argmin()
         planes[index].append(galaxy)
 
     for index in range(len(planes)):
@@ -81,6 +84,124 @@ def planes_from(
     return planes
 
 
+class _CosmologyKey:
+    def __init__(self, cosmology: ag.cosmo.LensingCosmology):
+        """
+        Wraps a cosmology so it can be used as the key of a cache (e.g. `functools.lru_cache`).
+
+        Cosmology objects are not hashable, therefore the key is the identity of the cosmology object. A reference to
+        the cosmology is held by the key, which ensures its identity cannot be reused by another object whilst the
+        key is in the cache.
+
+        Parameters
+        ----------
+        cosmology
+            The cosmology used for ray-tracing, which the key identifies.
+        """
+        self.cosmology = cosmology
+
+    def __hash__(self):
+        return id(self.cosmology)
+
+    def __eq__(self, other):
+        return isinstance(other, _CosmologyKey) and self.cosmology is other.cosmology
+
+
+@lru_cache(maxsize=128)
+def _scaling_factor_matrix_from(
+    cosmology_key: _CosmologyKey, redshift_tuple: Tuple[float, ...]
+) -> np.ndarray:
+    total_planes = len(redshift_tuple)
+
+    scaling_factor_matrix = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(1, total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factor_matrix[
+                previous_plane_index, plane_index
+            ] = cosmology_key.cosmology.scaling_factor_between_redshifts_from(
+                redshift_0=redshift_tuple[previous_plane_index],
+                redshift_1=redshift_tuple[plane_index],
+                redshift_final=redshift_tuple[-1],
+            )
+
+    scaling_factor_matrix.setflags(write=False)
+
+    return scaling_factor_matrix
+
+
+@lru_cache(maxsize=128)
+def _recursion_factors_from(
+    cosmology_key: _CosmologyKey, redshift_tuple: Tuple[float, ...]
+) -> Optional[np.ndarray]:
+    scaling_factor_matrix = _scaling_factor_matrix_from(cosmology_key, redshift_tuple)
+
+    total_planes = len(redshift_tuple)
+
+    recursion_factors = np.ones(total_planes)
+
+    for plane_index in range(2, total_planes):
+        recursion_factor = (
+            scaling_factor_matrix[plane_index - 2, plane_index]
+            / scaling_factor_matrix[plane_index - 2, plane_index - 1]
+        )
+
+        recursive_scaling_factors = (
+            (1.0 - recursion_factor) * scaling_factor_matrix[: plane_index - 2, plane_index - 2]
+            + recursion_factor * scaling_factor_matrix[: plane_index - 2, plane_index - 1]
+        )
+
+        if not np.isfinite(recursion_factor) or not np.allclose(
+            recursive_scaling_factors,
+            scaling_factor_matrix[: plane_index - 2, plane_index],
+            rtol=1.0e-8,
+            atol=1.0e-12,
+        ):
+            return None
+
+        recursion_factors[plane_index] = recursion_factor
+
+    recursion_factors.setflags(write=False)
+
+    return recursion_factors
+
+
+def scaling_factor_matrix_from(
+    redshift_list: List[float],
+    cosmology: ag.cosmo.LensingCosmology = ag.cosmo.Planck15(),
+) -> np.ndarray:
+    """
+    Returns the matrix of scaling factors used to rescale deflection angles between every pair of planes in a
+    multi-plane ray-tracing calculation.
+
+    Entry [i, j] of the matrix is the factor which scales the deflection angles of plane i (computed relative to the
+    final plane) to the deflection angles between plane i and plane j, where j > i. All other entries are zero.
+
+    For example, for three planes with redshifts z=0.5, z=1.0 and z=2.0, entry [0, 1] is the scaling factor between
+    redshifts 0.5 and 1.0, entry [0, 2] and [1, 2] are 1.0 (because plane 2 is the final plane) and the lower
+    triangle is zero.
+
+    The scaling factors depend only on the plane redshifts and the cosmology, which are fixed for an entire model-fit,
+    but their calculation requires many angular diameter distances which are computationally expensive. The matrix
+    is therefore cached, keyed on the cosmology object and the tuple of plane redshifts, so that it is only computed
+    once and reused by every tracer with the same planes. The returned matrix is read-only.
+
+    Parameters
+    ----------
+    redshift_list
+        The redshifts of the planes in ascending order, where the last entry is the final plane.
+    cosmology
+        The cosmology used for ray-tracing from which angular diameter distances between planes are computed.
+
+    Returns
+    -------
+    The (total_planes, total_planes) matrix of scaling factors between every pair of planes.
+    """
+    return _scaling_factor_matrix_from(
+        _CosmologyKey(cosmology=cosmology), tuple(redshift_list)
+    )
+
+
 def traced_grid_2d_list_from(
     planes: List[List[ag.Galaxy]],
     grid: aa.type.Grid2DLike,
@@ -103,7 +224,19 @@ def traced_grid_2d_list_from(
 
     An input `AstroPy` cosmology object can change the cosmological model, which is used to compute the scaling
     factors between planes (which are derived from their redshifts and angular diameter distances). It is these
-    scaling factors that account for multi-plane ray tracing effects.
+    scaling factors that account for multi-plane ray tracing effects. They are computed once for every set of plane
+    redshifts and cached (see `scaling_factor_matrix_from`).
+
+    The grid of every plane is the input grid minus the sum of the scaled deflection angles of all previous planes,
+    which takes a number of operations that grows with the square of the number of planes. Because light rays between
+    planes obey a linear equation, each plane is instead computed recursively from only the two previous planes:
+
+    grid_j = (1 - delta_j) * grid_(j-2) + delta_j * grid_(j-1) - beta_(j-1, j) * deflections_(j-1)
+
+    where beta is the scaling factor matrix and delta_j = beta_(j-2, j) / beta_(j-2, j-1). This takes a number of
+    operations which grows linearly with the number of planes, and the calculation is performed in-place to avoid
+    allocating temporary arrays. If the scaling factors of the input cosmology do not satisfy this recursion to
+    numerical precision, the scaled deflection angles of all previous planes are summed instead.
 
     The calculation can be terminated early by inputting a `plane_index_limit`. All planes whose integer indexes are
     above this value are omitted from the calculation and not included in the returned list of grids (the size of
@@ -133,38 +266,75 @@ def traced_grid_2d_list_from(
     """
 
     traced_grid_list = []
+    traced_array_list = []
     traced_deflection_list = []
 
     redshift_list = [galaxies[0].redshift for galaxies in planes]
 
+    scaling_factor_matrix = scaling_factor_matrix_from(
+        redshift_list=redshift_list, cosmology=cosmology
+    )
+
+    recursion_factors = _recursion_factors_from(
+        _CosmologyKey(cosmology=cosmology), tuple(redshift_list)
+    )
+
+    if np.asarray(grid).dtype.kind in "iu":
+        grid = grid * 1.0
+
+    buffer = None
+
     for plane_index, galaxies in enumerate(planes):
-        scaled_grid = grid.copy()
+        traced_grid = grid.copy()
+        traced_array = np.asarray(traced_grid)
 
         if plane_index > 0:
-            for previous_plane_index in range(plane_index):
-                scaling_factor = cosmology.scaling_factor_between_redshifts_from(
-                    redshift_0=redshift_list[previous_plane_index],
-                    redshift_1=galaxies[0].redshift,
-                    redshift_final=redshift_list[-1],
-                )
+            if buffer is None:
+                buffer = np.empty_like(traced_array)
 
-                scaled_deflections = (
-                    scaling_factor * traced_deflection_list[previous_plane_index]
-                )
+            if recursion_factors is not None:
+                recursion_factor = recursion_factors[plane_index]
 
-                scaled_grid -= scaled_deflections
-
-        traced_grid_list.append(scaled_grid)
+                np.multiply(
+                    deflections,
+                    -scaling_factor_matrix[plane_index - 1, plane_index],
+                    out=traced_array,
+                )
+                np.multiply(
+                    traced_array_list[plane_index - 1], recursion_factor, out=buffer
+                )
+                traced_array += buffer
+
+                if plane_index > 1:
+                    np.multiply(
+                        traced_array_list[plane_index - 2],
+                        1.0 - recursion_factor,
+                        out=buffer,
+                    )
+                    traced_array += buffer
+
+            else:
+                for previous_plane_index in range(plane_index):
+                    np.multiply(
+                        traced_deflection_list[previous_plane_index],
+                        scaling_factor_matrix[previous_plane_index, plane_index],
+                        out=buffer,
+                    )
+                    traced_array -= buffer
+
+        traced_grid_list.append(traced_grid)
+        traced_array_list.append(traced_array)
 
         if plane_index_limit is not None:
             if plane_index == plane_index_limit:
                 return traced_grid_list
 
-        deflections_yx_2d = sum(
-            map(lambda g: g.deflections_yx_2d_from(grid=scaled_grid), galaxies)
+        deflections = np.asarray(
+            sum(map(lambda g: g.deflections_yx_2d_from(grid=traced_grid), galaxies))
         )
 
-        traced_deflection_list.append(deflections_yx_2d)
+        if recursion_factors is None:
+            traced_deflection_list.append(deflections)
 
     return traced_grid_list
 
@@ -0,0 +1,118 @@
+from typing import Callable
+
+import numpy as np
+
+import autoarray as aa
+
+
+class DeflectionCache:
+    def __init__(self, deflections_func: Callable, quantum: float):
+        """
+        Caches the deflection angles of (y,x) coordinates, so that coordinates which are ray-traced more than once
+        only have their deflection angles computed once.
+
+        The point solver repeatedly ray-traces the vertices of triangles as they are refined, where the vertices of
+        the triangles at every step include many vertices of the previous step. By computing deflection angles via
+        this cache for the duration of one solve, these vertices are not traced again.
+
+        Coordinates are matched by rounding them to integer multiples of `quantum`, which should be much smaller than
+        the smallest distance between two distinct coordinates. Each quantised (y,x) coordinate is packed into a
+        single 64-bit integer key, and keys are looked up via a sorted array so that every lookup is vectorized.
+
+        Parameters
+        ----------
+        deflections_func
+            The function which computes the deflection angles of a grid of (y,x) coordinates, which is called with
+            the (y,x) coordinates which are not in the cache.
+        quantum
+            The resolution at which (y,x) coordinates are matched to one another.
+        """
+        self.deflections_func = deflections_func
+        self.quantum = quantum
+
+        self.keys = np.zeros(0, dtype="int64")
+        self.deflections = np.zeros((0, 2))
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of all (y,x) coordinates requested from the cache whose deflection angles were already cached.
+        """
+        total = self.hits + self.misses
+
+        return self.hits / total if total > 0 else 0.0
+
+    def keys_from(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Returns the 64-bit integer key of every (y,x) coordinate, or `None` if a coordinate is too far from the
+        origin for its quantised y and x values to be packed into one key.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates whose keys are computed.
+        """
+        indexes = np.rint(grid / self.quantum)
+
+        if np.any(np.abs(indexes) >= 2**31):
+            return None
+
+        indexes = indexes.astype("int64") + 2**31
+
+        return (indexes[:, 0] << 32) | indexes[:, 1]
+
+    def deflections_yx_2d_from(self, grid: aa.type.Grid2DLike) -> np.ndarray:
+        """
+        Returns the deflection angles of every (y,x) coordinate on the input grid, computing only those which are not
+        already cached and adding them to the cache.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates whose deflection angles are returned.
+        """
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        keys = self.keys_from(grid=grid)
+
+        if keys is None:
+            self.misses += len(grid)
+            return np.asarray(self.deflections_func(grid=aa.Grid2DIrregular(grid)))
+
+        unique_keys, unique_indexes, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+
+        positions = np.searchsorted(self.keys, unique_keys)
+        found = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == unique_keys[found]
+
+        unique_deflections = np.zeros((len(unique_keys), 2))
+        unique_deflections[found] = self.deflections[positions[found]]
+
+        missing = ~found
+
+        if np.any(missing):
+            unique_deflections[missing] = np.asarray(
+                self.deflections_func(
+                    grid=aa.Grid2DIrregular(grid[unique_indexes[missing]])
+                )
+            )
+
+            keys_all = np.concatenate([self.keys, unique_keys[missing]])
+            deflections_all = np.concatenate(
+                [self.deflections, unique_deflections[missing]]
+            )
+
+            order = np.argsort(keys_all)
+
+            self.keys = keys_all[order]
+            self.deflections = deflections_all[order]
+
+        self.misses += int(np.sum(missing))
+        self.hits += len(grid) - int(np.sum(missing))
+
+        return unique_deflections[inverse.reshape(-1)]
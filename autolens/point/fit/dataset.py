@@ -1,5 +1,6 @@
 from typing import Callable, Dict, Optional
 
+import autoarray as aa
 
 from autolens.point.dataset import PointDataset
 from autolens.point.solver import PointSolver
@@ -25,6 +26,7 @@ class FitPointDataset:
         solver: PointSolver,
         fit_positions_cls=FitPositionsImagePair,
         run_time_dict: Optional[Dict] = None,
+        model_positions: Optional[aa.Grid2DIrregular] = None,
     ):
         self.dataset = dataset
         self.tracer = tracer
@@ -35,6 +37,10 @@ class FitPointDataset:
 
         self.fit_positions_cls = fit_positions_cls
 
+        model_positions_kwargs = (
+            {} if model_positions is None else {"model_positions": model_positions}
+        )
+
         try:
             self.positions = self.fit_positions_cls(
                 name=dataset.name,
@@ -43,6 +49,7 @@ class FitPointDataset:
                 tracer=tracer,
                 solver=solver,
                 profile=profile,
+                **model_positions_kwargs,
             )
         except exc.PointExtractionException:
             self.positions = None
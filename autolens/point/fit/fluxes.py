@@ -1,6 +1,8 @@
 from functools import partial
 from typing import Optional
 
+from autoconf import cached_property
+
 import autoarray as aa
 import autogalaxy as ag
 
@@ -73,11 +75,15 @@ class FitFluxes(aa.AbstractFit):
 
         return self.tracer.deflections_yx_2d_from
 
-    @property
+    @cached_property
     def magnifications(self):
         """
         The magnification of every position in the image-plane, which is computed from the tracer's deflection
         angle map via the Hessian.
+
+        The deflection angles of all four finite difference offsets of every position are computed in one call (see
+        `Tracer.hessian_from`) and the magnifications are cached for the lifetime of the fit, as the model fluxes,
+        residuals and likelihood all use them.
         """
         return abs(
             self.tracer.magnification_2d_via_hessian_from(
@@ -1,5 +1,9 @@
 from typing import Optional, Tuple
 
+import numpy as np
+
+from autoconf import cached_property
+
 import autoarray as aa
 import autogalaxy as ag
 
@@ -17,6 +21,7 @@ class AbstractFitPositionsImagePair(AbstractFitPositions):
         tracer: Tracer,
         solver: PointSolver,
         profile: Optional[ag.ps.Point] = None,
+        model_positions: Optional[aa.Grid2DIrregular] = None,
     ):
         """
         A lens position fitter, which takes a set of positions (e.g. from a plane in the tracer) and computes \
@@ -28,6 +33,9 @@ class AbstractFitPositionsImagePair(AbstractFitPositions):
             The (y,x) arc-second coordinates of positions which the maximum distance and log_likelihood is computed using.
         noise_value
             The noise-value assumed when computing the log likelihood.
+        model_positions
+            The model positions of the point source, if they have already been computed by the solver (e.g. for many
+            point sources at once via `PointSolver.solve_many`), in which case the solver is not called.
         """
 
         super().__init__(
@@ -39,14 +47,36 @@ class AbstractFitPositionsImagePair(AbstractFitPositions):
             profile=profile,
         )
 
+        if model_positions is not None:
+            self.__dict__["model_data"] = model_positions
+
     @staticmethod
     def square_distance(coord1, coord2):
         return (coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2
 
-    @property
+    @cached_property
+    def distance_matrix(self) -> np.ndarray:
+        """
+        Returns the distance between every observed position and every model position, as a matrix of shape
+        [total_data_positions, total_model_positions].
+
+        Every image-pair fit builds its residual-map from this matrix, which is computed once in a single vectorized
+        calculation.
+        """
+        data = np.asarray(self.data).reshape(-1, 2)
+        model_data = np.asarray(self.model_data).reshape(-1, 2)
+
+        difference = data[:, np.newaxis, :] - model_data[np.newaxis, :, :]
+
+        return np.sqrt(difference[:, :, 0] ** 2 + difference[:, :, 1] ** 2)
+
+    @cached_property
     def model_data(self) -> aa.Grid2DIrregular:
         """
         Returns the model positions, which are computed via the point solver.
+
+        Solving for the model positions is the most expensive part of the fit and the noise-map, residual-map and
+        every quantity derived from them use the model positions, therefore they are computed once and cached.
         """
         return self.solver.solve(
             tracer=self.tracer,
@@ -1,4 +1,3 @@
-import numpy as np
 from scipy.optimize import linear_sum_assignment
 
 import autoarray as aa
@@ -21,27 +20,14 @@ class FitPositionsImagePair(AbstractFitPositionsImagePair):
 
     @property
     def residual_map(self) -> aa.ArrayIrregular:
-        residual_map = []
-
-        cost_matrix = np.linalg.norm(
-            np.array(
-                self.data,
-            )[:, np.newaxis]
-            - np.array(
-                self.model_data,
-            ),
-            axis=2,
-        )
-
-        data_indexes, model_indexes = linear_sum_assignment(cost_matrix)
+        """
+        Returns the residual-map, which pairs every observed position with a unique model position such that the
+        total distance between all pairs is minimized.
 
-        for data_index, model_index in zip(data_indexes, model_indexes):
-            distance = np.sqrt(
-                self.square_distance(
-                    self.data[data_index], self.model_data[model_index]
-                )
-            )
+        The pairing is computed via the Hungarian algorithm on the distance matrix of the fit.
+        """
+        data_indexes, model_indexes = linear_sum_assignment(self.distance_matrix)
 
-            residual_map.append(distance)
-
-        return aa.ArrayIrregular(values=residual_map)
+        return aa.ArrayIrregular(
+            values=self.distance_matrix[data_indexes, model_indexes]
+        )
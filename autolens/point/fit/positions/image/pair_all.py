@@ -20,24 +20,14 @@ class FitPositionsImagePairAll(AbstractFitPositionsImagePair):
 
     @property
     def noise_map(self):
-        noise_map = []
-
-        for i in range(len(self.data)):
-            for j in range(len(self.model_data)):
-                noise_map.append(self._noise_map[i])
-
-        return aa.ArrayIrregular(values=noise_map)
+        return aa.ArrayIrregular(
+            values=np.repeat(np.asarray(self._noise_map), len(self.model_data))
+        )
 
     @property
     def residual_map(self) -> aa.ArrayIrregular:
-        combinations = len(self.model_data) ** len(self.data)
-
-        residual_map = []
-
-        for model_data in self.model_data:
-            for data in self.data:
-                distance = np.sqrt(self.square_distance(data, model_data))
-
-                residual_map.append(distance)
-
-        return aa.ArrayIrregular(values=residual_map)
+        """
+        Returns the residual-map, which is the distance of every model position to every observed position, ordered
+        by model position first.
+        """
+        return aa.ArrayIrregular(values=self.distance_matrix.T.ravel())
@@ -20,13 +20,8 @@ class FitPositionsImagePairRepeat(AbstractFitPositionsImagePair):
 
     @property
     def residual_map(self) -> aa.ArrayIrregular:
-        residual_map = []
-
-        for position in self.data:
-            distances = [
-                self.square_distance(model_position, position)
-                for model_position in self.model_data
-            ]
-            residual_map.append(np.sqrt(min(distances)))
-
-        return aa.ArrayIrregular(values=residual_map)
+        """
+        Returns the residual-map, which is the distance of every observed position to its nearest model position,
+        where a model position can be the nearest position of more than one observed position.
+        """
+        return aa.ArrayIrregular(values=np.min(self.distance_matrix, axis=1))
@@ -4,6 +4,7 @@ from typing import Optional
 class MockPointSolver:
     def __init__(self, model_positions):
         self.model_positions = model_positions
+        self.total_solves = 0
 
     def solve(
         self,
@@ -11,4 +12,16 @@ class MockPointSolver:
         source_plane_coordinate,
         source_plane_redshift: Optional[float] = None,
     ):
+        self.total_solves += 1
+
         return self.model_positions
+
+    def solve_many(
+        self,
+        tracer,
+        source_plane_coordinates,
+        source_plane_redshift: Optional[float] = None,
+    ):
+        self.total_solves += 1
+
+        return [self.model_positions for _ in source_plane_coordinates]
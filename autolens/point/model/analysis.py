@@ -1,5 +1,7 @@
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+import autoarray as aa
 import autofit as af
 import autogalaxy as ag
 
@@ -7,7 +9,9 @@ from autogalaxy.analysis.analysis.analysis import Analysis as AgAnalysis
 
 from autolens.analysis.analysis.lens import AnalysisLens
 from autolens.analysis.plotter_interface import PlotterInterface
+from autolens.lens.tracer import Tracer
 from autolens.point.fit.positions.abstract import AbstractFitPositions
+from autolens.point.fit.positions.image.abstract import AbstractFitPositionsImagePair
 from autolens.point.fit.positions.image.pair_repeat import FitPositionsImagePairRepeat
 from autolens.point.fit.dataset import FitPointDataset
 from autolens.point.dataset import PointDataset
@@ -115,3 +119,197 @@ class AnalysisPoint(AgAnalysis, AnalysisLens):
             obj=self.dataset,
             file_path=paths._files_path / "dataset.json",
         )
+
+
+class AnalysisPointList(AgAnalysis, AnalysisLens):
+    Result = ResultPoint
+
+    def __init__(
+        self,
+        dataset_list: List[PointDataset],
+        solver: PointSolver,
+        fit_positions_cls=FitPositionsImagePairRepeat,
+        cosmology: ag.cosmo.LensingCosmology = ag.cosmo.Planck15(),
+        number_of_threads: int = 1,
+        title_prefix: str = None,
+    ):
+        """
+        The analysis performed for model-fitting many point-source datasets simultaneously, for example the
+        multiply imaged point-sources of the many source galaxies of a galaxy cluster.
+
+        Every dataset is fitted using the same tracer, which is created once per likelihood evaluation. The model
+        image-plane positions of all point-sources in the same source plane are computed together via
+        `PointSolver.solve_many`, which ray-traces the image-plane triangles shared by every point-source once and
+        batches the deflection angle calculations of every refinement step.
+
+        The fits of the datasets can be evaluated in parallel over a pool of threads. The log likelihoods are summed
+        in the order of the input datasets, so the result does not depend on the number of threads.
+
+        Parameters
+        ----------
+        dataset_list
+            The point-source datasets that are fitted, each of which is paired with the `Point` of the same name
+            in the model.
+        solver
+            The object which is used to determine the image-plane of source-plane positions of a model (via a `Tracer`).
+        cosmology
+            The cosmology of the ray-tracing calculation.
+        number_of_threads
+            The number of threads the fits of the datasets are evaluated over.
+        title_prefix
+            A string that is added before the title of all figures output by visualization, for example to
+            put the name of the dataset and galaxy in the title.
+        """
+
+        super().__init__(cosmology=cosmology)
+
+        AnalysisLens.__init__(self=self, cosmology=cosmology)
+
+        self.dataset_list = dataset_list
+
+        self.solver = solver
+        self.fit_positions_cls = fit_positions_cls
+        self.number_of_threads = number_of_threads
+        self.title_prefix = title_prefix
+
+    def log_likelihood_function(self, instance):
+        """
+        Determine the fit of the strong lens system of lens galaxies and source galaxies to every point source
+        dataset, returning the sum of their log likelihoods.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+
+        Returns
+        -------
+        The sum of the log likelihoods of the fits to every point source dataset.
+        """
+        try:
+            tracer = self.tracer_via_instance_from(instance=instance)
+
+            model_positions_list = self.model_positions_list_from(tracer=tracer)
+
+            log_likelihood_list = self._map(
+                lambda index: self._fit_via_index_from(
+                    index=index,
+                    tracer=tracer,
+                    model_positions_list=model_positions_list,
+                ).log_likelihood
+            )
+
+            return sum(log_likelihood_list)
+        except (AttributeError, ValueError, TypeError, NumbaException) as e:
+            raise exc.FitException from e
+
+    def model_positions_list_from(
+        self, tracer: Tracer
+    ) -> List[Optional[aa.Grid2DIrregular]]:
+        """
+        Returns the model image-plane positions of every point-source dataset, computed by calling
+        `PointSolver.solve_many` once for every source plane which contains a point-source of the datasets.
+
+        An entry is `None` if the tracer does not contain the dataset's point-source or if the position fits of the
+        analysis do not use the solver.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose model positions are computed.
+        """
+        model_positions_list = [None] * len(self.dataset_list)
+
+        if not issubclass(self.fit_positions_cls, AbstractFitPositionsImagePair):
+            return model_positions_list
+
+        index_list_via_redshift = {}
+        coordinate_list_via_redshift = {}
+
+        for index, dataset in enumerate(self.dataset_list):
+            profile = tracer.extract_profile(profile_name=dataset.name)
+
+            if profile is None:
+                continue
+
+            plane_index = tracer.extract_plane_index_of_profile(
+                profile_name=dataset.name
+            )
+            redshift = tracer.planes[plane_index].redshift
+
+            index_list_via_redshift.setdefault(redshift, []).append(index)
+            coordinate_list_via_redshift.setdefault(redshift, []).append(
+                profile.centre
+            )
+
+        for redshift, index_list in index_list_via_redshift.items():
+            solution_list = self.solver.solve_many(
+                tracer=tracer,
+                source_plane_coordinates=coordinate_list_via_redshift[redshift],
+                source_plane_redshift=redshift,
+            )
+
+            for index, solution in zip(index_list, solution_list):
+                model_positions_list[index] = solution
+
+        return model_positions_list
+
+    def _map(self, func) -> List:
+        """
+        Apply a function to the index of every dataset, over the thread pool if more than one thread is used, and
+        return the results in the order of the datasets.
+        """
+        if self.number_of_threads <= 1:
+            return list(map(func, range(len(self.dataset_list))))
+
+        with ThreadPoolExecutor(max_workers=self.number_of_threads) as executor:
+            return list(executor.map(func, range(len(self.dataset_list))))
+
+    def _fit_via_index_from(
+        self,
+        index: int,
+        tracer: Tracer,
+        model_positions_list: List[Optional[aa.Grid2DIrregular]],
+        run_time_dict: Optional[Dict] = None,
+    ) -> FitPointDataset:
+        return FitPointDataset(
+            dataset=self.dataset_list[index],
+            tracer=tracer,
+            solver=self.solver,
+            fit_positions_cls=self.fit_positions_cls,
+            run_time_dict=run_time_dict,
+            model_positions=model_positions_list[index],
+        )
+
+    def fit_from(
+        self, instance, run_time_dict: Optional[Dict] = None
+    ) -> List[FitPointDataset]:
+        """
+        Returns the fit of every point source dataset, which all share one tracer created from the instance.
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+        tracer = self.tracer_via_instance_from(
+            instance=instance, run_time_dict=run_time_dict
+        )
+
+        model_positions_list = self.model_positions_list_from(tracer=tracer)
+
+        return self._map(
+            lambda index: self._fit_via_index_from(
+                index=index,
+                tracer=tracer,
+                model_positions_list=model_positions_list,
+                run_time_dict=run_time_dict,
+            )
+        )
+
+    def save_attributes(self, paths: af.DirectoryPaths):
+        for dataset in self.dataset_list:
+            ag.output_to_json(
+                obj=dataset,
+                file_path=paths._files_path / f"dataset_{dataset.name}.json",
+            )
@@ -1,17 +1,62 @@
 import logging
 import math
+import time
 from dataclasses import dataclass
-from typing import Tuple, List, Iterator, Type, Optional
+from functools import partial
+from typing import Callable, Tuple, List, Iterator, Type, Optional
+
+import numpy as np
+
+from autoconf import cached_property
 
 import autoarray as aa
 
 from autoarray.structures.triangles import array
 
 from autolens.lens.tracer import Tracer
+from autolens.point.deflection_cache import DeflectionCache
 
 logger = logging.getLogger(__name__)
 
 
+def containing_mask_from(triangles: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Determine which triangles contain each of a set of points, for all points at once.
+
+    Containment uses the same barycentric test as a single point `containing_indices` call, with the first entry of
+    every point compared to the first column of the triangle vertices.
+
+    Parameters
+    ----------
+    triangles
+        The vertices of the triangles, with shape [total_triangles, 3, 2].
+    points
+        The points tested for containment, with shape [total_points, 2].
+
+    Returns
+    -------
+    A boolean array of shape [total_triangles, total_points] which is `True` where a triangle contains a point.
+    """
+    triangles = np.asarray(triangles)
+    points = np.asarray(points).reshape(-1, 2)
+
+    x1, y1 = triangles[:, 0, 0, None], triangles[:, 0, 1, None]
+    x2, y2 = triangles[:, 1, 0, None], triangles[:, 1, 1, None]
+    x3, y3 = triangles[:, 2, 0, None], triangles[:, 2, 1, None]
+
+    x = points[None, :, 0]
+    y = points[None, :, 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denominator = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
+
+        a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / denominator
+        b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / denominator
+        c = 1 - a - b
+
+    return (0 <= a) & (a <= 1) & (0 <= b) & (b <= 1) & (0 <= c) & (c <= 1)
+
+
 @dataclass
 class Step:
     """
@@ -29,6 +74,12 @@ class Step:
         The neighbourhood of the filtered triangles.
     up_sampled
         The neighbourhood up-sampled to increase the resolution.
+    deflection_evaluations
+        The number of image plane coordinates whose deflection angles were computed during the step.
+    deflection_cache_hits
+        The number of image plane coordinates whose deflection angles were reused from earlier steps.
+    run_time
+        The time in seconds taken to perform the step.
     """
 
     number: int
@@ -36,6 +87,30 @@ class Step:
     filtered_triangles: aa.AbstractTriangles
     neighbourhood: aa.AbstractTriangles
     up_sampled: aa.AbstractTriangles
+    deflection_evaluations: int = 0
+    deflection_cache_hits: int = 0
+    run_time: float = 0.0
+
+    @property
+    def total_initial_triangles(self) -> int:
+        """
+        The number of triangles at the start of the step.
+        """
+        return len(self.initial_triangles.indices)
+
+    @property
+    def total_filtered_triangles(self) -> int:
+        """
+        The number of triangles which trace to triangles that contain the source plane coordinate.
+        """
+        return len(self.filtered_triangles.indices)
+
+    @property
+    def total_up_sampled_triangles(self) -> int:
+        """
+        The number of triangles passed to the next step.
+        """
+        return len(self.up_sampled.indices)
 
 
 class PointSolver:
@@ -104,6 +179,22 @@ class PointSolver:
             ArrayTriangles=ArrayTriangles,
         )
 
+    @cached_property
+    def initial_triangles(self) -> aa.AbstractTriangles:
+        """
+        The triangles tiling the image plane which every solve begins from.
+
+        The tiling depends only on the limits and scale of the solver, so it is computed once and reused by every call
+        to `solve`, which avoids rebuilding it for every model-fit likelihood evaluation.
+        """
+        return self.ArrayTriangles.for_limits_and_scale(
+            y_min=self.y_min,
+            y_max=self.y_max,
+            x_min=self.x_min,
+            x_max=self.x_max,
+            scale=self.scale,
+        )
+
     @property
     def n_steps(self) -> int:
         """
@@ -111,11 +202,63 @@ class PointSolver:
         """
         return math.ceil(math.log2(self.scale / self.pixel_scale_precision))
 
+    def _deflections_func_from(
+        self,
+        tracer: Tracer,
+        source_plane_redshift: Optional[float] = None,
+    ) -> Callable:
+        """
+        Returns the function which computes the deflection angles from the image plane to the source plane.
+
+        Parameters
+        ----------
+        source_plane_redshift
+            The redshift of the source plane, which defaults to the final plane of the tracer.
+        """
+        source_plane_index = -1
+
+        if source_plane_redshift is not None:
+            for redshift in tracer.plane_redshifts:
+                source_plane_index += 1
+                if redshift == source_plane_redshift:
+                    break
+
+        return partial(
+            tracer.deflections_between_planes_from,
+            plane_i=0,
+            plane_j=source_plane_index,
+        )
+
+    def deflection_cache_from(
+        self,
+        tracer: Tracer,
+        source_plane_redshift: Optional[float] = None,
+    ) -> DeflectionCache:
+        """
+        Returns a cache of the deflection angles from the image plane to the source plane, which is used for the
+        duration of one solve.
+
+        Coordinates are matched to a resolution one thousand times finer than the target pixel scale, which is far
+        smaller than the spacing of the vertices of the triangles at the final step.
+
+        Parameters
+        ----------
+        source_plane_redshift
+            The redshift of the source plane, which defaults to the final plane of the tracer.
+        """
+        return DeflectionCache(
+            deflections_func=self._deflections_func_from(
+                tracer=tracer, source_plane_redshift=source_plane_redshift
+            ),
+            quantum=1.0e-3 * self.pixel_scale_precision,
+        )
+
     def _source_plane_grid(
         self,
         tracer: Tracer,
         grid: aa.type.Grid2DLike,
         source_plane_redshift: Optional[float] = None,
+        deflection_cache: Optional[DeflectionCache] = None,
     ) -> aa.type.Grid2DLike:
         """
         Calculate the source plane grid from the image plane grid.
@@ -124,23 +267,21 @@ class PointSolver:
         ----------
         grid
             The image plane grid.
+        deflection_cache
+            If input, deflection angles are computed via this cache, such that coordinates traced earlier in the
+            solve are not traced again.
 
         Returns
         -------
         The source plane grid computed by applying the deflections to the image plane grid.
         """
+        if deflection_cache is not None:
+            deflections = deflection_cache.deflections_yx_2d_from(grid=grid)
+        else:
+            deflections = self._deflections_func_from(
+                tracer=tracer, source_plane_redshift=source_plane_redshift
+            )(grid=grid)
 
-        source_plane_index = -1
-
-        if source_plane_redshift is not None:
-            for redshift in tracer.plane_redshifts:
-                source_plane_index += 1
-                if redshift == source_plane_redshift:
-                    break
-
-        deflections = tracer.deflections_between_planes_from(
-            grid=grid, plane_i=0, plane_j=source_plane_index
-        )
         # noinspection PyTypeChecker
         return grid.grid_2d_via_deflection_grid_from(deflection_grid=deflections)
 
@@ -160,6 +301,9 @@ class PointSolver:
         The means of the triangles  are then filtered to keep only those with an absolute magnification above the
         threshold.
 
+        Deflection angles are computed via a `DeflectionCache` for the duration of the solve, so vertices shared
+        between refinement steps are only ray-traced once.
+
         Parameters
         ----------
         source_plane_coordinate
@@ -174,18 +318,33 @@ class PointSolver:
                 "The target pixel scale is too large to subdivide the triangles."
             )
 
+        deflection_cache = self.deflection_cache_from(
+            tracer=tracer, source_plane_redshift=source_plane_redshift
+        )
+
         steps = list(
             self.steps(
                 tracer=tracer,
                 source_plane_coordinate=source_plane_coordinate,
                 source_plane_redshift=source_plane_redshift,
+                deflection_cache=deflection_cache,
             )
         )
         final_step = steps[-1]
         kept_triangles = final_step.filtered_triangles
 
+        if final_step.total_filtered_triangles == 0:
+            return aa.Grid2DIrregular(values=[])
+
         filtered_means = self._filter_low_magnification(
-            tracer=tracer, points=kept_triangles.means
+            tracer=tracer,
+            points=kept_triangles.means,
+            deflections_func=deflection_cache.deflections_yx_2d_from,
+        )
+
+        logger.debug(
+            f"Deflection cache hit rate {deflection_cache.hit_rate:.2f} "
+            f"({deflection_cache.misses} deflection angle evaluations)."
         )
 
         difference = len(kept_triangles.means) - len(filtered_means)
@@ -200,8 +359,193 @@ class PointSolver:
 
         return aa.Grid2DIrregular(values=filtered_means)
 
+    def solve_many(
+        self,
+        tracer: Tracer,
+        source_plane_coordinates: List[Tuple[float, float]],
+        source_plane_redshift: Optional[float] = None,
+    ) -> List[aa.Grid2DIrregular]:
+        """
+        Solve for the image plane coordinates that are traced to each of many source plane coordinates.
+
+        This gives the same result as calling `solve` once per source plane coordinate, but shares work between the
+        sources:
+
+        - The initial tiling of the image plane is the same for every source, so its vertices are ray-traced once and
+          containment of every source plane coordinate is tested in a single vectorized calculation.
+
+        - Each source then refines its own neighbourhood of triangles, but the up-sampled vertices of all sources are
+          ray-traced together, so every refinement step computes deflection angles in one call.
+
+        - The magnifications used to remove low magnification images are computed in one call for all sources.
+
+        Parameters
+        ----------
+        source_plane_coordinates
+            The source plane coordinates to trace to the image plane.
+        source_plane_redshift
+            The redshift of the plane the source plane coordinates are in, which defaults to the final plane.
+
+        Returns
+        -------
+        A list with, for every source plane coordinate, the image plane coordinates that are traced to it.
+        """
+        if self.n_steps == 0:
+            raise ValueError(
+                "The target pixel scale is too large to subdivide the triangles."
+            )
+
+        source_plane_coordinates = np.asarray(
+            source_plane_coordinates, dtype="float"
+        ).reshape(-1, 2)
+
+        if len(source_plane_coordinates) == 0:
+            return []
+
+        initial_triangles = self.initial_triangles
+
+        deflection_cache = self.deflection_cache_from(
+            tracer=tracer, source_plane_redshift=source_plane_redshift
+        )
+
+        (source_triangles,) = self._source_plane_triangles_list(
+            tracer=tracer,
+            triangles_list=[initial_triangles],
+            source_plane_redshift=source_plane_redshift,
+            deflection_cache=deflection_cache,
+        )
+
+        contained = containing_mask_from(
+            triangles=source_triangles.triangles, points=source_plane_coordinates
+        )
+
+        kept_triangles_list = [
+            initial_triangles.for_indexes(indexes=np.where(contained[:, index])[0])
+            for index in range(len(source_plane_coordinates))
+        ]
+
+        for _ in range(1, self.n_steps):
+            up_sampled_list = [
+                kept_triangles.neighborhood().up_sample()
+                if len(kept_triangles.indices) > 0
+                else kept_triangles
+                for kept_triangles in kept_triangles_list
+            ]
+
+            source_triangles_list = self._source_plane_triangles_list(
+                tracer=tracer,
+                triangles_list=up_sampled_list,
+                source_plane_redshift=source_plane_redshift,
+                deflection_cache=deflection_cache,
+            )
+
+            kept_triangles_list = [
+                up_sampled.for_indexes(
+                    indexes=np.where(
+                        containing_mask_from(
+                            triangles=source_triangles.triangles,
+                            points=source_plane_coordinate,
+                        )[:, 0]
+                    )[0]
+                )
+                for up_sampled, source_triangles, source_plane_coordinate in zip(
+                    up_sampled_list, source_triangles_list, source_plane_coordinates
+                )
+            ]
+
+        means_list = [
+            np.asarray(kept_triangles.means).reshape(-1, 2)
+            for kept_triangles in kept_triangles_list
+        ]
+        means = np.concatenate(means_list)
+
+        if len(means) == 0:
+            return [aa.Grid2DIrregular(values=[]) for _ in means_list]
+
+        magnifications = np.asarray(
+            tracer.magnification_2d_via_hessian_from(
+                grid=aa.Grid2DIrregular(values=means),
+                buffer=self.scale,
+                deflections_func=deflection_cache.deflections_yx_2d_from,
+            )
+        )
+
+        magnifications_list = np.split(
+            magnifications, np.cumsum(list(map(len, means_list)))[:-1]
+        )
+
+        solutions = []
+
+        for means, magnifications in zip(means_list, magnifications_list):
+            filtered_means = [
+                tuple(mean)
+                for mean, magnification in zip(means, magnifications)
+                if abs(magnification) > self.magnification_threshold
+            ]
+
+            difference = len(means) - len(filtered_means)
+            if difference > 0:
+                logger.debug(
+                    f"Filtered {difference} multiple-images with magnification below threshold."
+                )
+
+            solutions.append(aa.Grid2DIrregular(values=filtered_means))
+
+        return solutions
+
+    def _source_plane_triangles_list(
+        self,
+        tracer: Tracer,
+        triangles_list: List[aa.AbstractTriangles],
+        source_plane_redshift: Optional[float] = None,
+        deflection_cache: Optional[DeflectionCache] = None,
+    ) -> List[aa.AbstractTriangles]:
+        """
+        Ray-trace the vertices of many sets of triangles to the source plane using a single deflection angle
+        calculation.
+
+        Parameters
+        ----------
+        triangles_list
+            The sets of image plane triangles whose vertices are ray-traced.
+
+        Returns
+        -------
+        The sets of triangles with their vertices replaced by the source plane vertices.
+        """
+        vertices_list = [
+            np.asarray(triangles.vertices).reshape(-1, 2)
+            for triangles in triangles_list
+        ]
+        vertices = np.concatenate(vertices_list)
+
+        if len(vertices) == 0:
+            return triangles_list
+
+        source_plane_grid = self._source_plane_grid(
+            tracer=tracer,
+            grid=aa.Grid2DIrregular(vertices),
+            source_plane_redshift=source_plane_redshift,
+            deflection_cache=deflection_cache,
+        )
+
+        source_plane_vertices_list = np.split(
+            np.asarray(source_plane_grid.array),
+            np.cumsum(list(map(len, vertices_list)))[:-1],
+        )
+
+        return [
+            triangles.with_vertices(source_plane_vertices)
+            for triangles, source_plane_vertices in zip(
+                triangles_list, source_plane_vertices_list
+            )
+        ]
+
     def _filter_low_magnification(
-        self, tracer: Tracer, points: List[Tuple[float, float]]
+        self,
+        tracer: Tracer,
+        points: List[Tuple[float, float]],
+        deflections_func: Optional[Callable] = None,
     ) -> List[Tuple[float, float]]:
         """
         Filter the points to keep only those with an absolute magnification above the threshold.
@@ -210,6 +554,9 @@ class PointSolver:
         ----------
         points
             The points to filter.
+        deflections_func
+            The function computing the deflection angles used to compute the magnifications via the Hessian, which
+            defaults to the deflection angles of the tracer.
 
         Returns
         -------
@@ -222,6 +569,7 @@ class PointSolver:
                 tracer.magnification_2d_via_hessian_from(
                     grid=aa.Grid2DIrregular(points),
                     buffer=self.scale,
+                    deflections_func=deflections_func,
                 ),
             )
             if abs(magnification) > self.magnification_threshold
@@ -233,6 +581,7 @@ class PointSolver:
         source_plane_coordinate: Tuple[float, float],
         triangles: aa.AbstractTriangles,
         source_plane_redshift: Optional[float] = None,
+        deflection_cache: Optional[DeflectionCache] = None,
     ):
         """
         Filter the triangles to keep only those that contain the source plane coordinate.
@@ -243,6 +592,8 @@ class PointSolver:
             A set of triangles that may contain the source plane coordinate.
         source_plane_coordinate
             The source plane coordinate to check if it is contained within the triangles.
+        deflection_cache
+            If input, the vertices of the triangles are ray-traced via this cache.
 
         Returns
         -------
@@ -252,6 +603,7 @@ class PointSolver:
             tracer=tracer,
             grid=aa.Grid2DIrregular(triangles.vertices),
             source_plane_redshift=source_plane_redshift,
+            deflection_cache=deflection_cache,
         )
         source_triangles = triangles.with_vertices(source_plane_grid.array)
         indexes = source_triangles.containing_indices(point=source_plane_coordinate)
@@ -262,36 +614,56 @@ class PointSolver:
         tracer: Tracer,
         source_plane_coordinate: Tuple[float, float],
         source_plane_redshift: Optional[float] = None,
+        deflection_cache: Optional[DeflectionCache] = None,
     ) -> Iterator[Step]:
         """
         Iterate over the steps of the triangle solver algorithm.
 
+        If no triangles contain the source plane coordinate the iteration stops early, because further refinement
+        cannot produce any images. This means models which produce no images (e.g. with a source far outside the
+        caustics) are rejected after a single step.
+
+        The vertices of every step include many vertices of the previous step, therefore deflection angles are
+        computed via a `DeflectionCache` shared by all steps. Each step records the number of deflection angle
+        evaluations it performed, the number of vertices reused from the cache and its run time.
+
         Parameters
         ----------
         source_plane_coordinate
             The source plane coordinate to trace to the image plane.
+        deflection_cache
+            The cache used to compute deflection angles, which is created for this iteration if not input.
 
         Returns
         -------
         An iterator over the steps of the triangle solver algorithm.
         """
-        initial_triangles = self.ArrayTriangles.for_limits_and_scale(
-            y_min=self.y_min,
-            y_max=self.y_max,
-            x_min=self.x_min,
-            x_max=self.x_max,
-            scale=self.scale,
-        )
+        if deflection_cache is None:
+            deflection_cache = self.deflection_cache_from(
+                tracer=tracer, source_plane_redshift=source_plane_redshift
+            )
+
+        initial_triangles = self.initial_triangles
 
         for number in range(self.n_steps):
+            start = time.perf_counter()
+            hits = deflection_cache.hits
+            misses = deflection_cache.misses
+
             kept_triangles = self._filter_triangles(
                 tracer=tracer,
                 source_plane_coordinate=source_plane_coordinate,
                 triangles=initial_triangles,
                 source_plane_redshift=source_plane_redshift,
+                deflection_cache=deflection_cache,
             )
-            neighbourhood = kept_triangles.neighborhood()
-            up_sampled = neighbourhood.up_sample()
+
+            if len(kept_triangles.indices) == 0:
+                neighbourhood = kept_triangles
+                up_sampled = kept_triangles
+            else:
+                neighbourhood = kept_triangles.neighborhood()
+                up_sampled = neighbourhood.up_sample()
 
             yield Step(
                 number=number,
@@ -299,6 +671,12 @@ class PointSolver:
                 filtered_triangles=kept_triangles,
                 neighbourhood=neighbourhood,
                 up_sampled=up_sampled,
+                deflection_evaluations=deflection_cache.misses - misses,
+                deflection_cache_hits=deflection_cache.hits - hits,
+                run_time=time.perf_counter() - start,
             )
 
+            if len(kept_triangles.indices) == 0:
+                return
+
             initial_triangles = up_sampled
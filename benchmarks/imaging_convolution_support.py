@@ -0,0 +1,144 @@
+"""
+Benchmark: Imaging Convolution Of Non-Zero Flux Support
+=======================================================
+
+Times the convolution of an image with a PSF as a function of the PSF size and the size of the region of the image
+containing non-zero flux, comparing:
+
+- `Convolver.convolve_image`, which loops over every image and blurring pixel in the mask.
+
+- `convolution.convolved_image_via_support_from`, used by `Tracer.convolve_via_convolver`, which convolves only the
+  smallest rectangular region containing non-zero flux, directly in real space (`direct`) or via an FFT (`fft`).
+
+The image is the light profile of the `autolens.fixtures` galaxies (`make_lp_0`) set to zero outside a circle of a
+given radius, mimicking a compact lensed source whose lens light has been subtracted. The masked imaging of the
+fixtures is 7x7 pixels, too small for the run times to be meaningful, so the same profile is evaluated on a larger
+circular mask.
+
+For every PSF size and support radius the run time of each method is printed alongside the method chosen
+automatically, so that the crossover from direct to FFT convolution can be read off the table. A support radius
+equal to the mask radius corresponds to flux everywhere in the mask.
+
+The `Convolver` is slow without numba, therefore for the largest PSFs this benchmark takes minutes to run if numba is
+not installed.
+
+Run from the root of the repository with:
+
+ python benchmarks/imaging_convolution_support.py
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+from autolens import fixtures
+from autolens.lens import convolution
+
+repeats = 3
+
+shape_native = (140, 140)
+pixel_scales = 0.05
+mask_radius = 2.0
+
+psf_size_list = [3, 11, 21, 31, 51]
+support_radius_list = [0.25, 0.5, 1.0, mask_radius]
+
+
+def run_time_from(func):
+    run_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        run_times.append(time.perf_counter() - start)
+
+    return min(run_times)
+
+
+def compact_image_from(grid, support_radius):
+    image = fixtures.make_lp_0().image_2d_from(grid=grid)
+
+    radii = np.sqrt(np.sum(np.asarray(grid) ** 2.0, axis=1))
+
+    return al.Array2D(
+        values=np.where(radii < support_radius, image, 0.0), mask=grid.mask
+    )
+
+
+if __name__ == "__main__":
+    mask = al.Mask2D.circular(
+        shape_native=shape_native, pixel_scales=pixel_scales, radius=mask_radius
+    )
+
+    over_sampling = al.OverSamplingUniform(sub_size=1)
+
+    grid = al.Grid2D.from_mask(mask=mask, over_sampling=over_sampling)
+
+    print(f"Best of {repeats} repeats, {mask.pixels_in_mask} pixels in the mask.\n")
+    print(
+        f"{'psf':>5}{'support':>9}{'convolver (s)':>15}{'direct (s)':>12}"
+        f"{'fft (s)':>10}{'chosen':>8}{'difference':>13}"
+    )
+
+    for psf_size in psf_size_list:
+        psf = al.Kernel2D.from_gaussian(
+            shape_native=(psf_size, psf_size), sigma=0.2, pixel_scales=pixel_scales
+        )
+
+        convolver = al.Convolver(mask=mask, kernel=psf)
+
+        blurring_grid = al.Grid2D.from_mask(
+            mask=mask.derive_mask.blurring_from(kernel_shape_native=psf.shape_native),
+            over_sampling=over_sampling,
+        )
+
+        for support_radius in support_radius_list:
+            image = compact_image_from(grid=grid, support_radius=support_radius)
+            blurring_image = compact_image_from(
+                grid=blurring_grid, support_radius=support_radius
+            )
+
+            run_time_convolver = run_time_from(
+                lambda: convolver.convolve_image(
+                    image=image, blurring_image=blurring_image
+                )
+            )
+
+            run_time_dict = {
+                method: run_time_from(
+                    lambda: convolution.convolved_image_via_support_from(
+                        image=image,
+                        blurring_image=blurring_image,
+                        convolver=convolver,
+                        method=method,
+                    )
+                )
+                for method in ["direct", "fft"]
+            }
+
+            support_slices = convolution.support_slices_from(
+                array=np.asarray(image.native) + np.asarray(blurring_image.native)
+            )
+
+            method = convolution.convolution_method_from(
+                shape=(
+                    support_slices[0].stop - support_slices[0].start,
+                    support_slices[1].stop - support_slices[1].start,
+                ),
+                kernel=np.asarray(psf.native),
+            )
+
+            difference = np.max(
+                np.abs(
+                    convolver.convolve_image(image=image, blurring_image=blurring_image)
+                    - convolution.convolved_image_via_support_from(
+                        image=image, blurring_image=blurring_image, convolver=convolver
+                    )
+                )
+            )
+
+            print(
+                f"{psf_size:>5}{support_radius:>9.2f}{run_time_convolver:>15.4f}"
+                f"{run_time_dict['direct']:>12.4f}{run_time_dict['fft']:>10.4f}"
+                f"{method:>8}{difference:>13.2e}"
+            )
@@ -0,0 +1,170 @@
+"""
+Benchmark: Imaging Likelihood Process Pool
+==========================================
+
+Times the log likelihood function of `AnalysisImaging` for a batch of model instances and measures the memory of the
+worker processes as a function of the number of cores, comparing:
+
+- A pickled pool, where every worker unpickles its own copy of the analysis (and therefore of the dataset and its
+  grids, PSF and convolver), as happens when a non-linear search parallelizes the likelihood via `multiprocessing`.
+
+- `AnalysisPool`, used by `AnalysisImaging.log_likelihood_function_batch`, whose workers use the arrays of the analysis
+  via shared memory.
+
+The analysis fits one instance before either pool is created, so that the quantities it caches on its first fit (e.g.
+the over sampled grids and convolver of the dataset) are in the analysis sent to the workers.
+
+The memory of a pool is the private memory of each worker (memory not shared with any other process), averaged over the
+workers, after the workers have evaluated the likelihood of every instance once. This is the memory added by every
+extra core. It is read from `/proc`, so the benchmark requires Linux. The size of the arrays of the analysis which
+`AnalysisPool` places in shared memory is also printed.
+
+Run from the root of the repository with:
+
+ python benchmarks/imaging_likelihood_pool.py
+"""
+import multiprocessing
+import os
+import pickle
+import time
+
+import numpy as np
+
+import autofit as af
+import autolens as al
+from autolens.analysis.pool import AnalysisPool
+from autolens.analysis.pool import SharedObject
+from autolens.analysis.pool import log_likelihood_from
+
+repeats = 2
+total_instances = 16
+
+_worker_analysis = None
+
+
+def _initializer(data):
+    global _worker_analysis
+
+    _worker_analysis = pickle.loads(data)
+
+
+def _log_likelihood_from(instance):
+    return log_likelihood_from(analysis=_worker_analysis, instance=instance)
+
+
+def megabytes_from(pool):
+    total = 0
+
+    for process in pool._pool:
+        with open(f"/proc/{process.pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    total += int(line.split()[1])
+
+    return total / 1024 / len(pool._pool)
+
+
+def run_time_from(func):
+    run_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        run_times.append(time.perf_counter() - start)
+
+    return min(run_times)
+
+
+if __name__ == "__main__":
+    shape_native = (200, 200)
+    pixel_scales = 0.05
+
+    mask = al.Mask2D.circular(
+        shape_native=shape_native, pixel_scales=pixel_scales, radius=4.0
+    )
+
+    psf = al.Kernel2D.from_gaussian(
+        shape_native=(21, 21), sigma=0.1, pixel_scales=pixel_scales
+    )
+
+    dataset = al.Imaging(
+        data=al.Array2D.full(
+            fill_value=1.0, shape_native=shape_native, pixel_scales=pixel_scales
+        ),
+        noise_map=al.Array2D.full(
+            fill_value=0.1, shape_native=shape_native, pixel_scales=pixel_scales
+        ),
+        psf=psf,
+        over_sampling=al.OverSamplingDataset(
+            uniform=al.OverSamplingUniform(sub_size=4)
+        ),
+    ).apply_mask(mask=mask)
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(
+                al.Galaxy, redshift=0.5, bulge=al.lp.Sersic, mass=al.mp.Isothermal
+            ),
+            source=af.Model(al.Galaxy, redshift=1.0, bulge=al.lp.Sersic),
+        )
+    )
+
+    analysis = al.AnalysisImaging(dataset=dataset)
+
+    rng = np.random.default_rng(seed=1)
+
+    instances = [
+        model.instance_from_unit_vector(
+            list(rng.uniform(0.3, 0.7, model.prior_count))
+        )
+        for _ in range(total_instances)
+    ]
+
+    analysis.log_likelihood_function(instance=instances[0])
+
+    shared_analysis = SharedObject(obj=analysis)
+    print(f"Arrays in shared memory: {shared_analysis.nbytes / 1024 ** 2:.1f} MB")
+    shared_analysis.close()
+
+    pickled_analysis = pickle.dumps(analysis)
+
+    print(f"Best of {repeats} repeats of {total_instances} instances.\n")
+    print(
+        f"{'cores':>6}{'pickled (s)':>14}{'shared (s)':>13}"
+        f"{'pickled (MB)':>15}{'shared (MB)':>14}{'difference':>13}"
+    )
+
+    for number_of_cores in [1, 2, 4]:
+        with multiprocessing.get_context().Pool(
+            processes=number_of_cores,
+            initializer=_initializer,
+            initargs=(pickled_analysis,),
+        ) as pool:
+            log_likelihood_list_pickled = pool.map(_log_likelihood_from, instances)
+            megabytes_pickled = megabytes_from(pool=pool)
+
+            run_time_pickled = run_time_from(
+                lambda: pool.map(_log_likelihood_from, instances)
+            )
+
+        with AnalysisPool(analysis=analysis, number_of_cores=number_of_cores) as pool:
+            log_likelihood_list_shared = pool.log_likelihood_list_from(
+                instance_list=instances
+            )
+            megabytes_shared = megabytes_from(pool=pool.pool)
+
+            run_time_shared = run_time_from(
+                lambda: pool.log_likelihood_list_from(instance_list=instances)
+            )
+
+        difference = np.max(
+            np.abs(
+                np.array(log_likelihood_list_pickled)
+                - np.array(log_likelihood_list_shared)
+            )
+        )
+
+        print(
+            f"{number_of_cores:>6}{run_time_pickled:>14.3f}{run_time_shared:>13.3f}"
+            f"{megabytes_pickled:>15.1f}{megabytes_shared:>14.1f}{difference:>13.2e}"
+        )
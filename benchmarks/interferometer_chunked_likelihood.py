@@ -0,0 +1,169 @@
+"""
+Benchmark: Interferometer Chunked Likelihood
+============================================
+
+Measures the peak memory and run time of computing the figure of merit of a `FitInterferometer`, and the likelihood
+penalty base of a `PositionsLHPenalty`, for an interferometer dataset with a large synthetic uv coverage, with the
+chi-squared and noise normalization computed over all visibilities at once (`chunk_size=None`) and one chunk of
+visibilities at a time.
+
+The fit's `profile_visibilities` are computed before the measurement starts, because they are the model data every
+mode needs, so the peak memory printed is that of the temporary arrays (e.g. the residual-map and chi-squared-map)
+the calculation allocates on top of the dataset and model visibilities. Memory is measured with `tracemalloc`, which
+tracks the arrays NumPy allocates.
+
+The largest relative difference between the values computed with and without chunks, which should be
+numerical noise, is also printed.
+
+Run from the root of the repository with:
+
+ python benchmarks/interferometer_chunked_likelihood.py
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+import autolens as al
+
+repeats = 5
+
+total_visibilities = 1_000_000
+
+chunk_size_list = [None, 250_000, 50_000, 10_000]
+
+shape_native = (64, 64)
+pixel_scales = 0.1
+mask_radius = 3.0
+
+
+def dataset_from():
+    real_space_mask = al.Mask2D.circular(
+        shape_native=shape_native, pixel_scales=pixel_scales, radius=mask_radius
+    )
+
+    uv_max = 1.0 / (2.0 * pixel_scales * np.pi / (180.0 * 3600.0))
+
+    random = np.random.default_rng(seed=1)
+
+    radius = uv_max * np.sqrt(random.uniform(size=total_visibilities))
+    angle = random.uniform(high=2.0 * np.pi, size=total_visibilities)
+
+    uv_wavelengths = np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=1)
+
+    return al.Interferometer(
+        data=al.Visibilities(
+            visibilities=random.normal(size=total_visibilities)
+            + 1j * random.normal(size=total_visibilities)
+        ),
+        noise_map=al.VisibilitiesNoiseMap(
+            visibilities=np.full(total_visibilities, 1.0 + 1.0j)
+        ),
+        uv_wavelengths=uv_wavelengths,
+        real_space_mask=real_space_mask,
+        transformer_class=al.TransformerNUFFT,
+        over_sampling=al.OverSamplingDataset(
+            uniform=al.OverSamplingUniform(sub_size=1)
+        ),
+    )
+
+
+def tracer_from():
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0, effective_radius=0.8, sersic_index=4.0),
+        mass=al.mp.Isothermal(ell_comps=(0.1, 0.05), einstein_radius=1.2),
+    )
+
+    source = al.Galaxy(
+        redshift=1.0,
+        bulge=al.lp.Sersic(
+            centre=(0.05, 0.05),
+            intensity=1.0,
+            effective_radius=0.2,
+            sersic_index=1.5,
+        ),
+    )
+
+    return al.Tracer(galaxies=[lens, source])
+
+
+def peak_memory_and_run_time_from(func):
+    tracemalloc.start()
+
+    start = time.perf_counter()
+
+    for _ in range(repeats):
+        value = func()
+
+    run_time = (time.perf_counter() - start) / repeats
+
+    _, peak_memory = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return value, peak_memory / 1.0e6, run_time
+
+
+if __name__ == "__main__":
+    dataset = dataset_from()
+    tracer = tracer_from()
+
+    profile_visibilities = al.FitInterferometer(
+        dataset=dataset, tracer=tracer
+    ).profile_visibilities
+
+    positions_likelihood = al.PositionsLHPenalty(
+        positions=al.Grid2DIrregular([(1.0, 1.0), (-1.0, -1.0)]), threshold=0.1
+    )
+
+    print(
+        f"{total_visibilities} visibilities "
+        f"({dataset.data.nbytes / 1.0e6:.0f} MB of complex data).\n"
+    )
+    print(
+        f"{'':>12}{'figure of merit':>34}{'penalty base':>34}\n"
+        f"{'chunk size':>12}{'peak (MB)':>12}{'time (s)':>10}{'rel diff':>12}"
+        f"{'peak (MB)':>12}{'time (s)':>10}{'rel diff':>12}"
+    )
+
+    figure_of_merit_no_chunks = None
+    penalty_base_no_chunks = None
+
+    for chunk_size in chunk_size_list:
+        fit = al.FitInterferometer(
+            dataset=dataset, tracer=tracer, chunk_size=chunk_size
+        )
+        fit.profile_visibilities = profile_visibilities
+
+        figure_of_merit, fit_peak_memory, fit_run_time = peak_memory_and_run_time_from(
+            func=lambda: fit.figure_of_merit
+        )
+
+        (
+            penalty_base,
+            penalty_peak_memory,
+            penalty_run_time,
+        ) = peak_memory_and_run_time_from(
+            func=lambda: positions_likelihood.log_likelihood_penalty_base_from(
+                dataset=dataset, chunk_size=chunk_size
+            )
+        )
+
+        if chunk_size is None:
+            figure_of_merit_no_chunks = figure_of_merit
+            penalty_base_no_chunks = penalty_base
+
+        fit_diff = abs(figure_of_merit - figure_of_merit_no_chunks) / abs(
+            figure_of_merit_no_chunks
+        )
+        penalty_diff = abs(penalty_base - penalty_base_no_chunks) / abs(
+            penalty_base_no_chunks
+        )
+
+        print(
+            f"{str(chunk_size):>12}"
+            f"{fit_peak_memory:>12.1f}{fit_run_time:>10.4f}{fit_diff:>12.2e}"
+            f"{penalty_peak_memory:>12.1f}{penalty_run_time:>10.4f}"
+            f"{penalty_diff:>12.2e}"
+        )
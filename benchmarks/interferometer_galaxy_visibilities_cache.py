@@ -0,0 +1,200 @@
+"""
+Benchmark: Interferometer Galaxy Visibilities Cache
+===================================================
+
+Times the fit of an interferometer dataset with a large synthetic uv coverage, with and without the
+`GalaxyVisibilitiesCache` of `FitInterferometer`, which caches the visibilities of every galaxy so that only the
+galaxies whose parameters changed since a previous fit are ray-traced, evaluated and Fourier transformed.
+
+The tracer has a lens galaxy with light and mass profiles and a source galaxy with a light profile. Three sequences
+of fits are timed, mimicking the proposals of a non-linear search:
+
+- `all light varies`: every fit changes the light of both galaxies, so nothing is taken from the cache and the summed
+  images are Fourier transformed once, as they are without the cache.
+
+- `source light varies`: every fit changes the source's intensity, so the lens visibilities are taken from the cache
+  and only the source is evaluated and Fourier transformed.
+
+- `lens mass varies`: every fit changes the lens's mass and the source is a linear light profile, solved for via an
+  inversion. The lens light visibilities are taken from the cache, so no light profile image is Fourier transformed
+  outside the inversion.
+
+The uv coverage is `total_visibilities` points drawn uniformly within a disk whose radius is the largest baseline
+(in wavelengths) sampled by the real-space mask's pixels, and the visibilities are computed via a `TransformerNUFFT`.
+The average run time of the fit's `profile_visibilities` (the part of the fit the cache speeds up) and of the whole
+fit are printed for every sequence, including the first fits which fill the cache, alongside the largest relative
+difference between the figures of merit computed with and without the cache, which should be
+numerical noise.
+
+Run from the root of the repository with:
+
+ python benchmarks/interferometer_galaxy_visibilities_cache.py
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+from autolens.interferometer.galaxy_visibilities_cache import GalaxyVisibilitiesCache
+
+repeats = 10
+
+total_visibilities = 1_000_000
+
+shape_native = (128, 128)
+pixel_scales = 0.05
+mask_radius = 3.0
+
+
+def dataset_from():
+    real_space_mask = al.Mask2D.circular(
+        shape_native=shape_native, pixel_scales=pixel_scales, radius=mask_radius
+    )
+
+    uv_max = 1.0 / (2.0 * pixel_scales * np.pi / (180.0 * 3600.0))
+
+    random = np.random.default_rng(seed=1)
+
+    radius = uv_max * np.sqrt(random.uniform(size=total_visibilities))
+    angle = random.uniform(high=2.0 * np.pi, size=total_visibilities)
+
+    uv_wavelengths = np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=1)
+
+    return al.Interferometer(
+        data=al.Visibilities(
+            visibilities=random.normal(size=total_visibilities)
+            + 1j * random.normal(size=total_visibilities)
+        ),
+        noise_map=al.VisibilitiesNoiseMap(
+            visibilities=np.full(total_visibilities, 1.0 + 1.0j)
+        ),
+        uv_wavelengths=uv_wavelengths,
+        real_space_mask=real_space_mask,
+        transformer_class=al.TransformerNUFFT,
+        over_sampling=al.OverSamplingDataset(
+            uniform=al.OverSamplingUniform(sub_size=1),
+            pixelization=al.OverSamplingUniform(sub_size=1),
+        ),
+    )
+
+
+def tracer_from(
+    lens_intensity=1.0, source_intensity=1.0, einstein_radius=1.2, linear=False
+):
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(
+            ell_comps=(0.05, 0.0),
+            intensity=lens_intensity,
+            effective_radius=0.8,
+            sersic_index=4.0,
+        ),
+        mass=al.mp.Isothermal(
+            ell_comps=(0.1, 0.05), einstein_radius=einstein_radius
+        ),
+    )
+
+    if linear:
+        bulge = al.lp_linear.Sersic(
+            centre=(0.05, 0.05), effective_radius=0.2, sersic_index=1.5
+        )
+    else:
+        bulge = al.lp.Sersic(
+            centre=(0.05, 0.05),
+            intensity=source_intensity,
+            effective_radius=0.2,
+            sersic_index=1.5,
+        )
+
+    source = al.Galaxy(redshift=1.0, bulge=bulge)
+
+    return al.Tracer(galaxies=[lens, source])
+
+
+def run_time_from(dataset, tracer_list, galaxy_visibilities_cache):
+    figure_of_merit_list = []
+
+    run_time_profile = 0.0
+    run_time = 0.0
+
+    for tracer in tracer_list:
+        start = time.perf_counter()
+
+        fit = al.FitInterferometer(
+            dataset=dataset,
+            tracer=tracer,
+            galaxy_visibilities_cache=galaxy_visibilities_cache,
+        )
+
+        fit.profile_visibilities
+
+        run_time_profile += time.perf_counter() - start
+
+        figure_of_merit_list.append(fit.figure_of_merit)
+
+        run_time += time.perf_counter() - start
+
+    return (
+        run_time_profile / len(tracer_list),
+        run_time / len(tracer_list),
+        np.array(figure_of_merit_list),
+    )
+
+
+if __name__ == "__main__":
+    dataset = dataset_from()
+
+    print(
+        f"{total_visibilities} visibilities, {dataset.real_space_mask.pixels_in_mask} "
+        f"pixels in the real-space mask, {repeats} fits per sequence.\n"
+    )
+    print(
+        f"{'':>22}{'profile visibilities (s)':>30}{'fit (s)':>24}\n"
+        f"{'sequence':>22}{'no cache':>10}{'cache':>10}{'speed up':>10}"
+        f"{'no cache':>10}{'cache':>10}{'rel diff':>12}"
+    )
+
+    intensity_list = np.linspace(1.0, 2.0, repeats)
+
+    sequence_dict = {
+        "all light varies": [
+            tracer_from(lens_intensity=intensity, source_intensity=intensity)
+            for intensity in intensity_list
+        ],
+        "source light varies": [
+            tracer_from(source_intensity=intensity) for intensity in intensity_list
+        ],
+        "lens mass varies": [
+            tracer_from(einstein_radius=1.2 * intensity, linear=True)
+            for intensity in intensity_list
+        ],
+    }
+
+    for name, tracer_list in sequence_dict.items():
+        (
+            run_time_profile_no_cache,
+            run_time_no_cache,
+            figure_of_merit_no_cache,
+        ) = run_time_from(
+            dataset=dataset, tracer_list=tracer_list, galaxy_visibilities_cache=None
+        )
+
+        galaxy_visibilities_cache = GalaxyVisibilitiesCache()
+
+        run_time_profile_cache, run_time_cache, figure_of_merit_cache = run_time_from(
+            dataset=dataset,
+            tracer_list=tracer_list,
+            galaxy_visibilities_cache=galaxy_visibilities_cache,
+        )
+
+        max_diff = np.max(
+            np.abs(figure_of_merit_cache - figure_of_merit_no_cache)
+            / np.abs(figure_of_merit_no_cache)
+        )
+
+        print(
+            f"{name:>22}"
+            f"{run_time_profile_no_cache:>10.4f}{run_time_profile_cache:>10.4f}"
+            f"{run_time_profile_no_cache / run_time_profile_cache:>10.2f}"
+            f"{run_time_no_cache:>10.4f}{run_time_cache:>10.4f}{max_diff:>12.2e}"
+        )
@@ -0,0 +1,115 @@
+"""
+Benchmark: Multi-Plane Ray Tracing
+==================================
+
+Times `tracer_util.traced_grid_2d_list_from` as a function of the number of planes, comparing the recursive
+multi-plane lens equation (which keeps only the previous two planes) to the summed formulation (which rescales and
+sums the deflection angles of every previous plane).
+
+The run time of the recursive calculation should grow linearly with the number of planes, whereas the summed
+calculation grows with the square of the number of planes once the grid is large enough that memory traffic
+dominates.
+
+Run from the root of the repository with:
+
+ python benchmarks/multi_plane_ray_tracing.py
+"""
+import time
+
+import numpy as np
+
+import autolens as al
+from autolens.lens import tracer_util
+
+repeats = 3
+
+grid = al.Grid2D.uniform(shape_native=(500, 500), pixel_scales=0.01)
+
+
+def traced_grid_2d_list_via_sum_from(planes, grid, cosmology):
+    """
+    The summed multi-plane lens equation, which the recursive calculation is compared against.
+    """
+    redshift_list = [galaxies[0].redshift for galaxies in planes]
+
+    scaling_factor_matrix = tracer_util.scaling_factor_matrix_from(
+        redshift_list=redshift_list, cosmology=cosmology
+    )
+
+    traced_grid_list = []
+    traced_deflection_list = []
+
+    for plane_index, galaxies in enumerate(planes):
+        scaled_grid = grid.copy()
+
+        for previous_plane_index in range(plane_index):
+            scaled_grid -= (
+                scaling_factor_matrix[previous_plane_index, plane_index]
+                * traced_deflection_list[previous_plane_index]
+            )
+
+        traced_grid_list.append(scaled_grid)
+        traced_deflection_list.append(
+            sum(g.deflections_yx_2d_from(grid=scaled_grid) for g in galaxies)
+        )
+
+    return traced_grid_list
+
+
+def run_time_from(func, **kwargs):
+    run_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(**kwargs)
+        run_times.append(time.perf_counter() - start)
+
+    return min(run_times)
+
+
+print(f"Grid of {grid.shape[0]} (y,x) coordinates, best of {repeats} repeats.\n")
+print(f"{'planes':>8}{'recursive (s)':>16}{'summed (s)':>14}{'max difference':>18}")
+
+for total_planes in [2, 5, 10, 20, 40]:
+    galaxies = [
+        al.Galaxy(
+            redshift=redshift,
+            mass=al.mp.IsothermalSph(
+                centre=(0.01 * index, 0.0), einstein_radius=0.05
+            ),
+        )
+        for index, redshift in enumerate(np.linspace(0.1, 3.0, total_planes))
+    ]
+
+    planes = tracer_util.planes_from(galaxies=galaxies)
+
+    cosmology = al.cosmo.Planck15()
+
+    recursive = tracer_util.traced_grid_2d_list_from(
+        planes=planes, grid=grid, cosmology=cosmology
+    )
+    summed = traced_grid_2d_list_via_sum_from(
+        planes=planes, grid=grid, cosmology=cosmology
+    )
+
+    max_difference = max(
+        np.max(np.abs(np.asarray(recursive_grid) - np.asarray(summed_grid)))
+        for recursive_grid, summed_grid in zip(recursive, summed)
+    )
+
+    recursive_time = run_time_from(
+        tracer_util.traced_grid_2d_list_from,
+        planes=planes,
+        grid=grid,
+        cosmology=cosmology,
+    )
+    summed_time = run_time_from(
+        traced_grid_2d_list_via_sum_from,
+        planes=planes,
+        grid=grid,
+        cosmology=cosmology,
+    )
+
+    print(
+        f"{total_planes:>8}{recursive_time:>16.4f}{summed_time:>14.4f}{max_difference:>18.2e}"
+    )
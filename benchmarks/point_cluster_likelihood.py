@@ -0,0 +1,119 @@
+"""
+Benchmark: Point Source Cluster Likelihood
+==========================================
+
+Times the log likelihood of a cluster-scale point source model as a function of the number of point source datasets,
+comparing:
+
+- The summed analysis approach, where every dataset has its own `AnalysisPoint` and the log likelihoods are summed,
+  such that the tracer is rebuilt and the point solver is run separately for every dataset.
+
+- `AnalysisPointList`, which fits every dataset with one tracer and solves for the image-plane positions of all point
+  sources together via `PointSolver.solve_many`, with the fits evaluated over one or more threads.
+
+Run from the root of the repository with:
+
+ python benchmarks/point_cluster_likelihood.py
+"""
+import time
+
+import autofit as af
+import autolens as al
+import numpy as np
+
+repeats = 3
+
+grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+solver = al.PointSolver.for_grid(grid=grid, pixel_scale_precision=0.001)
+
+
+def run_time_from(func):
+    run_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        run_times.append(time.perf_counter() - start)
+
+    return min(run_times)
+
+
+print(f"Best of {repeats} repeats.\n")
+print(
+    f"{'datasets':>10}{'summed (s)':>14}{'list (s)':>12}{'list x4 (s)':>14}{'difference':>14}"
+)
+
+for total_datasets in [5, 20, 50, 100]:
+    rng = np.random.default_rng(seed=1)
+
+    centre_list = rng.uniform(-0.3, 0.3, (total_datasets, 2))
+    redshift_list = rng.choice([1.0, 1.5, 2.0], total_datasets)
+
+    galaxies = af.Collection(
+        lens=al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.Isothermal(
+                einstein_radius=1.6,
+                ell_comps=al.convert.ell_comps_from(axis_ratio=0.8, angle=45.0),
+            ),
+        ),
+        **{
+            f"source_{index}": al.Galaxy(
+                redshift=redshift,
+                **{f"point_{index}": al.ps.Point(centre=tuple(centre))},
+            )
+            for index, (centre, redshift) in enumerate(zip(centre_list, redshift_list))
+        },
+    )
+
+    instance = af.Collection(galaxies=galaxies).instance_from_unit_vector([])
+
+    tracer = al.Tracer(galaxies=list(instance.galaxies))
+
+    dataset_list = []
+
+    for index, (centre, redshift) in enumerate(zip(centre_list, redshift_list)):
+        positions = solver.solve(
+            tracer=tracer,
+            source_plane_coordinate=tuple(centre),
+            source_plane_redshift=redshift,
+        )
+
+        dataset_list.append(
+            al.PointDataset(
+                name=f"point_{index}",
+                positions=np.asarray(positions)
+                + rng.normal(0.0, 0.01, positions.shape),
+                positions_noise_map=0.01,
+            )
+        )
+
+    analysis_list = [
+        al.AnalysisPoint(dataset=dataset, solver=solver) for dataset in dataset_list
+    ]
+
+    def log_likelihood_via_sum():
+        return sum(
+            analysis.log_likelihood_function(instance=instance)
+            for analysis in analysis_list
+        )
+
+    analysis = al.AnalysisPointList(dataset_list=dataset_list, solver=solver)
+    analysis_threads = al.AnalysisPointList(
+        dataset_list=dataset_list, solver=solver, number_of_threads=4
+    )
+
+    def log_likelihood_via_list():
+        return analysis.log_likelihood_function(instance=instance)
+
+    def log_likelihood_via_list_threads():
+        return analysis_threads.log_likelihood_function(instance=instance)
+
+    difference = abs(log_likelihood_via_sum() - log_likelihood_via_list())
+
+    print(
+        f"{total_datasets:>10}{run_time_from(log_likelihood_via_sum):>14.4f}"
+        f"{run_time_from(log_likelihood_via_list):>12.4f}"
+        f"{run_time_from(log_likelihood_via_list_threads):>14.4f}{difference:>14.2e}"
+    )
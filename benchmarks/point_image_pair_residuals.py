@@ -0,0 +1,123 @@
+"""
+Benchmark: Point Source Image-Pair Residuals
+============================================
+
+Times the residual-maps of the image-pair position fits (`FitPositionsImagePair`, `FitPositionsImagePairAll` and
+`FitPositionsImagePairRepeat`) as a function of the number of image positions, comparing the vectorized distance matrix
+used by the fits to the Python loops over `square_distance` they previously used.
+
+A `MockPointSolver` supplies the model positions, so only the pairing calculation is timed. A new fit is created for
+every evaluation, as happens for every likelihood evaluation of a model-fit.
+
+Run from the root of the repository with:
+
+ python benchmarks/point_image_pair_residuals.py
+"""
+import time
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+import autolens as al
+
+repeats = 5
+
+square_distance = al.AbstractFitPositionsImagePair.square_distance
+
+
+def residual_map_pair_via_loop_from(data, model_data):
+    cost_matrix = np.linalg.norm(
+        np.array(data)[:, np.newaxis] - np.array(model_data), axis=2
+    )
+
+    data_indexes, model_indexes = linear_sum_assignment(cost_matrix)
+
+    return [
+        np.sqrt(square_distance(data[data_index], model_data[model_index]))
+        for data_index, model_index in zip(data_indexes, model_indexes)
+    ]
+
+
+def residual_map_all_via_loop_from(data, model_data):
+    return [
+        np.sqrt(square_distance(position, model_position))
+        for model_position in model_data
+        for position in data
+    ]
+
+
+def residual_map_repeat_via_loop_from(data, model_data):
+    return [
+        np.sqrt(
+            min(
+                square_distance(model_position, position)
+                for model_position in model_data
+            )
+        )
+        for position in data
+    ]
+
+
+def run_time_from(func):
+    run_times = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        run_times.append(time.perf_counter() - start)
+
+    return min(run_times)
+
+
+tracer = al.Tracer(
+    galaxies=[
+        al.Galaxy(redshift=0.5),
+        al.Galaxy(redshift=1.0, point_0=al.ps.Point(centre=(0.0, 0.0))),
+    ]
+)
+
+fit_cls_dict = {
+    "pair": (al.FitPositionsImagePair, residual_map_pair_via_loop_from),
+    "all": (al.FitPositionsImagePairAll, residual_map_all_via_loop_from),
+    "repeat": (al.FitPositionsImagePairRepeat, residual_map_repeat_via_loop_from),
+}
+
+print(f"Best of {repeats} repeats.\n")
+print(f"{'fit':>8}{'images':>8}{'vectorized (s)':>17}{'loop (s)':>12}{'max difference':>18}")
+
+for total_images in [4, 16, 64, 256]:
+    rng = np.random.default_rng(seed=1)
+
+    data = al.Grid2DIrregular(values=rng.uniform(-2.0, 2.0, (total_images, 2)))
+    model_data = al.Grid2DIrregular(
+        values=np.asarray(data) + rng.normal(0.0, 0.01, (total_images, 2))
+    )
+    noise_map = al.ArrayIrregular(values=np.full(total_images, 0.05))
+
+    solver = al.m.MockPointSolver(model_positions=model_data)
+
+    for name, (fit_cls, residual_map_via_loop_from) in fit_cls_dict.items():
+
+        def residual_map_via_fit():
+            return fit_cls(
+                name="point_0",
+                data=data,
+                noise_map=noise_map,
+                tracer=tracer,
+                solver=solver,
+            ).residual_map
+
+        def residual_map_via_loop():
+            return residual_map_via_loop_from(data=data, model_data=model_data)
+
+        max_difference = np.max(
+            np.abs(
+                np.asarray(residual_map_via_fit())
+                - np.asarray(residual_map_via_loop())
+            )
+        )
+
+        print(
+            f"{name:>8}{total_images:>8}{run_time_from(residual_map_via_fit):>17.5f}"
+            f"{run_time_from(residual_map_via_loop):>12.5f}{max_difference:>18.2e}"
+        )
@@ -1,6 +1,7 @@
 from os import path
 import os
 import pytest
+import shutil
 
 from autoconf import conf
 from autoconf.dictable import from_json
@@ -65,6 +66,139 @@ def test__check_preloads(masked_imaging_7x7):
         analysis.preloads.check_via_fit(fit=fit)
 
 
+def test__figure_of_merit_reusing_stages_from(masked_imaging_7x7):
+    lens = af.Model(
+        al.Galaxy,
+        redshift=0.5,
+        light=al.lp.Sersic(intensity=0.1),
+        mass=al.mp.IsothermalSph,
+    )
+
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant,
+    )
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7,
+        raise_inversion_positions_likelihood_exception=False,
+        reuse_previous_fit=True,
+    )
+
+    analysis.set_preloads(paths=af.DirectoryPaths(), model=model)
+
+    assert analysis.preloads.blurred_image is None
+
+    instance_0 = model.instance_from_vector([0.1, 0.2, 1.0, 0.5])
+    instance_1 = model.instance_from_vector([0.1, 0.2, 1.0, 0.8])
+
+    analysis.figure_of_merit_reusing_stages_from(instance=instance_0)
+
+    preloads = analysis.preloads_via_key_dict_from(
+        key_dict=analysis.dependencies.key_dict_from(instance=instance_1)
+    )
+
+    assert (preloads.blurred_image == analysis.previous_fit.blurred_image).all()
+    assert preloads.curvature_matrix is not None
+    assert preloads.regularization_matrix is None
+    assert (
+        preloads.reusable_mapper_list
+        is analysis.previous_fit.tracer_to_inversion.reusable_mapper_list
+    )
+
+    figure_of_merit = analysis.figure_of_merit_reusing_stages_from(
+        instance=instance_1
+    )
+
+    fit = al.FitImaging(
+        dataset=masked_imaging_7x7, tracer=al.Tracer(galaxies=instance_1.galaxies)
+    )
+
+    assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+
+def test__figure_of_merit_reusing_stages_from__traced_grid_cache(masked_imaging_7x7):
+    lens = af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph)
+
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant,
+    )
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7,
+        raise_inversion_positions_likelihood_exception=False,
+    )
+
+    analysis.set_preloads(paths=af.DirectoryPaths(), model=model)
+
+    instance_0 = model.instance_from_vector([0.1, 0.2, 1.0, 0.5])
+    instance_1 = model.instance_from_vector([0.1, 0.2, 1.2, 0.5])
+    instance_2 = model.instance_from_vector([0.1, 0.2, 1.0, 0.8])
+
+    analysis.figure_of_merit_reusing_stages_from(instance=instance_0)
+    analysis.figure_of_merit_reusing_stages_from(instance=instance_1)
+
+    assert len(analysis.traced_grid_cache) == 2
+
+    figure_of_merit = analysis.figure_of_merit_reusing_stages_from(
+        instance=instance_2
+    )
+
+    assert analysis.traced_grid_cache.hits == 1
+    assert analysis.traced_grid_cache.misses == 1
+    assert analysis.previous_fit is None
+
+    fit = al.FitImaging(
+        dataset=masked_imaging_7x7, tracer=al.Tracer(galaxies=instance_2.galaxies)
+    )
+
+    assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+
+def test__modify_after_fit__image_mesh_cache_output_and_no_longer_output(
+    masked_imaging_7x7, tmp_path
+):
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    file_path = tmp_path / "search_internal" / "image_mesh_cache.npz"
+    file_path.parent.mkdir()
+
+    analysis.image_mesh_cache.load_from(file_path=file_path)
+    analysis.image_mesh_cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+        mask=masked_imaging_7x7.mask,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert not file_path.exists()
+
+    analysis.modify_after_fit(paths=af.DirectoryPaths(), model=None, result=None)
+
+    assert file_path.exists()
+    assert analysis.image_mesh_cache.file_path is None
+
+    shutil.rmtree(file_path.parent)
+
+    analysis.image_mesh_cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(4, 4)),
+        mask=masked_imaging_7x7.mask,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert len(analysis.image_mesh_cache) == 2
+
+
 def test__save_results__tracer_output_to_json(analysis_imaging_7x7):
     lens = al.Galaxy(redshift=0.5)
     source = al.Galaxy(redshift=1.0)
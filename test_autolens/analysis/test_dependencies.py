@@ -0,0 +1,98 @@
+import autofit as af
+
+import autolens as al
+from autolens.analysis.dependencies import ModelDependencies
+
+
+def test__groups_and_constant_stages():
+    lens = af.Model(
+        al.Galaxy,
+        redshift=0.5,
+        light=al.lp.Sersic(),
+        mass=al.mp.IsothermalSph,
+    )
+
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant,
+    )
+
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    dependencies = ModelDependencies(model=model)
+
+    assert dependencies.group_list_of_paths == [
+        ["mass"],
+        ["mass"],
+        ["mass"],
+        ["regularization"],
+    ]
+
+    assert dependencies.constant_stage_list == [
+        "w_tilde",
+        "image_plane_mesh_grid_pg_list",
+    ]
+
+    model.galaxies.lens.mass = al.mp.IsothermalSph()
+
+    dependencies = ModelDependencies(model=model)
+
+    assert dependencies.is_constant(stage="blurred_image")
+    assert dependencies.is_constant(stage="curvature_matrix")
+    assert not dependencies.is_constant(stage="regularization_matrix")
+
+
+def test__constant_stages__free_redshift__w_tilde_constant():
+    lens = af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph())
+
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant(),
+    )
+
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+    source.redshift = af.UniformPrior(lower_limit=1.0, upper_limit=2.0)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    dependencies = ModelDependencies(model=model)
+
+    assert dependencies.group_list_of_paths == [["other"]]
+    assert dependencies.constant_stage_list == ["w_tilde"]
+
+
+def test__key_dict_from():
+    lens = af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph)
+    lens.mass.einstein_radius = af.UniformPrior(lower_limit=0.0, upper_limit=2.0)
+
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant,
+    )
+    pixelization.regularization.coefficient = af.UniformPrior(
+        lower_limit=0.0, upper_limit=2.0
+    )
+
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    dependencies = ModelDependencies(model=model)
+
+    key_dict_0 = dependencies.key_dict_from(
+        instance=model.instance_from_vector([0.1, 0.2, 1.0, 1.0])
+    )
+    key_dict_1 = dependencies.key_dict_from(
+        instance=model.instance_from_vector([0.1, 0.2, 1.0, 1.5])
+    )
+
+    assert "w_tilde" not in key_dict_0
+    assert key_dict_0["curvature_matrix"] == (0.1, 0.2, 1.0)
+    assert key_dict_0["curvature_matrix"] == key_dict_1["curvature_matrix"]
+    assert key_dict_0["regularization_matrix"] == (0.1, 0.2, 1.0, 1.0)
+    assert key_dict_0["regularization_matrix"] != key_dict_1["regularization_matrix"]
@@ -0,0 +1,134 @@
+import numpy as np
+import shutil
+
+import autolens as al
+from autolens.analysis.image_mesh_cache import ImageMeshCache
+
+
+def test__image_plane_mesh_grid_from__cached_on_image_mesh_mask_and_adapt_data(
+    mask_2d_7x7,
+):
+    cache = ImageMeshCache(max_entries=2)
+
+    adapt_data = al.Array2D(values=np.arange(1.0, 10.0), mask=mask_2d_7x7)
+
+    image_plane_mesh_grid = cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert (
+        cache.image_plane_mesh_grid_from(
+            image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+            mask=al.Mask2D(mask=np.array(mask_2d_7x7), pixel_scales=1.0),
+            adapt_data=None,
+            settings=al.SettingsInversion(),
+        )
+        is image_plane_mesh_grid
+    )
+    assert (
+        cache.image_plane_mesh_grid_from(
+            image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+            mask=mask_2d_7x7,
+            adapt_data=adapt_data,
+            settings=al.SettingsInversion(),
+        )
+        is not image_plane_mesh_grid
+    )
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+    cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(4, 4)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert len(cache) == 2
+    assert (
+        cache.image_plane_mesh_grid_from(
+            image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+            mask=mask_2d_7x7,
+            adapt_data=None,
+            settings=al.SettingsInversion(),
+        )
+        is not image_plane_mesh_grid
+    )
+
+
+def test__load_from__loads_image_plane_mesh_grids_output_when_added(
+    mask_2d_7x7, tmp_path
+):
+    file_path = tmp_path / "image_mesh_cache.npz"
+
+    cache = ImageMeshCache(output_interval=2)
+    cache.load_from(file_path=file_path)
+
+    image_plane_mesh_grid = cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert not file_path.exists()
+
+    cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(4, 4)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert file_path.exists()
+
+    cache = ImageMeshCache()
+    cache.load_from(file_path=file_path)
+
+    assert len(cache) == 2
+
+    image_plane_mesh_grid_loaded = cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert cache.hits == 1
+    assert isinstance(image_plane_mesh_grid_loaded, al.Grid2DIrregular)
+    assert (
+        np.asarray(image_plane_mesh_grid_loaded) == np.asarray(image_plane_mesh_grid)
+    ).all()
+
+
+def test__flush__folder_of_file_removed__stops_output(mask_2d_7x7, tmp_path):
+    file_path = tmp_path / "search_internal" / "image_mesh_cache.npz"
+    file_path.parent.mkdir()
+
+    cache = ImageMeshCache(output_interval=1)
+    cache.load_from(file_path=file_path)
+
+    cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert file_path.exists()
+
+    shutil.rmtree(file_path.parent)
+
+    cache.image_plane_mesh_grid_from(
+        image_mesh=al.image_mesh.Overlay(shape=(4, 4)),
+        mask=mask_2d_7x7,
+        adapt_data=None,
+        settings=al.SettingsInversion(),
+    )
+
+    assert cache.file_path is None
+    assert len(cache) == 2
+    assert not file_path.parent.exists()
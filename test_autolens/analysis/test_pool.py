@@ -0,0 +1,97 @@
+import gc
+import numpy as np
+import pickle
+import pytest
+from multiprocessing import shared_memory
+
+import autofit as af
+import autolens as al
+from autolens.analysis.pool import AnalysisPool
+from autolens.analysis.pool import SharedObject
+from autolens.analysis.pool import object_from
+
+
+def test__shared_object__arrays_are_views_of_shared_memory():
+    array = np.arange(10.0)
+
+    shared_object = SharedObject(obj={"array": array, "value": 1})
+
+    obj, memory = object_from(handle=shared_object.handle)
+
+    assert obj["value"] == 1
+    assert (obj["array"] == array).all()
+    assert not obj["array"].flags.writeable
+    assert shared_object.nbytes == 80
+
+    with pytest.raises(ValueError):
+        obj["array"][0] = 5.0
+
+    memory.buf[0:8] = np.array([5.0]).tobytes()
+
+    assert obj["array"][0] == 5.0
+
+    del obj
+    memory.close()
+    shared_object.close()
+
+
+def test__log_likelihood_function_batch(masked_imaging_7x7):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(al.Galaxy, redshift=0.5, light=al.lp.SersicSph)
+        )
+    )
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    instances = [
+        model.instance_from_vector([0.0, 0.0, intensity, 1.0, 2.0])
+        for intensity in [0.1, 0.2, 0.3]
+    ]
+
+    log_likelihood_list = [
+        analysis.log_likelihood_function(instance=instance) for instance in instances
+    ]
+
+    assert analysis.log_likelihood_function_batch(
+        instances=instances
+    ) == pytest.approx(log_likelihood_list, 1.0e-8)
+    assert analysis.log_likelihood_function_batch(
+        instances=instances, number_of_cores=2
+    ) == pytest.approx(log_likelihood_list, 1.0e-8)
+
+    analysis_pool = analysis.analysis_pool
+
+    assert analysis_pool is not None
+    assert analysis.log_likelihood_function_batch(
+        instances=instances, number_of_cores=2
+    ) == pytest.approx(log_likelihood_list, 1.0e-8)
+    assert analysis.analysis_pool is analysis_pool
+
+    analysis.previous_fit = analysis.fit_from(instance=instances[0])
+
+    analysis_unpickled = pickle.loads(pickle.dumps(analysis))
+
+    assert analysis_unpickled.previous_fit is None
+    assert analysis_unpickled.analysis_pool is None
+
+    analysis.modify_after_fit(paths=af.DirectoryPaths(), model=model, result=None)
+
+    assert analysis.analysis_pool is None
+    assert not analysis_pool._finalizer.alive
+
+
+def test__analysis_pool__not_closed__shared_memory_freed_when_garbage_collected(
+    masked_imaging_7x7,
+):
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    analysis_pool = AnalysisPool(analysis=analysis, number_of_cores=1)
+
+    name = analysis_pool.shared_analysis.shared_memory.name
+
+    del analysis_pool
+    gc.collect()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -4,6 +4,7 @@ from os import path
 import autofit as af
 
 import autolens as al
+from autolens.analysis.dependencies import ModelDependencies
 
 
 def test__set_traced_grids_of_planes():
@@ -90,6 +91,56 @@ def test__set_mesh_grid_of_planes():
     assert (preloads.image_plane_mesh_grid_pg_list[1] == np.array([[1.0]])).all()
 
 
+def test__setup_all_via_dependencies(masked_imaging_7x7):
+    pixelization = af.Model(
+        al.Pixelization,
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant,
+    )
+
+    lens = al.Galaxy(
+        redshift=0.5,
+        light=al.lp.Sersic(intensity=0.1),
+        mass=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+    source = af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    instance = model.instance_from_prior_medians()
+
+    fit = al.FitImaging(
+        dataset=masked_imaging_7x7, tracer=al.Tracer(galaxies=instance.galaxies)
+    )
+
+    preloads = al.Preloads.setup_all_via_dependencies(
+        fit=fit, dependencies=ModelDependencies(model=model)
+    )
+
+    assert (preloads.blurred_image == fit.blurred_image).all()
+    assert preloads.traced_grids_of_planes_for_inversion is not None
+    assert (preloads.curvature_matrix == fit.inversion.curvature_matrix).all()
+    assert preloads.regularization_matrix is None
+    assert preloads.log_det_regularization_matrix_term is None
+
+    # The mass model varies, so every stage depending on the mass is not preloaded.
+
+    model.galaxies.lens = af.Model(
+        al.Galaxy,
+        redshift=0.5,
+        light=al.lp.Sersic(intensity=0.1),
+        mass=al.mp.IsothermalSph,
+    )
+
+    preloads = al.Preloads.setup_all_via_dependencies(
+        fit=fit, dependencies=ModelDependencies(model=model)
+    )
+
+    assert preloads.blurred_image is None
+    assert preloads.traced_grids_of_planes_for_inversion is None
+    assert preloads.curvature_matrix is None
+
+
 def test__info():
     file_path = path.join("{}".format(path.dirname(path.realpath(__file__))), "files")
 
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from autolens.analysis.traced_grid_cache import TracedGridCache
+
+
+def test__traced_grid_list_from__hits_misses_and_bytes():
+    cache = TracedGridCache()
+
+    traced_grid_list = [None, np.ones((10, 2))]
+
+    assert cache.traced_grid_list_from(key=(1.0, 2.0)) is None
+
+    cache.add(key=(1.0, 2.0), traced_grid_list=traced_grid_list)
+
+    assert cache.traced_grid_list_from(key=(1.0, 2.0)) is traced_grid_list
+    assert cache.traced_grid_list_from(key=None) is None
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == pytest.approx(0.5, 1.0e-4)
+    assert cache.bytes == 160
+
+
+def test__add__least_recently_used_removed_when_max_bytes_exceeded():
+    cache = TracedGridCache(max_bytes=400)
+
+    cache.add(key=(1.0,), traced_grid_list=[None, np.ones((10, 2))])
+    cache.add(key=(2.0,), traced_grid_list=[None, np.ones((10, 2))])
+
+    cache.traced_grid_list_from(key=(1.0,))
+
+    cache.add(key=(3.0,), traced_grid_list=[None, np.ones((10, 2))])
+
+    assert len(cache) == 2
+    assert cache.bytes == 320
+    assert cache.traced_grid_list_from(key=(1.0,)) is not None
+    assert cache.traced_grid_list_from(key=(2.0,)) is None
+
+    cache.add(key=(4.0,), traced_grid_list=[None, np.ones((100, 2))])
+
+    assert len(cache) == 2
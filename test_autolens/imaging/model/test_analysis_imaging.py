@@ -44,6 +44,32 @@ def test__figure_of_merit__matches_correct_fit_given_galaxy_profiles(
     assert fit.log_likelihood == analysis_log_likelihood
 
 
+def test__use_fft_convolution__off_by_default_and_passed_to_fit(masked_imaging_7x7):
+    lens = al.Galaxy(redshift=0.5, light=al.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(lens=lens))
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    fit = analysis.fit_from(instance=instance)
+
+    assert fit.use_fft_convolution is False
+    assert fit.convolver is masked_imaging_7x7.convolver
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, title_prefix="prefix", use_fft_convolution=True
+    )
+
+    assert analysis.title_prefix == "prefix"
+
+    fit_fft = analysis.fit_from(instance=instance)
+
+    assert isinstance(fit_fft.convolver, al.ConvolverFFT)
+    assert fit_fft.log_likelihood == pytest.approx(fit.log_likelihood, 1.0e-8)
+
+
 def test__positions__resample__raises_exception(masked_imaging_7x7):
     model = af.Collection(
         galaxies=af.Collection(
@@ -578,6 +578,95 @@ def test__galaxy_model_image_dict(masked_imaging_7x7):
     assert (fit.galaxy_model_image_dict[g2] == np.zeros(9)).all()
 
 
+def test__galaxy_blurred_image_dict__computed_once_and_shared(masked_imaging_7x7):
+
+    g0 = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass_profile=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+    g1 = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0))
+
+    tracer = al.Tracer(galaxies=[g0, g1])
+
+    fit = al.FitImaging(dataset=masked_imaging_7x7, tracer=tracer)
+
+    galaxy_blurred_image_dict = fit.galaxy_blurred_image_dict
+
+    assert fit.galaxy_model_image_dict[g0] is galaxy_blurred_image_dict[g0]
+    assert fit.galaxy_model_image_dict[g1] is galaxy_blurred_image_dict[g1]
+    assert fit.model_images_of_planes_list is fit.model_images_of_planes_list
+    assert fit.galaxy_blurred_image_dict is galaxy_blurred_image_dict
+
+    blurred_image = tracer.blurred_image_2d_from(
+        grid=masked_imaging_7x7.grids.uniform,
+        convolver=masked_imaging_7x7.convolver,
+        blurring_grid=masked_imaging_7x7.grids.blurring,
+    )
+
+    assert fit.blurred_image == pytest.approx(blurred_image, 1.0e-8)
+
+
+def test__fit_figure_of_merit__tracer_mass_changed_in_place(masked_imaging_7x7):
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+    source = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0))
+
+    tracer = al.Tracer(galaxies=[lens, source])
+
+    fit = al.FitImaging(dataset=masked_imaging_7x7, tracer=tracer)
+
+    figure_of_merit = fit.figure_of_merit
+
+    assert tracer.traced_grid_memo is None
+
+    lens.mass.einstein_radius = 0.5
+
+    fit = al.FitImaging(dataset=masked_imaging_7x7, tracer=tracer)
+
+    fit_new_tracer = al.FitImaging(
+        dataset=masked_imaging_7x7, tracer=al.Tracer(galaxies=[lens, source])
+    )
+
+    assert fit.figure_of_merit == pytest.approx(fit_new_tracer.figure_of_merit, 1.0e-8)
+    assert fit.figure_of_merit != pytest.approx(figure_of_merit, 1.0e-4)
+
+
+def test__use_fft_convolution(masked_imaging_7x7):
+
+    g0 = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass_profile=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+    g1 = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0))
+
+    tracer = al.Tracer(galaxies=[g0, g1])
+
+    fit = al.FitImaging(dataset=masked_imaging_7x7, tracer=tracer)
+
+    fit_fft = al.FitImaging(
+        dataset=masked_imaging_7x7, tracer=tracer, use_fft_convolution=True
+    )
+
+    assert fit.convolver is masked_imaging_7x7.convolver
+    assert isinstance(fit_fft.convolver, al.ConvolverFFT)
+
+    assert fit_fft.blurred_image == pytest.approx(fit.blurred_image, 1.0e-8)
+    assert fit_fft.galaxy_blurred_image_dict[g1] == pytest.approx(
+        fit.galaxy_blurred_image_dict[g1], 1.0e-8
+    )
+    assert fit_fft.figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+    refit_fft = fit_fft.refit_with_new_preloads(preloads=al.Preloads())
+
+    assert refit_fft.use_fft_convolution is True
+    assert isinstance(refit_fft.convolver, al.ConvolverFFT)
+
+
 def test__subtracted_image_of_galaxies_dict(masked_imaging_7x7):
 
     # 2 Planes with Summed Galaxies
@@ -102,6 +102,38 @@ def test__positions__likelihood_overwrite__changes_likelihood(
     )
     assert analysis_log_likelihood == pytest.approx(-22048700567.590656, 1.0e-4)
 
+    analysis = al.AnalysisInterferometer(
+        dataset=interferometer_7,
+        positions_likelihood=positions_likelihood,
+        visibilities_chunk_size=2,
+    )
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        analysis_log_likelihood, 1.0e-8
+    )
+
+
+def test__visibilities_chunk_size__matches_log_likelihood(interferometer_7):
+    lens = al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph())
+    source = al.Galaxy(redshift=1.0, light=al.lp.SersicSph())
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = al.AnalysisInterferometer(dataset=interferometer_7)
+
+    analysis_chunked = al.AnalysisInterferometer(
+        dataset=interferometer_7, visibilities_chunk_size=3
+    )
+
+    assert analysis_chunked.log_likelihood_function(
+        instance=instance
+    ) == pytest.approx(analysis.log_likelihood_function(instance=instance), 1.0e-8)
+
+    with pytest.raises(exc.AnalysisException):
+        al.AnalysisInterferometer(dataset=interferometer_7, visibilities_chunk_size=0)
+
 
 def test__profile_log_likelihood_function(interferometer_7):
     pixelization = al.Pixelization(
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 import autolens as al
+from autolens.interferometer.galaxy_visibilities_cache import GalaxyVisibilitiesCache
 
 
 def test__model_visibilities(interferometer_7):
@@ -156,6 +157,175 @@ def test___fit_figure_of_merit__different_settings(
     assert fit.figure_of_merit == pytest.approx(-71.5177, 1.0e-4)
 
 
+def test__fit_figure_of_merit__tracer_mass_changed_in_place(interferometer_7):
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+    source = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0))
+
+    tracer = al.Tracer(galaxies=[lens, source])
+
+    fit = al.FitInterferometer(dataset=interferometer_7, tracer=tracer)
+
+    figure_of_merit = fit.figure_of_merit
+
+    assert tracer.traced_grid_memo is None
+
+    lens.mass.einstein_radius = 0.5
+
+    fit = al.FitInterferometer(dataset=interferometer_7, tracer=tracer)
+
+    fit_new_tracer = al.FitInterferometer(
+        dataset=interferometer_7, tracer=al.Tracer(galaxies=[lens, source])
+    )
+
+    assert fit.figure_of_merit == pytest.approx(fit_new_tracer.figure_of_merit, 1.0e-8)
+    assert fit.figure_of_merit != pytest.approx(figure_of_merit, 1.0e-4)
+
+
+def test__fit_figure_of_merit__galaxy_visibilities_cache__grid_offset(
+    interferometer_7,
+):
+    galaxy_visibilities_cache = GalaxyVisibilitiesCache()
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                bulge=al.lp.Sersic(intensity=1.0),
+                mass_profile=al.mp.IsothermalSph(einstein_radius=1.0),
+            ),
+            al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0)),
+        ]
+    )
+
+    for grid_offset in [(0.0, 0.0), (0.3, 0.3)] * 3:
+        dataset_model = al.DatasetModel(grid_offset=grid_offset)
+
+        fit = al.FitInterferometer(
+            dataset=interferometer_7,
+            tracer=tracer,
+            dataset_model=dataset_model,
+            galaxy_visibilities_cache=galaxy_visibilities_cache,
+        )
+
+        fit_no_cache = al.FitInterferometer(
+            dataset=interferometer_7, tracer=tracer, dataset_model=dataset_model
+        )
+
+        assert fit.figure_of_merit == pytest.approx(
+            fit_no_cache.figure_of_merit, 1.0e-8
+        )
+
+    assert galaxy_visibilities_cache.hits == 4
+
+
+def test__fit_figure_of_merit__galaxy_visibilities_cache(interferometer_7):
+    galaxy_visibilities_cache = GalaxyVisibilitiesCache()
+
+    g0 = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass_profile=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+
+    for intensity in [1.0, 2.0, 1.0, 2.0, 1.0]:
+        g1 = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=intensity))
+
+        tracer = al.Tracer(galaxies=[g0, g1])
+
+        fit = al.FitInterferometer(
+            dataset=interferometer_7,
+            tracer=tracer,
+            galaxy_visibilities_cache=galaxy_visibilities_cache,
+        )
+
+        fit_no_cache = al.FitInterferometer(dataset=interferometer_7, tracer=tracer)
+
+        assert fit.profile_visibilities == pytest.approx(
+            fit_no_cache.profile_visibilities, 1.0e-8
+        )
+        assert fit.figure_of_merit == pytest.approx(
+            fit_no_cache.figure_of_merit, 1.0e-8
+        )
+
+    assert galaxy_visibilities_cache.hits == 4
+    assert galaxy_visibilities_cache.misses == 6
+    assert len(galaxy_visibilities_cache) == 3
+
+    g0 = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass_profile=al.mp.IsothermalSph(einstein_radius=1.1),
+    )
+
+    tracer = al.Tracer(galaxies=[g0, g1])
+
+    fit = al.FitInterferometer(
+        dataset=interferometer_7,
+        tracer=tracer,
+        galaxy_visibilities_cache=galaxy_visibilities_cache,
+    )
+
+    assert fit.profile_visibilities == pytest.approx(
+        al.FitInterferometer(
+            dataset=interferometer_7, tracer=tracer
+        ).profile_visibilities,
+        1.0e-8,
+    )
+    assert galaxy_visibilities_cache.hits == 5
+    assert galaxy_visibilities_cache.misses == 7
+
+
+def test__fit_figure_of_merit__chunk_size(interferometer_7):
+    g0 = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=1.0),
+        mass_profile=al.mp.IsothermalSph(einstein_radius=1.0),
+    )
+
+    g1 = al.Galaxy(redshift=1.0, bulge=al.lp.Sersic(intensity=1.0))
+
+    tracer = al.Tracer(galaxies=[g0, g1])
+
+    fit = al.FitInterferometer(dataset=interferometer_7, tracer=tracer, chunk_size=3)
+
+    fit_no_chunks = al.FitInterferometer(dataset=interferometer_7, tracer=tracer)
+
+    assert fit.chi_squared == pytest.approx(fit_no_chunks.chi_squared, 1.0e-8)
+    assert fit.noise_normalization == pytest.approx(
+        fit_no_chunks.noise_normalization, 1.0e-8
+    )
+    assert fit.figure_of_merit == pytest.approx(fit_no_chunks.figure_of_merit, 1.0e-8)
+
+    pixelization = al.Pixelization(
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant(coefficient=1.0),
+    )
+
+    galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pixelization)
+
+    tracer = al.Tracer(galaxies=[g0, galaxy_pix])
+
+    fit = al.FitInterferometer(
+        dataset=interferometer_7,
+        tracer=tracer,
+        settings_inversion=al.SettingsInversion(use_w_tilde=False),
+        chunk_size=2,
+    )
+
+    fit_no_chunks = al.FitInterferometer(
+        dataset=interferometer_7,
+        tracer=tracer,
+        settings_inversion=al.SettingsInversion(use_w_tilde=False),
+    )
+
+    assert fit.perform_inversion is True
+    assert fit.figure_of_merit == pytest.approx(fit_no_chunks.figure_of_merit, 1.0e-8)
+
+
 def test___galaxy_model_image_dict(interferometer_7, interferometer_7_grid):
     # Normal Light Profiles Only
 
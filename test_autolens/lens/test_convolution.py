@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import convolution
+
+
+def test__support_slices_from():
+    array = np.zeros(shape=(5, 6))
+
+    assert convolution.support_slices_from(array=array) is None
+
+    array[1, 4] = 1.0
+    array[3, 2] = -2.0
+
+    assert convolution.support_slices_from(array=array) == (slice(1, 4), slice(2, 5))
+
+
+def test__convolved_image_via_support_from__same_as_convolver():
+    mask = al.Mask2D.circular(shape_native=(15, 15), pixel_scales=1.0, radius=5.0)
+
+    kernel = al.Kernel2D.no_mask(
+        values=np.arange(1.0, 16.0).reshape(5, 3), pixel_scales=1.0
+    )
+
+    convolver = al.Convolver(mask=mask, kernel=kernel)
+
+    blurring_mask = mask.derive_mask.blurring_from(kernel_shape_native=(5, 3))
+
+    image = al.Array2D(values=np.zeros(shape=mask.pixels_in_mask), mask=mask)
+    blurring_image = al.Array2D(
+        values=np.zeros(shape=blurring_mask.pixels_in_mask), mask=blurring_mask
+    )
+
+    blurred_image = convolution.convolved_image_via_support_from(
+        image=image, blurring_image=blurring_image, convolver=convolver
+    )
+
+    assert (blurred_image == np.zeros(shape=mask.pixels_in_mask)).all()
+
+    image[10] = 1.0
+    image[12] = 2.0
+    blurring_image[0] = 3.0
+
+    blurred_image = convolution.convolved_image_via_support_from(
+        image=image, blurring_image=blurring_image, convolver=convolver
+    )
+
+    assert blurred_image.mask is mask
+    assert blurred_image == pytest.approx(
+        np.asarray(
+            convolver.convolve_image(image=image, blurring_image=blurring_image)
+        ),
+        1.0e-8,
+    )
+
+    blurred_image = convolution.convolved_image_via_support_from(
+        image=image, blurring_image=blurring_image, convolver=convolver, method="fft"
+    )
+
+    assert blurred_image == pytest.approx(
+        np.asarray(
+            convolver.convolve_image(image=image, blurring_image=blurring_image)
+        ),
+        1.0e-8,
+    )
+
+
+def test__convolver_fft__convolve_image__same_as_convolver():
+    mask = al.Mask2D.circular(shape_native=(15, 15), pixel_scales=1.0, radius=5.0)
+
+    kernel = al.Kernel2D.no_mask(
+        values=np.arange(1.0, 16.0).reshape(5, 3), pixel_scales=1.0
+    )
+
+    convolver = al.Convolver(mask=mask, kernel=kernel)
+    convolver_fft = convolution.ConvolverFFT(convolver=convolver)
+
+    blurring_mask = mask.derive_mask.blurring_from(kernel_shape_native=(5, 3))
+
+    image = al.Array2D(values=np.arange(float(mask.pixels_in_mask)), mask=mask)
+    blurring_image = al.Array2D(
+        values=np.arange(float(blurring_mask.pixels_in_mask)), mask=blurring_mask
+    )
+
+    blurred_image = convolver_fft.convolve_image(
+        image=image, blurring_image=blurring_image
+    )
+
+    assert blurred_image.mask is mask
+    assert blurred_image == pytest.approx(
+        np.asarray(
+            convolver.convolve_image(image=image, blurring_image=blurring_image)
+        ),
+        1.0e-8,
+    )
+
+    blurred_image = convolver_fft.convolve_image(
+        image=0.0 * image, blurring_image=0.0 * blurring_image
+    )
+
+    assert (blurred_image == np.zeros(shape=mask.pixels_in_mask)).all()
+
+
+def test__convolver_from(masked_imaging_7x7):
+    assert convolution.convolver_from(dataset=masked_imaging_7x7) is (
+        masked_imaging_7x7.convolver
+    )
+
+    convolver_fft = convolution.convolver_from(
+        dataset=masked_imaging_7x7, use_fft=True
+    )
+
+    assert isinstance(convolver_fft, convolution.ConvolverFFT)
+    assert (
+        convolution.convolver_from(dataset=masked_imaging_7x7, use_fft=True)
+        is convolver_fft
+    )
@@ -0,0 +1,84 @@
+import numpy as np
+
+import autolens as al
+from autolens.lens import over_sampler_cache
+
+
+def test__over_sampler_from__reused_for_same_mask_and_sub_size(mask_2d_7x7):
+    sub_size = al.Array2D(
+        values=np.array([1, 2, 3, 2, 1, 2, 3, 2, 1]), mask=mask_2d_7x7
+    )
+
+    over_sampling = al.OverSamplingUniform(sub_size=sub_size)
+
+    over_sampler = over_sampler_cache.over_sampler_from(
+        over_sampling=over_sampling, mask=mask_2d_7x7
+    )
+
+    assert (
+        over_sampler_cache.over_sampler_from(
+            over_sampling=over_sampling, mask=mask_2d_7x7
+        )
+        is over_sampler
+    )
+    assert (
+        over_sampler.over_sampled_grid
+        == over_sampling.over_sampler_from(mask=mask_2d_7x7).over_sampled_grid
+    ).all()
+
+    mask = al.Mask2D(mask=np.array(mask_2d_7x7), pixel_scales=1.0)
+
+    assert (
+        over_sampler_cache.over_sampler_from(over_sampling=over_sampling, mask=mask)
+        is not over_sampler
+    )
+
+    over_sampler = over_sampler_cache.over_sampler_from(
+        over_sampling=over_sampling, mask=mask
+    )
+
+    over_sampling.sub_size = 2
+
+    assert (
+        over_sampler_cache.over_sampler_from(over_sampling=over_sampling, mask=mask)
+        is not over_sampler
+    )
+
+
+def test__tracer_over_sample__over_samplers_reused(mask_2d_7x7):
+    over_sampling_non_uniform = al.OverSamplingUniform(sub_size=4)
+
+    grid = al.Grid2D.from_mask(
+        mask=mask_2d_7x7, over_sampling=al.OverSamplingUniform(sub_size=2)
+    )
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(redshift=0.5, light=al.lp.Sersic(intensity=1.0)),
+            al.Galaxy(redshift=1.0, light=al.lp.Sersic(intensity=1.0)),
+        ]
+    )
+
+    image = tracer.image_2d_from(grid=grid)
+
+    assert (
+        image
+        == grid.over_sampler.binned_array_2d_from(
+            array=tracer.image_2d_from(grid=grid.over_sampler.over_sampled_grid)
+        )
+    ).all()
+    assert "over_sampler_cached" not in grid.over_sampling.__dict__
+
+    grid = al.Grid2D(
+        values=grid,
+        mask=mask_2d_7x7,
+        over_sampling=al.OverSamplingUniform(sub_size=2),
+        over_sampling_non_uniform=over_sampling_non_uniform,
+    )
+
+    image = tracer.image_2d_from(grid=grid)
+
+    over_sampler = over_sampling_non_uniform.__dict__["over_sampler_cached"][2]
+
+    assert (tracer.image_2d_from(grid=grid) == image).all()
+    assert over_sampling_non_uniform.__dict__["over_sampler_cached"][2] is over_sampler
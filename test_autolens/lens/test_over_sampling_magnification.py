@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import over_sampling_magnification
+
+
+def test__coarse_grid_from__same_as_grid_of_mask():
+    mask = al.Mask2D.circular(
+        shape_native=(15, 12), pixel_scales=(0.5, 0.4), radius=1.5, centre=(0.3, -0.4)
+    )
+
+    grid, slices = over_sampling_magnification.coarse_grid_from(mask=mask)
+
+    assert grid.shape_native == (
+        slices[0].stop - slices[0].start + 2,
+        slices[1].stop - slices[1].start + 2,
+    )
+
+    grid_of_mask = al.Grid2D.from_mask(
+        mask=mask, over_sampling=al.OverSamplingUniform(sub_size=1)
+    )
+
+    assert np.asarray(grid.native)[1:-1, 1:-1][
+        ~np.asarray(mask)[slices]
+    ] == pytest.approx(np.asarray(grid_of_mask), 1.0e-8)
+
+
+def test__sub_size_from__follows_magnification_list():
+    mask = al.Mask2D.circular(shape_native=(21, 21), pixel_scales=0.1, radius=1.0)
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(redshift=0.5, mass=al.mp.Isothermal(einstein_radius=0.5)),
+            al.Galaxy(redshift=1.0, light=al.lp.Sersic()),
+        ]
+    )
+
+    over_sampling = al.OverSamplingMagnification(
+        sub_size_list=(1, 2, 4), magnification_list=(2.0, 5.0)
+    )
+
+    sub_size = over_sampling.sub_size_from(tracer=tracer, mask=mask)
+
+    grid, slices = over_sampling_magnification.coarse_grid_from(mask=mask)
+
+    magnification = np.abs(
+        np.asarray(tracer.magnification_2d_from(grid=grid).native)[1:-1, 1:-1][
+            ~np.asarray(mask)[slices]
+        ]
+    )
+
+    assert (np.asarray(sub_size)[magnification < 2.0] == 1).all()
+    assert (
+        np.asarray(sub_size)[(magnification >= 2.0) & (magnification < 5.0)] == 2
+    ).all()
+    assert (np.asarray(sub_size)[magnification >= 5.0] == 4).all()
+    assert set(np.unique(np.asarray(sub_size))) == {1, 2, 4}
+
+    with pytest.raises(al.exc.GridException):
+        al.OverSamplingMagnification(
+            sub_size_list=(1, 2), magnification_list=(2.0, 5.0)
+        )
+
+
+def tracer_from(einstein_radius, centre=(0.0, 0.0), intensity=1.0):
+    return al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(centre=centre, einstein_radius=einstein_radius),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.Sersic(intensity=intensity)),
+        ]
+    )
+
+
+def test__update_from__recomputes_sub_sizes_if_mass_changes(mask_2d_7x7):
+    over_sampling = al.OverSamplingMagnification()
+
+    over_sampling.update_from(tracer=tracer_from(einstein_radius=1.0), mask=mask_2d_7x7)
+
+    assert over_sampling.total_updates == 1
+
+    over_sampling.update_from(
+        tracer=tracer_from(einstein_radius=1.0, intensity=2.0), mask=mask_2d_7x7
+    )
+
+    assert over_sampling.total_updates == 1
+
+    over_sampling.update_from(
+        tracer=tracer_from(einstein_radius=1.005), mask=mask_2d_7x7
+    )
+
+    assert over_sampling.total_updates == 2
+
+
+def test__update_from__sub_sizes_independent_of_previous_mass(mask_2d_7x7):
+    over_sampling = al.OverSamplingMagnification()
+
+    over_sampling.update_from(tracer=tracer_from(einstein_radius=1.0), mask=mask_2d_7x7)
+    over_sampling.update_from(tracer=tracer_from(einstein_radius=2.0), mask=mask_2d_7x7)
+
+    sub_size = over_sampling.sub_size
+
+    over_sampling = al.OverSamplingMagnification()
+
+    over_sampling.update_from(tracer=tracer_from(einstein_radius=2.0), mask=mask_2d_7x7)
+
+    assert (over_sampling.sub_size == sub_size).all()
+
+
+def test__update_from__mass_rtol__relative_to_every_parameter(mask_2d_7x7):
+    over_sampling = al.OverSamplingMagnification(mass_rtol=0.01)
+
+    over_sampling.update_from(
+        tracer=tracer_from(einstein_radius=1.0, centre=(0.5, 0.5)), mask=mask_2d_7x7
+    )
+    over_sampling.update_from(
+        tracer=tracer_from(einstein_radius=1.005, centre=(0.504, 0.5)),
+        mask=mask_2d_7x7,
+    )
+
+    assert over_sampling.total_updates == 1
+
+    over_sampling.update_from(
+        tracer=tracer_from(einstein_radius=1.0, centre=(0.52, 0.5)), mask=mask_2d_7x7
+    )
+
+    assert over_sampling.total_updates == 2
+
+
+def test__tracer_image_2d_from__sub_size_set_by_magnification(mask_2d_7x7):
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(redshift=0.5, mass=al.mp.Isothermal(einstein_radius=1.0)),
+            al.Galaxy(redshift=1.0, light=al.lp.Sersic()),
+        ]
+    )
+
+    over_sampling = al.OverSamplingMagnification()
+
+    image = tracer.image_2d_from(
+        grid=al.Grid2D.from_mask(mask=mask_2d_7x7, over_sampling=over_sampling)
+    )
+
+    assert over_sampling.total_updates == 1
+
+    image_uniform = tracer.image_2d_from(
+        grid=al.Grid2D.from_mask(
+            mask=mask_2d_7x7,
+            over_sampling=al.OverSamplingUniform(sub_size=over_sampling.sub_size),
+        )
+    )
+
+    assert image == pytest.approx(np.asarray(image_uniform), 1.0e-8)
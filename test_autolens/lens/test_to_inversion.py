@@ -3,6 +3,7 @@ import pytest
 from os import path
 
 import autolens as al
+from autolens.analysis.image_mesh_cache import ImageMeshCache
 
 test_path = path.join("{}".format(path.dirname(path.realpath(__file__))), "files")
 
@@ -111,6 +112,60 @@ def test__lp_linear_func_galaxy_dict_from(masked_imaging_7x7):
     assert lp_linear_func_list[2].light_profile_list[0] == lp_linear_4
 
 
+def test__lp_linear_func_galaxy_dict_from__traced_to_planes_with_linear_light_profiles(
+    masked_imaging_7x7,
+):
+    galaxy_linear = al.Galaxy(
+        redshift=0.5,
+        lp_linear=al.lp_linear.LightProfileLinear(),
+        mass=al.mp.IsothermalSph(),
+    )
+    galaxy_pix = al.Galaxy(
+        redshift=1.0,
+        pixelization=al.Pixelization(
+            mesh=al.mesh.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(),
+        ),
+    )
+
+    tracer = al.Tracer(
+        galaxies=[galaxy_linear, galaxy_pix]
+    ).copy_with_traced_grid_memo()
+
+    tracer.traced_grid_2d_list_from(
+        grid=masked_imaging_7x7.grids.uniform, plane_index_limit=0
+    )
+    tracer.traced_grid_2d_list_from(
+        grid=masked_imaging_7x7.grids.blurring, plane_index_limit=0
+    )
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7, tracer=tracer
+    )
+
+    lp_linear_func_list = list(
+        tracer_to_inversion.lp_linear_func_list_galaxy_dict.keys()
+    )
+
+    assert len(lp_linear_func_list) == 1
+    assert lp_linear_func_list[0].grid == pytest.approx(
+        masked_imaging_7x7.grids.uniform, 1.0e-4
+    )
+    assert tracer.traced_grid_memo.hits == 2
+    assert tracer.traced_grid_memo.misses == 2
+
+    tracer = al.Tracer(
+        galaxies=[al.Galaxy(redshift=0.5), galaxy_pix]
+    ).copy_with_traced_grid_memo()
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7, tracer=tracer
+    )
+
+    assert tracer_to_inversion.lp_linear_func_list_galaxy_dict == {}
+    assert tracer.traced_grid_memo.misses == 0
+
+
 def test__cls_pg_list_from(masked_imaging_7x7, grid_2d_7x7):
     mesh_0 = al.mesh.Rectangular(shape=(3, 3))
 
@@ -289,6 +344,41 @@ def test__image_plane_mesh_grid_pg_list(masked_imaging_7x7):
     assert (mesh_grids[4] == np.array([[2.0, 2.0]])).all()
 
 
+def test__image_plane_mesh_grid_pg_list__via_image_mesh_cache(masked_imaging_7x7):
+    preloads = al.Preloads(image_mesh_cache=ImageMeshCache())
+
+    image_plane_mesh_grid_list = []
+
+    for _ in range(2):
+        pixelization = al.Pixelization(
+            image_mesh=al.image_mesh.Overlay(shape=(3, 3)),
+            mesh=al.mesh.Voronoi(),
+        )
+
+        tracer = al.Tracer(
+            galaxies=[
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(redshift=1.0, pixelization=pixelization),
+            ]
+        )
+
+        tracer_to_inversion = al.TracerToInversion(
+            dataset=masked_imaging_7x7, tracer=tracer, preloads=preloads
+        )
+
+        mesh_grids = tracer_to_inversion.image_plane_mesh_grid_pg_list
+
+        assert mesh_grids[0] is None
+
+        image_plane_mesh_grid_list.append(mesh_grids[1][0])
+
+        assert isinstance(pixelization.image_mesh, al.image_mesh.Overlay)
+
+    assert image_plane_mesh_grid_list[0] is image_plane_mesh_grid_list[1]
+    assert preloads.image_mesh_cache.hits == 1
+    assert preloads.image_mesh_cache.misses == 1
+
+
 def test__traced_mesh_grid_pg_list(masked_imaging_7x7):
     # Test Multi plane
 
@@ -453,6 +543,58 @@ def test__mapper_galaxy_dict(masked_imaging_7x7):
     assert mapper_galaxy_dict[mapper_list[1]] == galaxy_pix_1
 
 
+def test__mapper_galaxy_dict__reuses_mappers_of_previous_fit(masked_imaging_7x7):
+    def tracer_from(shape, coefficient):
+        return al.Tracer(
+            galaxies=[
+                al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph(einstein_radius=1.0)),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.Pixelization(
+                        mesh=al.mesh.Rectangular(shape=shape),
+                        regularization=al.reg.Constant(coefficient=coefficient),
+                    ),
+                ),
+            ]
+        )
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7, tracer=tracer_from(shape=(3, 3), coefficient=1.0)
+    )
+
+    mapper = list(tracer_to_inversion.mapper_galaxy_dict.keys())[0]
+    mapper.mapping_matrix
+
+    assert len(tracer_to_inversion.reusable_mapper_list) == 1
+
+    preloads = al.Preloads(
+        reusable_mapper_list=tracer_to_inversion.reusable_mapper_list
+    )
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7,
+        tracer=tracer_from(shape=(3, 3), coefficient=2.0),
+        preloads=preloads,
+    )
+
+    mapper_reused = list(tracer_to_inversion.mapper_galaxy_dict.keys())[0]
+
+    assert mapper_reused is not mapper
+    assert mapper_reused.mapping_matrix is mapper.mapping_matrix
+    assert mapper_reused.regularization.coefficient == 2.0
+    assert mapper.regularization.coefficient == 1.0
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7,
+        tracer=tracer_from(shape=(4, 4), coefficient=2.0),
+        preloads=preloads,
+    )
+
+    mapper_new = list(tracer_to_inversion.mapper_galaxy_dict.keys())[0]
+
+    assert mapper_new.pixels == 16
+
+
 def test__inversion_imaging_from(grid_2d_7x7, masked_imaging_7x7):
     grids = al.GridsInterface(
         uniform=masked_imaging_7x7.grids.uniform,
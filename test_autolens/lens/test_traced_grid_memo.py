@@ -0,0 +1,70 @@
+import numpy as np
+
+import autolens as al
+from autolens.lens.traced_grid_memo import TracedGridMemo
+
+
+def test__traced_grid_list_from__equal_coordinates_and_plane_index_limit():
+    memo = TracedGridMemo()
+
+    grid = al.Grid2DIrregular([(1.0, 0.5), (0.3, -0.2)])
+    traced_grid_list = [grid, grid - 0.1, grid - 0.2]
+
+    assert memo.traced_grid_list_from(grid=grid) is None
+
+    memo.add(grid=grid, plane_index_limit=None, traced_grid_list=traced_grid_list)
+
+    assert memo.traced_grid_list_from(grid=grid) is traced_grid_list
+    assert (
+        memo.traced_grid_list_from(
+            grid=al.Grid2DIrregular([(1.0, 0.5), (0.3, -0.2)]), plane_index_limit=1
+        )
+        == traced_grid_list[:2]
+    )
+    assert memo.traced_grid_list_from(grid=grid + 1.0) is None
+
+    memo.add(
+        grid=grid + 1.0, plane_index_limit=0, traced_grid_list=traced_grid_list[:1]
+    )
+
+    assert memo.traced_grid_list_from(grid=grid + 1.0, plane_index_limit=0) == [
+        traced_grid_list[0]
+    ]
+    assert memo.traced_grid_list_from(grid=grid + 1.0) is None
+
+    assert memo.hits == 3
+    assert memo.misses == 3
+
+
+def test__add__oldest_entries_removed():
+    memo = TracedGridMemo(max_entries=2)
+
+    for value in range(3):
+        grid = np.full(shape=(2, 2), fill_value=float(value))
+        memo.add(grid=grid, plane_index_limit=None, traced_grid_list=[grid])
+
+    assert len(memo) == 2
+    assert memo.traced_grid_list_from(grid=np.zeros(shape=(2, 2))) is None
+    assert memo.traced_grid_list_from(grid=np.ones(shape=(2, 2))) is not None
+
+
+def test__run_time_dict__records_ray_tracing_and_saved_run_times():
+    run_time_dict = {}
+
+    memo = TracedGridMemo(run_time_dict=run_time_dict)
+
+    assert run_time_dict == {
+        "traced_grid_memo_ray_tracing": 0.0,
+        "traced_grid_memo_saved": 0.0,
+    }
+
+    grid = np.zeros(shape=(2, 2))
+
+    memo.add(grid=grid, plane_index_limit=None, traced_grid_list=[grid], run_time=2.0)
+
+    memo.traced_grid_list_from(grid=grid)
+    memo.traced_grid_list_from(grid=grid)
+    memo.traced_grid_list_from(grid=grid + 1.0)
+
+    assert run_time_dict["traced_grid_memo_ray_tracing"] == 2.0
+    assert run_time_dict["traced_grid_memo_saved"] == 4.0
@@ -4,6 +4,7 @@ from os import path
 
 from autoconf.dictable import from_json, output_to_json
 import autofit as af
+import autogalaxy as ag
 import autolens as al
 
 
@@ -78,6 +79,31 @@ def test__planes():
     assert tracer.planes == [[g1, g1], [g2, g2], [g3]]
 
 
+def test__planes__cached_and_invalidated():
+    g1 = al.Galaxy(redshift=1)
+    g2 = al.Galaxy(redshift=2)
+    g3 = al.Galaxy(redshift=3)
+
+    tracer = al.Tracer(galaxies=[g3, g1, g2])
+
+    assert tracer.planes is tracer.planes
+    assert tracer.plane_redshifts == [1, 2, 3]
+
+    g3.redshift = 2
+
+    assert tracer.plane_redshifts == [1, 2, 3]
+
+    tracer.invalidate_planes()
+
+    assert tracer.plane_redshifts == [1, 2]
+    assert tracer.planes == [[g1], [g2, g3]]
+
+    tracer.galaxies = [g1, g2]
+
+    assert tracer.plane_redshifts == [1, 2]
+    assert tracer.planes == [[g1], [g2]]
+
+
 def test__upper_plane_index_with_light_profile():
     g0 = al.Galaxy(redshift=0.5)
     g1 = al.Galaxy(redshift=1.0)
@@ -141,6 +167,36 @@ def test__traced_grid_2d_list_from(grid_2d_7x7, grid_2d_7x7_simple):
     assert len(traced_grid_list) == 2
 
 
+def test__traced_grid_2d_list_from__traced_grid_memo(grid_2d_7x7):
+    g0 = al.Galaxy(redshift=0.5, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
+    g1 = al.Galaxy(redshift=1.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
+    g2 = al.Galaxy(redshift=2.0)
+
+    tracer = al.Tracer(galaxies=[g0, g1, g2])
+
+    traced_grid_list = tracer.traced_grid_2d_list_from(grid=grid_2d_7x7)
+
+    tracer_memo = tracer.copy_with_traced_grid_memo()
+
+    assert tracer.traced_grid_memo is None
+
+    tracer = tracer_memo
+
+    assert tracer.traced_grid_2d_list_from(grid=grid_2d_7x7)[2] == pytest.approx(
+        traced_grid_list[2], 1.0e-8
+    )
+    assert tracer.traced_grid_2d_list_from(
+        grid=al.Grid2DIrregular(values=grid_2d_7x7), plane_index_limit=1
+    )[1] == pytest.approx(traced_grid_list[1], 1.0e-8)
+    assert tracer.traced_grid_memo.hits == 1
+    assert tracer.traced_grid_memo.misses == 1
+
+    tracer.galaxies = [g0, g2]
+
+    assert len(tracer.traced_grid_memo) == 0
+    assert len(tracer.traced_grid_2d_list_from(grid=grid_2d_7x7)) == 2
+
+
 def test__grid_2d_at_redshift_from(grid_2d_7x7):
     g0 = al.Galaxy(redshift=2.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
     g1 = al.Galaxy(redshift=2.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
@@ -605,6 +661,24 @@ def test__galaxy_image_2d_dict_from(grid_2d_7x7, mask_2d_7x7):
     assert (galaxy_image_2d_dict[g3] == np.zeros(shape=(9,))).all()
     assert galaxy_image_2d_dict[g2][0] == pytest.approx(0.5244575148617125, 1.0e-4)
 
+    g4 = al.Galaxy(redshift=2.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
+
+    tracer = al.Tracer(galaxies=[g1, g3, g4], cosmology=al.cosmo.Planck15())
+
+    galaxy_image_2d_dict = tracer.galaxy_image_2d_dict_from(grid=grid_2d_7x7)
+
+    assert (galaxy_image_2d_dict[g1] == g1_image).all()
+    assert (galaxy_image_2d_dict[g4] == np.zeros(shape=(9,))).all()
+
+    galaxy_image_2d_dict_all = tracer.galaxy_image_2d_dict_from(grid=grid_2d_7x7)
+
+    galaxy_image_2d_dict = tracer.galaxy_image_2d_dict_from(
+        grid=grid_2d_7x7, galaxy_list=[g3]
+    )
+
+    assert list(galaxy_image_2d_dict) == [g3]
+    assert (galaxy_image_2d_dict[g3] == galaxy_image_2d_dict_all[g3]).all()
+
 
 def test__convergence_2d_from(grid_2d_7x7):
     g0 = al.Galaxy(redshift=0.5, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
@@ -677,6 +751,35 @@ def test__deflections_of_planes_summed_from(grid_2d_7x7):
     assert (tracer_deflections.native[:, :, 1] == np.zeros(shape=(7, 7))).all()
 
 
+def test__hessian_from():
+    g0 = al.Galaxy(redshift=0.5, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
+    g1 = al.Galaxy(
+        redshift=0.75,
+        mass_profile=al.mp.IsothermalSph(centre=(0.1, 0.2), einstein_radius=0.5),
+    )
+    g2 = al.Galaxy(redshift=1.0)
+
+    tracer = al.Tracer(galaxies=[g0, g1, g2])
+
+    grid = al.Grid2DIrregular(values=[(1.0, 2.0), (-0.5, 0.3)])
+
+    hessian_via_four_calls = ag.OperateDeflections.hessian_from(
+        tracer, grid=grid, buffer=0.01
+    )
+
+    hessian = tracer.hessian_from(grid=grid, buffer=0.01)
+
+    for component, component_via_four_calls in zip(hessian, hessian_via_four_calls):
+        assert component == pytest.approx(np.asarray(component_via_four_calls), 1.0e-8)
+
+    magnification = tracer.magnification_2d_via_hessian_from(grid=grid)
+
+    assert magnification.in_list == pytest.approx(
+        list(1.0 / ((1.0 - hessian[3]) * (1.0 - hessian[0]) - hessian[1] * hessian[2])),
+        1.0e-8,
+    )
+
+
 def test__extract_attribute():
     tracer = al.Tracer(galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)])
 
@@ -4,6 +4,29 @@ import pytest
 import autolens as al
 
 
+def test__scaling_factor_matrix_from():
+    cosmology = al.cosmo.Planck15()
+
+    scaling_factor_matrix = al.util.tracer.scaling_factor_matrix_from(
+        redshift_list=[0.1, 1.0, 2.0, 3.0], cosmology=cosmology
+    )
+
+    assert scaling_factor_matrix.shape == (4, 4)
+    assert scaling_factor_matrix[0, 1] == pytest.approx(0.9348, 1e-4)
+    assert scaling_factor_matrix[0, 2] == pytest.approx(0.9839601, 1e-4)
+    assert scaling_factor_matrix[1, 2] == pytest.approx(0.7539734, 1e-4)
+    assert scaling_factor_matrix[0, 3] == pytest.approx(1.0, 1e-4)
+    assert scaling_factor_matrix[2, 3] == pytest.approx(1.0, 1e-4)
+    assert (np.tril(scaling_factor_matrix) == 0.0).all()
+
+    assert (
+        al.util.tracer.scaling_factor_matrix_from(
+            redshift_list=[0.1, 1.0, 2.0, 3.0], cosmology=cosmology
+        )
+        is scaling_factor_matrix
+    )
+
+
 def test__traced_grid_2d_list_from(grid_2d_7x7_simple):
     g0 = al.Galaxy(redshift=2.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
     g1 = al.Galaxy(redshift=2.0, mass_profile=al.mp.IsothermalSph(einstein_radius=1.0))
@@ -84,6 +107,49 @@ def test__traced_grid_2d_list_from(grid_2d_7x7_simple):
     assert len(traced_grid_list) == 2
 
 
+def test__traced_grid_2d_list_from__many_planes__matches_summed_deflections(
+    grid_2d_7x7,
+):
+    galaxies = [
+        al.Galaxy(
+            redshift=redshift,
+            mass=al.mp.IsothermalSph(centre=(0.1 * index, 0.0), einstein_radius=0.5),
+        )
+        for index, redshift in enumerate([0.2, 0.4, 0.5, 0.9, 1.3, 2.0])
+    ]
+
+    planes = al.util.tracer.planes_from(galaxies=galaxies)
+
+    cosmology = al.cosmo.Planck15()
+
+    traced_grid_list = al.util.tracer.traced_grid_2d_list_from(
+        planes=planes, grid=grid_2d_7x7, cosmology=cosmology
+    )
+
+    scaling_factor_matrix = al.util.tracer.scaling_factor_matrix_from(
+        redshift_list=[galaxies[0].redshift for galaxies in planes],
+        cosmology=cosmology,
+    )
+
+    deflections_list = [
+        planes[plane_index][0].deflections_yx_2d_from(
+            grid=traced_grid_list[plane_index]
+        )
+        for plane_index in range(len(planes))
+    ]
+
+    for plane_index in range(len(planes)):
+        traced_grid = np.array(grid_2d_7x7) - sum(
+            scaling_factor_matrix[previous_plane_index, plane_index]
+            * np.array(deflections_list[previous_plane_index])
+            for previous_plane_index in range(plane_index)
+        )
+
+        assert np.array(traced_grid_list[plane_index]) == pytest.approx(
+            traced_grid, 1.0e-8
+        )
+
+
 def test__grid_2d_at_redshift_from(grid_2d_7x7):
     g0 = al.Galaxy(
         redshift=0.5,
@@ -82,3 +82,33 @@ def test__multi_plane_position_solving():
     assert fit_0.model_data[0, 1] == pytest.approx(
         scaling_factor * fit_1.model_data[0, 1], 1.0e-1
     )
+
+
+def test__distance_matrix():
+    point = al.ps.Point(centre=(0.1, 0.1))
+    galaxy = al.Galaxy(redshift=1.0, point_0=point)
+    tracer = al.Tracer(galaxies=[al.Galaxy(redshift=0.5), galaxy])
+
+    data = al.Grid2DIrregular([(0.0, 0.0), (3.0, 4.0)])
+    noise_map = al.ArrayIrregular([0.5, 1.0])
+    model_data = al.Grid2DIrregular([(3.0, 1.0), (2.0, 3.0), (0.0, 0.0)])
+
+    solver = al.m.MockPointSolver(model_positions=model_data)
+
+    fit = al.AbstractFitPositionsImagePair(
+        name="point_0",
+        data=data,
+        noise_map=noise_map,
+        tracer=tracer,
+        solver=solver,
+    )
+
+    assert fit.distance_matrix == pytest.approx(
+        np.array(
+            [
+                [np.sqrt(10.0), np.sqrt(13.0), 0.0],
+                [3.0, np.sqrt(2.0), 5.0],
+            ]
+        ),
+        1.0e-4,
+    )
@@ -1,5 +1,7 @@
 from os import path
 
+import pytest
+
 import autofit as af
 import autolens as al
 
@@ -163,3 +165,100 @@ def test__figure_of_merit__includes_fit_fluxes(
         fit_positions.log_likelihood + fit_fluxes.log_likelihood
         == analysis_log_likelihood
     )
+
+
+def test__analysis_point_list__log_likelihood_is_sum_of_datasets(
+    positions_x2, positions_x2_noise_map
+):
+    grid = al.Grid2D.uniform(shape_native=(10, 10), pixel_scales=1.0)
+
+    solver = al.PointSolver.for_grid(grid=grid, pixel_scale_precision=0.001)
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(
+                    einstein_radius=1.6,
+                    ell_comps=al.convert.ell_comps_from(axis_ratio=0.9, angle=45.0),
+                ),
+            ),
+            source_0=al.Galaxy(
+                redshift=1.0, point_0=al.ps.Point(centre=(0.07, 0.07))
+            ),
+            source_1=al.Galaxy(redshift=1.0, point_1=al.ps.Point(centre=(0.0, 0.2))),
+            source_2=al.Galaxy(redshift=2.0, point_2=al.ps.Point(centre=(0.1, 0.0))),
+        )
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    dataset_list = [
+        al.PointDataset(
+            name=f"point_{index}",
+            positions=positions_x2,
+            positions_noise_map=positions_x2_noise_map,
+        )
+        for index in range(3)
+    ]
+
+    log_likelihood = sum(
+        al.AnalysisPoint(dataset=dataset, solver=solver).log_likelihood_function(
+            instance=instance
+        )
+        for dataset in dataset_list
+    )
+
+    analysis = al.AnalysisPointList(dataset_list=dataset_list, solver=solver)
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-8
+    )
+
+    analysis = al.AnalysisPointList(
+        dataset_list=dataset_list, solver=solver, number_of_threads=2
+    )
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-8
+    )
+
+    fit_list = analysis.fit_from(instance=instance)
+
+    assert [fit.dataset.name for fit in fit_list] == ["point_0", "point_1", "point_2"]
+
+
+def test__analysis_point_list__solves_once_per_source_plane(
+    positions_x2, positions_x2_noise_map
+):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=al.Galaxy(redshift=0.5),
+            source_0=al.Galaxy(redshift=1.0, point_0=al.ps.Point(centre=(0.0, 0.0))),
+            source_1=al.Galaxy(redshift=1.0, point_1=al.ps.Point(centre=(0.0, 0.0))),
+        )
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    dataset_list = [
+        al.PointDataset(
+            name=name,
+            positions=positions_x2,
+            positions_noise_map=positions_x2_noise_map,
+        )
+        for name in ["point_0", "point_1"]
+    ]
+
+    solver = al.m.MockPointSolver(model_positions=positions_x2)
+
+    analysis = al.AnalysisPointList(dataset_list=dataset_list, solver=solver)
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        2.0
+        * al.AnalysisPoint(
+            dataset=dataset_list[0], solver=solver
+        ).log_likelihood_function(instance=instance),
+        1.0e-8,
+    )
+    assert solver.total_solves == 2
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.point.deflection_cache import DeflectionCache
+
+
+def test__deflections_yx_2d_from__only_uncached_coordinates_computed():
+    mass = al.mp.IsothermalSph(einstein_radius=1.0)
+
+    traced_grids = []
+
+    def deflections_func(grid):
+        traced_grids.append(np.asarray(grid))
+        return mass.deflections_yx_2d_from(grid=grid)
+
+    cache = DeflectionCache(deflections_func=deflections_func, quantum=1.0e-8)
+
+    grid_0 = al.Grid2DIrregular([(1.0, 0.5), (0.3, -0.2)])
+    grid_1 = al.Grid2DIrregular([(0.3, -0.2), (2.0, 1.0), (2.0, 1.0)])
+
+    deflections_0 = cache.deflections_yx_2d_from(grid=grid_0)
+    deflections_1 = cache.deflections_yx_2d_from(grid=grid_1)
+
+    assert deflections_0 == pytest.approx(
+        np.asarray(mass.deflections_yx_2d_from(grid=grid_0)), 1.0e-8
+    )
+    assert deflections_1 == pytest.approx(
+        np.asarray(mass.deflections_yx_2d_from(grid=grid_1)), 1.0e-8
+    )
+
+    assert traced_grids[1].tolist() == [[2.0, 1.0]]
+
+    assert cache.misses == 3
+    assert cache.hits == 2
+    assert cache.hit_rate == pytest.approx(0.4, 1.0e-4)
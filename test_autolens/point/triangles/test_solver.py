@@ -77,3 +77,68 @@ def test_real_example(grid, tracer):
     result = solver.solve(tracer=tracer, source_plane_coordinate=(0.07, 0.07))
 
     assert len(result) == 5
+
+
+def test_solve_many__same_as_solve(grid, tracer):
+    solver = PointSolver.for_grid(
+        grid=grid,
+        pixel_scale_precision=0.001,
+    )
+
+    source_plane_coordinates = [(0.07, 0.07), (0.0, 0.3), (0.5, -0.5), (40.0, 40.0)]
+
+    result_list = solver.solve_many(
+        tracer=tracer, source_plane_coordinates=source_plane_coordinates
+    )
+
+    assert len(result_list) == 4
+
+    for source_plane_coordinate, result in zip(source_plane_coordinates, result_list):
+        expected = solver.solve(
+            tracer=tracer, source_plane_coordinate=source_plane_coordinate
+        )
+
+        assert len(result) == len(expected)
+        assert sorted(result.in_list) == pytest.approx(sorted(expected.in_list))
+
+    assert len(result_list[0]) == 5
+    assert len(result_list[3]) == 0
+
+
+def test_steps__instrumented(grid, tracer):
+    solver = PointSolver.for_grid(
+        grid=grid,
+        pixel_scale_precision=0.001,
+    )
+
+    steps = list(solver.steps(tracer=tracer, source_plane_coordinate=(0.07, 0.07)))
+
+    assert len(steps) == solver.n_steps
+
+    for step in steps:
+        assert step.deflection_evaluations + step.deflection_cache_hits == len(
+            step.initial_triangles.vertices
+        )
+        assert step.total_filtered_triangles > 0
+        assert step.run_time > 0.0
+
+    assert steps[0].deflection_cache_hits == 0
+    assert all(step.deflection_cache_hits > 0 for step in steps[1:])
+
+    assert steps[1].total_initial_triangles == steps[0].total_up_sampled_triangles
+
+
+def test_steps__no_images__exits_early(grid, tracer):
+    solver = PointSolver.for_grid(
+        grid=grid,
+        pixel_scale_precision=0.001,
+    )
+
+    steps = list(solver.steps(tracer=tracer, source_plane_coordinate=(40.0, 40.0)))
+
+    assert len(steps) == 1
+    assert steps[0].total_filtered_triangles == 0
+
+    result = solver.solve(tracer=tracer, source_plane_coordinate=(40.0, 40.0))
+
+    assert len(result) == 0